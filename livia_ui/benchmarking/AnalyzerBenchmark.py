@@ -0,0 +1,172 @@
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter, process_time
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+
+from numpy import ndarray
+
+from livia.benchmarking import LIVIA_BENCHMARK_LOGGER
+from livia.input.FrameInput import FrameInput
+from livia.output.FileFrameOutput import FileFrameOutput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia_ui.benchmarking import get_rss_bytes
+from livia_ui.benchmarking.BenchmarkPass import BenchmarkPass
+from livia_ui.benchmarking.LatencyHistogram import LatencyHistogram
+from livia_ui.benchmarking.SyntheticFrameInput import SyntheticFrameInput
+
+DEFAULT_BENCHMARK_FRAMES: int = 300
+DEFAULT_WARM_UP_FRAMES: int = 30
+
+_ENCODE_EXTENSION: str = ".avi"
+
+_Input = Union[FrameInput, SyntheticFrameInput]
+
+# Frame in flight: number, moment its decoding started and its modified frame with its analysis time (or a future)
+_FrameInFlight = Tuple[int, float, Union[Tuple[ndarray, float], Future]]
+
+
+class AnalyzerBenchmark:
+    # Runs an input through the stages of a pass for a fixed number of frames or seconds. With several threads, up to
+    # that number of frames are analyzed at the same time, but they are encoded in order, as the processors do.
+    def __init__(self, open_input: Callable[[], _Input], frame_analyzer: FrameAnalyzer, threads: int = 1,
+                 frames: Optional[int] = DEFAULT_BENCHMARK_FRAMES, seconds: Optional[float] = None,
+                 warm_up_frames: int = DEFAULT_WARM_UP_FRAMES, encode_path: Optional[str] = None):
+        if frames is None and seconds is None:
+            raise ValueError("A number of frames or seconds is required")
+
+        self._open_input: Callable[[], _Input] = open_input
+        self._analyzer: FrameAnalyzer = frame_analyzer
+        self._threads: int = max(1, threads)
+        self._frames: Optional[int] = frames
+        self._seconds: Optional[float] = seconds
+        self._warm_up_frames: int = warm_up_frames
+        self._encode_path: Optional[str] = encode_path
+
+    def run(self, benchmark_pass: BenchmarkPass) -> Dict[str, float]:
+        frame_input = self._open_input()
+        temp_dir = None
+        frame_output = None
+
+        try:
+            if benchmark_pass.encodes:
+                encode_path = self._encode_path
+                if encode_path is None:
+                    temp_dir = tempfile.mkdtemp(prefix="livia-bench-")
+                    encode_path = os.path.join(temp_dir, "output" + _ENCODE_EXTENSION)
+
+                frame_output = FileFrameOutput(encode_path, frame_input.get_fps(), *frame_input.get_frame_size())
+
+            executor = ThreadPoolExecutor(max_workers=self._threads, thread_name_prefix="livia-bench") \
+                if benchmark_pass.analyzes and self._threads > 1 else None
+            try:
+                self._process(benchmark_pass, frame_input, frame_output, executor, self._warm_up_frames, None)
+                metrics = self._process(benchmark_pass, frame_input, frame_output, executor, self._frames,
+                                        self._seconds)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+        finally:
+            frame_input.close()
+            if frame_output is not None:
+                frame_output.close()
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        LIVIA_BENCHMARK_LOGGER.info(f"bench,{benchmark_pass.value},{int(metrics['frames_count'])},"
+                                    f"{metrics['throughput_fps']:.2f},{metrics['latency_p50_msec']:.3f},"
+                                    f"{metrics['latency_p95_msec']:.3f},{metrics['latency_p99_msec']:.3f},"
+                                    f"{metrics['cpu_seconds']:.3f},{metrics.get('peak_rss_mb', 0.0):.1f}")
+
+        return metrics
+
+    def _process(self, benchmark_pass: BenchmarkPass, frame_input: _Input, frame_output: Optional[FileFrameOutput],
+                 executor: Optional[ThreadPoolExecutor], frames: Optional[int],
+                 seconds: Optional[float]) -> Dict[str, float]:
+        latency = LatencyHistogram()
+        decode = LatencyHistogram()
+        analysis = LatencyHistogram()
+        encode = LatencyHistogram()
+
+        in_flight: Deque[_FrameInFlight] = deque()
+        max_in_flight = self._threads if executor is not None else 1
+        processed = 0
+        peak_rss = get_rss_bytes()
+
+        start = perf_counter()
+        cpu_start = process_time()
+
+        def finish_frame():
+            num_frame, decode_start, result = in_flight.popleft()
+            modified, analysis_time = result.result() if isinstance(result, Future) else result
+
+            if benchmark_pass.analyzes:
+                analysis.record(analysis_time)
+
+            if frame_output is not None:
+                encode_start = perf_counter()
+                frame_output.output_frame(num_frame, modified)
+                encode.record(perf_counter() - encode_start)
+
+            latency.record(perf_counter() - decode_start)
+
+        while (frames is None or processed < frames) and (seconds is None or perf_counter() - start < seconds):
+            decode_start = perf_counter()
+            frame = frame_input.next_frame()
+            if frame is None:
+                break
+
+            num_frame = frame_input.get_current_frame_index()
+            decode.record(perf_counter() - decode_start)
+
+            if not benchmark_pass.analyzes:
+                in_flight.append((num_frame, decode_start, (frame, 0.0)))
+            elif executor is not None:
+                in_flight.append((num_frame, decode_start, executor.submit(self._analyze, num_frame, frame)))
+            else:
+                in_flight.append((num_frame, decode_start, self._analyze(num_frame, frame)))
+
+            processed += 1
+
+            # Decoding goes ahead of the analyses only as much as the threads can take
+            while len(in_flight) >= max_in_flight:
+                finish_frame()
+
+            rss = get_rss_bytes()
+            if rss is not None and (peak_rss is None or rss > peak_rss):
+                peak_rss = rss
+
+        while in_flight:
+            finish_frame()
+
+        elapsed = perf_counter() - start
+        cpu_time = process_time() - cpu_start
+        statistics = latency.get_statistics()
+
+        metrics = {
+            "frames_count": float(processed),
+            "elapsed_seconds": elapsed,
+            "throughput_fps": processed / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_msec": statistics.p50_msec,
+            "latency_p95_msec": statistics.p95_msec,
+            "latency_p99_msec": statistics.p99_msec,
+            "decode_mean_msec": decode.get_statistics().mean_msec,
+            "cpu_seconds": cpu_time,
+            "cpu_per_frame_msec": cpu_time * 1000 / processed if processed > 0 else 0.0
+        }
+        if benchmark_pass.analyzes:
+            metrics["analysis_mean_msec"] = analysis.get_statistics().mean_msec
+        if benchmark_pass.encodes:
+            metrics["encode_mean_msec"] = encode.get_statistics().mean_msec
+        if peak_rss is not None:
+            metrics["peak_rss_mb"] = peak_rss / (1024 * 1024)
+
+        return metrics
+
+    def _analyze(self, num_frame: int, frame: ndarray) -> Tuple[ndarray, float]:
+        start = perf_counter()
+        modified = self._analyzer.analyze(num_frame, frame).modify(num_frame, frame)
+
+        return modified, perf_counter() - start
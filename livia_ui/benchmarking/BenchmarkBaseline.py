@@ -0,0 +1,99 @@
+import json
+import os
+import platform
+from typing import Dict, List, Optional
+
+from livia_ui.benchmarking.BenchmarkRegression import BenchmarkRegression
+
+DEFAULT_REGRESSION_THRESHOLD: float = 0.2
+
+_FORMAT_VERSION: int = 1
+
+# Metrics with these suffixes describe the run (e.g. number of frames), so they are not compared
+_DESCRIPTIVE_SUFFIXES: List[str] = ["_count"]
+
+# Metrics with these suffixes are better when higher, the rest (times, sizes, drops) are better when lower
+_HIGHER_IS_BETTER_SUFFIXES: List[str] = ["_fps"]
+
+# Changes below these absolute values are measurement noise, whatever the relative change is
+_NOISE_FLOORS: Dict[str, float] = {
+    "_fps": 1.0,
+    "_msec": 0.5,
+    "_mb": 8.0,
+    "_percent": 2.0
+}
+
+
+class BenchmarkBaseline:
+    # Benchmark results by case and metric, stored as JSON so results of different runs (or machines) can be compared
+    def __init__(self, results: Dict[str, Dict[str, float]], environment: Optional[Dict[str, str]] = None):
+        self._results: Dict[str, Dict[str, float]] = results
+        self._environment: Dict[str, str] = environment if environment is not None \
+            else BenchmarkBaseline.describe_environment()
+
+    @staticmethod
+    def describe_environment() -> Dict[str, str]:
+        return {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "cpus": str(os.cpu_count())
+        }
+
+    @staticmethod
+    def load(path: str) -> "BenchmarkBaseline":
+        with open(path, "r") as file:
+            data = json.load(file)
+
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported benchmark results version: {data.get('version')}")
+
+        return BenchmarkBaseline(data["results"], data.get("environment", {}))
+
+    @property
+    def results(self) -> Dict[str, Dict[str, float]]:
+        return self._results
+
+    @property
+    def environment(self) -> Dict[str, str]:
+        return self._environment
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2, sort_keys=True)
+
+    def to_dict(self) -> Dict:
+        return {"version": _FORMAT_VERSION, "environment": self._environment, "results": self._results}
+
+    def compare(self, current: "BenchmarkBaseline",
+                threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[BenchmarkRegression]:
+        # Only cases and metrics measured in both runs are compared, so suites can grow without invalidating baselines
+        regressions = []
+
+        for case, metrics in current.results.items():
+            baseline_metrics = self._results.get(case, {})
+
+            for metric, value in metrics.items():
+                baseline = baseline_metrics.get(metric)
+                if baseline is None or any(metric.endswith(suffix) for suffix in _DESCRIPTIVE_SUFFIXES):
+                    continue
+
+                regression = BenchmarkRegression(case, metric, baseline, value,
+                                                 BenchmarkBaseline.is_higher_better(metric))
+                if regression.worsening > BenchmarkBaseline._noise_floor(metric) \
+                        and regression.worsening > abs(baseline) * threshold:
+                    regressions.append(regression)
+
+        return regressions
+
+    @staticmethod
+    def is_higher_better(metric: str) -> bool:
+        return any(metric.endswith(suffix) for suffix in _HIGHER_IS_BETTER_SUFFIXES)
+
+    @staticmethod
+    def _noise_floor(metric: str) -> float:
+        for suffix, floor in _NOISE_FLOORS.items():
+            if metric.endswith(suffix):
+                return floor
+
+        return 0.0
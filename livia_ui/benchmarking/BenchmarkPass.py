@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class BenchmarkPass(Enum):
+    # Each pass adds a stage to the previous one, so the cost of a stage is the difference between two passes
+    DECODE = "decode"
+    ANALYZE = "decode+analyze"
+    ENCODE = "decode+analyze+encode"
+
+    @property
+    def analyzes(self) -> bool:
+        return self != BenchmarkPass.DECODE
+
+    @property
+    def encodes(self) -> bool:
+        return self == BenchmarkPass.ENCODE
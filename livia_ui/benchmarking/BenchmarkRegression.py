@@ -0,0 +1,36 @@
+class BenchmarkRegression:
+    def __init__(self, case: str, metric: str, baseline: float, current: float, higher_is_better: bool):
+        self._case: str = case
+        self._metric: str = metric
+        self._baseline: float = baseline
+        self._current: float = current
+        self._higher_is_better: bool = higher_is_better
+
+    @property
+    def case(self) -> str:
+        return self._case
+
+    @property
+    def metric(self) -> str:
+        return self._metric
+
+    @property
+    def baseline(self) -> float:
+        return self._baseline
+
+    @property
+    def current(self) -> float:
+        return self._current
+
+    @property
+    def worsening(self) -> float:
+        # How much worse the current value is, in the units of the metric (negative if it improved)
+        return self._baseline - self._current if self._higher_is_better else self._current - self._baseline
+
+    @property
+    def relative_change(self) -> float:
+        return (self._current - self._baseline) / abs(self._baseline) if self._baseline else float("inf")
+
+    def __repr__(self) -> str:
+        return f"{self._case} {self._metric}: {self._baseline:.3f} -> {self._current:.3f} " \
+               f"({self.relative_change * 100:+.1f}%)"
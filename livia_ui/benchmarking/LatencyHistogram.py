@@ -0,0 +1,81 @@
+from math import log
+from threading import Lock
+from typing import List
+
+from livia_ui.benchmarking.LatencyStatistics import LatencyStatistics
+
+_MIN_LATENCY: float = 1e-6
+_MAX_LATENCY: float = 100.0
+
+# Relative width of the buckets, which bounds the error of the percentiles
+_PRECISION: float = 0.02
+
+_LOG_BASE: float = log(1 + _PRECISION)
+_NUM_BUCKETS: int = int(log(_MAX_LATENCY / _MIN_LATENCY) / _LOG_BASE) + 2
+
+
+class LatencyHistogram:
+    # Histogram of logarithmic buckets: recording a value takes constant time and memory, and percentiles are
+    # estimated with a relative error below the bucket precision
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._buckets: List[int] = [0] * _NUM_BUCKETS
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, seconds: float):
+        if seconds <= _MIN_LATENCY:
+            index = 0
+        else:
+            index = min(_NUM_BUCKETS - 1, int(log(seconds / _MIN_LATENCY) / _LOG_BASE) + 1)
+
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    def percentile(self, percentile: float) -> float:
+        with self._lock:
+            return self._percentile(list(self._buckets), self._count, self._max, percentile)
+
+    def get_statistics(self) -> LatencyStatistics:
+        with self._lock:
+            buckets, count, total, maximum = list(self._buckets), self._count, self._sum, self._max
+
+        if count == 0:
+            return LatencyStatistics(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        return LatencyStatistics(count, total * 1000 / count,
+                                 LatencyHistogram._percentile(buckets, count, maximum, 50) * 1000,
+                                 LatencyHistogram._percentile(buckets, count, maximum, 95) * 1000,
+                                 LatencyHistogram._percentile(buckets, count, maximum, 99) * 1000,
+                                 maximum * 1000)
+
+    def reset(self):
+        with self._lock:
+            self._buckets = [0] * _NUM_BUCKETS
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+
+    @staticmethod
+    def _percentile(buckets: List[int], count: int, maximum: float, percentile: float) -> float:
+        if count == 0:
+            return 0.0
+
+        rank = percentile / 100 * count
+        accumulated = 0
+        for index, bucket_count in enumerate(buckets):
+            accumulated += bucket_count
+            if accumulated >= rank and bucket_count > 0:
+                # Upper bound of the bucket, which never exceeds the largest value recorded
+                return min(maximum, _MIN_LATENCY * (1 + _PRECISION) ** index)
+
+        return maximum
@@ -0,0 +1,38 @@
+class LatencyStatistics:
+    def __init__(self, count: int, mean_msec: float, p50_msec: float, p95_msec: float, p99_msec: float,
+                 max_msec: float):
+        self._count: int = count
+        self._mean_msec: float = mean_msec
+        self._p50_msec: float = p50_msec
+        self._p95_msec: float = p95_msec
+        self._p99_msec: float = p99_msec
+        self._max_msec: float = max_msec
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_msec(self) -> float:
+        return self._mean_msec
+
+    @property
+    def p50_msec(self) -> float:
+        return self._p50_msec
+
+    @property
+    def p95_msec(self) -> float:
+        return self._p95_msec
+
+    @property
+    def p99_msec(self) -> float:
+        return self._p99_msec
+
+    @property
+    def max_msec(self) -> float:
+        return self._max_msec
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self._count}, mean={self._mean_msec:.2f}ms, " \
+               f"p50={self._p50_msec:.2f}ms, p95={self._p95_msec:.2f}ms, p99={self._p99_msec:.2f}ms, " \
+               f"max={self._max_msec:.2f}ms)"
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional
+
+from livia.benchmarking import LIVIA_BENCHMARK_LOGGER
+from livia_ui.benchmarking.LatencyHistogram import LatencyHistogram
+from livia_ui.benchmarking.LatencyStatistics import LatencyStatistics
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+
+DEFAULT_MAX_TRACKED_FRAMES: int = 256
+
+
+class _FrameTimes:
+    def __init__(self, start: float):
+        self.start: float = start
+        self.checkpoint: float = start
+
+
+class PipelineLatencyTracker:
+    # Frames are identified by their number. The start time and the time of the last stage finished are kept for the
+    # frames in flight, so each stage can measure the time since the previous one without passing timestamps along.
+    def __init__(self, enabled: bool = True, max_tracked_frames: int = DEFAULT_MAX_TRACKED_FRAMES):
+        self._enabled: bool = enabled
+        self._max_tracked_frames: int = max_tracked_frames
+
+        self._histograms: Dict[PipelineStage, LatencyHistogram] = {stage: LatencyHistogram() for stage in PipelineStage}
+
+        self._frames_lock: Lock = Lock()
+        self._frames: "OrderedDict[int, _FrameTimes]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        self._enabled = enabled
+
+    def record(self, stage: PipelineStage, seconds: float):
+        if self._enabled:
+            self._histograms[stage].record(seconds)
+
+    def frame_started(self, num_frame: int, timestamp: float):
+        if not self._enabled:
+            return
+
+        with self._frames_lock:
+            # Frame numbers are repeated when the input is restarted or seeked, so the new frame replaces the old one
+            self._frames[num_frame] = _FrameTimes(timestamp)
+            self._frames.move_to_end(num_frame)
+
+            # Frames that never reach the display (e.g. dropped) are forgotten
+            while len(self._frames) > self._max_tracked_frames:
+                self._frames.popitem(last=False)
+
+    def frame_reached(self, num_frame: int, stage: PipelineStage, timestamp: float):
+        # Records the time since the last stage of the frame finished
+        if not self._enabled:
+            return
+
+        with self._frames_lock:
+            times = self._frames.get(num_frame)
+            if times is None:
+                return
+
+            elapsed = timestamp - times.checkpoint
+            times.checkpoint = timestamp
+
+        self._histograms[stage].record(max(0.0, elapsed))
+
+    def frame_checkpoint(self, num_frame: int, timestamp: float):
+        if not self._enabled:
+            return
+
+        with self._frames_lock:
+            times = self._frames.get(num_frame)
+            if times is not None:
+                times.checkpoint = timestamp
+
+    def frame_finished(self, num_frame: int, timestamp: float):
+        if not self._enabled:
+            return
+
+        with self._frames_lock:
+            times = self._frames.pop(num_frame, None)
+
+        if times is not None:
+            self._histograms[PipelineStage.END_TO_END].record(max(0.0, timestamp - times.start))
+
+    def get_statistics(self, stage: Optional[PipelineStage] = None) -> Dict[PipelineStage, LatencyStatistics]:
+        stages = list(PipelineStage) if stage is None else [stage]
+
+        return {stage: self._histograms[stage].get_statistics() for stage in stages}
+
+    def reset(self):
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+        with self._frames_lock:
+            self._frames.clear()
+
+    def dump(self) -> str:
+        lines: List[str] = [f"{'Stage':<14} {'Count':>8} {'Mean (ms)':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+                            f"{'p99 (ms)':>10} {'Max (ms)':>10}"]
+        for stage, statistics in self.get_statistics().items():
+            lines.append(f"{stage.value:<14} {statistics.count:>8} {statistics.mean_msec:>10.2f} "
+                         f"{statistics.p50_msec:>10.2f} {statistics.p95_msec:>10.2f} {statistics.p99_msec:>10.2f} "
+                         f"{statistics.max_msec:>10.2f}")
+
+        return "\n".join(lines)
+
+    def log(self):
+        for stage, statistics in self.get_statistics().items():
+            if statistics.count > 0:
+                LIVIA_BENCHMARK_LOGGER.info(f"latency,{stage.value},{statistics.count},{statistics.mean_msec:.3f},"
+                                            f"{statistics.p50_msec:.3f},{statistics.p95_msec:.3f},"
+                                            f"{statistics.p99_msec:.3f},{statistics.max_msec:.3f}")
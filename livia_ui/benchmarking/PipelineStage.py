@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class PipelineStage(Enum):
+    # Stages are timed from the moment the frame reaches the live analyzer, as frames are read inside the processor
+    ANALYSIS = "analysis"
+    MODIFICATION = "modification"
+    OUTPUT = "output"
+    QUEUE = "queue"
+    SCALING = "scaling"
+    CONVERSION = "conversion"
+    PRESENTATION = "presentation"
+    PAINT = "paint"
+    END_TO_END = "end_to_end"
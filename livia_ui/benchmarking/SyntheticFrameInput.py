@@ -0,0 +1,44 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+_DISTINCT_FRAMES: int = 8
+
+
+class SyntheticFrameInput:
+    # Provides the frame input methods used by the benchmarks with random frames, so analyzers can be measured
+    # without a video of the wanted resolution. Frames are copied when read, as a decoder allocates each frame.
+    def __init__(self, width: int, height: int, fps: float = 30.0, length_in_frames: Optional[int] = None):
+        self._width: int = width
+        self._height: int = height
+        self._fps: float = fps
+        self._length_in_frames: Optional[int] = length_in_frames
+
+        self._frames: List[ndarray] = list(np.random.randint(0, 256, (_DISTINCT_FRAMES, height, width, 3),
+                                                             dtype=np.uint8))
+        self._current_frame: int = -1
+        self._closed: bool = False
+
+    def next_frame(self) -> Optional[ndarray]:
+        if self._closed or (self._length_in_frames is not None and self._current_frame + 1 >= self._length_in_frames):
+            return None
+
+        self._current_frame += 1
+
+        return self._frames[self._current_frame % len(self._frames)].copy()
+
+    def get_current_frame_index(self) -> int:
+        return self._current_frame
+
+    def get_current_msec(self) -> int:
+        return int(max(0, self._current_frame) * 1000 / self._fps)
+
+    def get_fps(self) -> float:
+        return self._fps
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        return self._width, self._height
+
+    def close(self):
+        self._closed = True
@@ -0,0 +1,13 @@
+import os
+from typing import Optional
+
+_PAGE_SIZE: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def get_rss_bytes() -> Optional[int]:
+    # Resident set size of the current process, or None if it can not be known in this platform
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
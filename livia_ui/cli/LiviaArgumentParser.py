@@ -6,6 +6,7 @@ from livia import LIVIA_LOGGER
 from livia.benchmarking import LIVIA_BENCHMARK_LOGGER
 from livia_ui.cli import LIVIA_CLI_LOGGER
 from livia_ui.cli.command.ArgumentsCommand import ArgumentsCommand
+from livia_ui.cli.command.BenchArgumentsCommand import BenchArgumentsCommand
 from livia_ui.cli.command.CommandArgumentParser import CommandArgumentParser
 from livia_ui.cli.command.InfoArgumentsCommand import InfoArgumentsCommand
 from livia_ui.cli.command.ProcessArgumentsCommand import ProcessArgumentsCommand
@@ -65,7 +66,8 @@ class LiviaArgumentParser(CommandArgumentParser):
     def _build_commands(self) -> List[ArgumentsCommand]:
         return [
             InfoArgumentsCommand(),
-            ProcessArgumentsCommand()
+            ProcessArgumentsCommand(),
+            BenchArgumentsCommand()
         ]
 
     def _configure_logs(self, args: Namespace) -> None:
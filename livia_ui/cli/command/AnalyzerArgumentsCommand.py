@@ -0,0 +1,186 @@
+import logging
+from abc import ABC
+from argparse import FileType, Namespace
+from functools import reduce
+from io import TextIOBase
+from typing import Any, Dict, Optional, List, Tuple
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerMetadata
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia_ui.cli import LIVIA_CLI_LOGGER
+from livia_ui.cli.command.ArgumentsCommand import ArgumentsCommand
+from livia_ui.cli.command.converters.ValueConverterFactory import ValueConverterFactory
+from livia_ui.process.analyzer import build_process_frame_analyzer
+from livia_ui.process.analyzer.AnalyzerBackend import AnalyzerBackend
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+
+
+class AnalyzerArgumentsCommand(ArgumentsCommand, ABC):
+    # Commands configuring a chain of analyzers from the command line, with an option group for each analyzer
+    def __init__(self, id: str, help: str):
+        super().__init__(id, help)
+
+        self.__value_converter_factory: ValueConverterFactory = ValueConverterFactory()
+
+    def _add_analyzer_arguments(self, subparser):
+        subparser.add_argument("--analyzer-backend", dest="analyzer_backend", type=str,
+                               choices=[backend.value for backend in AnalyzerBackend],
+                               default=AnalyzerBackend.THREAD.value,
+                               help="Backend running the analyzers. The process backend runs them in worker processes, "
+                                    "isolating the command from analyzer crashes. Analyzer log files are not used "
+                                    "with this backend, which requires Python 3.8 or newer")
+        subparser.add_argument("--analyzer-workers", dest="analyzer_workers", type=int, default=1,
+                               help="Number of worker processes used by the process analyzer backend")
+
+        for analyzer in FrameAnalyzerManager.list_analyzers():
+            group = subparser.add_argument_group("Analyzer " + analyzer.name)
+
+            short_prefix = f"-an-{analyzer.id}-"
+            long_prefix = f"--analyzer-{analyzer.id}-"
+
+            group.add_argument(short_prefix + "order", long_prefix + "order", type=int, required=False,
+                               help="Priority order of the analyzer")
+
+            group.add_argument(short_prefix + "log-file", long_prefix + "log-file",
+                               type=FileType("a", encoding="UTF-8"), required=False,
+                               help="File to log analyzer messages to. \
+                               If not specified, logging for this analyzer will be disabled")
+
+            group.add_argument(short_prefix + "log-level", long_prefix + "log-level",
+                               required=False, default="INFO",
+                               help="Output log level name for the logger associated to the analyzer. \
+                               If not specified, any records for the INFO level or above will be logged. \
+                               Custom levels can be used with the help of the logging.addLevelName Python \
+                               function")
+
+            group.add_argument(short_prefix + "log-format", long_prefix + "log-format",
+                               required=False, default="%(message)s",
+                               help="Output format for the log records generated by the analyzer. \
+                               If not specified, a basic, message only format will be used for log records. \
+                               Analyzers may log records with custom fields, allowing them to be formatted \
+                               independently from other fields according to the provided log format. \
+                               For more information, check out Python's logging formatter documentation at \
+                               https://docs.python.org/3/library/logging.html#logging.Formatter")
+
+            for prop in analyzer.properties:
+                group.add_argument(short_prefix + prop.id, long_prefix + prop.id, help=prop.prop.__doc__,
+                                   required=False)
+
+    def _build_frame_analyzer(self, args: Namespace) -> FrameAnalyzer:
+        if AnalyzerBackend(args.analyzer_backend) == AnalyzerBackend.PROCESS:
+            return self._build_process_analyzer(args)
+        else:
+            return self._build_analyzer(args)
+
+    def _build_analyzer(self, args):
+        analyzers: List[(int, FrameAnalyzerMetadata)] = []
+
+        for analyzer_metadata in FrameAnalyzerManager.list_analyzers():
+            analyzer_args, order, log_args = self._extract_args_for_analyzer(args, analyzer_metadata)
+
+            if analyzer_args is not None:
+                analyzer = analyzer_metadata.analyzer_class()
+
+                for prop_id, value in self._convert_analyzer_args(analyzer_metadata, analyzer_args).items():
+                    analyzer_metadata.get_property_by_id(prop_id).set_value(analyzer, value)
+
+                if log_args is not None:
+                    log_file, log_level, log_format = log_args
+
+                    logger = FrameAnalyzerManager.get_logger_for(analyzer)
+                    logger.setLevel(log_level)
+                    handler = logging.StreamHandler(log_file)
+                    handler.setFormatter(logging.Formatter(log_format))
+                    logger.addHandler(handler)
+
+                analyzers.append((order, analyzer))
+
+        if analyzers:
+            analyzers.sort(key=lambda item: item[0], reverse=True)
+
+            def add_child(a1, a2):
+                a1.child = a2
+                return a1
+
+            analyzer = reduce(add_child, [analyzer_order[1] for analyzer_order in analyzers])
+        else:
+            analyzer = NoChangeFrameAnalyzer()
+
+        return analyzer
+
+    def _build_process_analyzer(self, args: Namespace) -> FrameAnalyzer:
+        spec = self._build_analyzer_spec(args)
+
+        if spec is None:
+            return NoChangeFrameAnalyzer()
+
+        return build_process_frame_analyzer(spec, args.analyzer_workers)
+
+    def _build_analyzer_spec(self, args: Namespace) -> Optional[FrameAnalyzerSpec]:
+        # Analyzers built in other processes can not use the log files, which are configured in this one
+        specs: List[Tuple[int, FrameAnalyzerSpec]] = []
+
+        for analyzer_metadata in FrameAnalyzerManager.list_analyzers():
+            analyzer_args, order, log_args = self._extract_args_for_analyzer(args, analyzer_metadata)
+
+            if analyzer_args is not None:
+                if log_args is not None:
+                    LIVIA_CLI_LOGGER.warning(f"Log file of analyzer {analyzer_metadata.name} is ignored by "
+                                             f"analyzers running in other processes")
+
+                values = self._convert_analyzer_args(analyzer_metadata, analyzer_args)
+                specs.append((order, FrameAnalyzerSpec(analyzer_metadata.analyzer_class, analyzer_metadata.id, values)))
+
+        if not specs:
+            return None
+
+        specs.sort(key=lambda item: item[0], reverse=True)
+
+        def add_child(s1, s2):
+            s1.child = s2
+            return s1
+
+        return reduce(add_child, [spec_order[1] for spec_order in specs])
+
+    def _convert_analyzer_args(self, analyzer_metadata: FrameAnalyzerMetadata,
+                               analyzer_args: Namespace) -> Dict[str, Any]:
+        values = {}
+
+        for prop_id, value in analyzer_args.__dict__.items():
+            prop = analyzer_metadata.get_property_by_id(prop_id)
+            if prop is not None:
+                try:
+                    converter = self.__value_converter_factory.get_converter(prop.prop_type)
+                    values[prop_id] = converter.convert(value)
+                except ValueError:
+                    values[prop_id] = value
+
+        return values
+
+    @staticmethod
+    def _extract_args_for_analyzer(args: Namespace, analyzer: FrameAnalyzerMetadata) -> \
+            Tuple[Optional[Namespace], Optional[int], Optional[Tuple[TextIOBase, str, str]]]:
+        def arg(arg_id):
+            return f"analyzer_{analyzer.id}_{arg_id}".replace("-", "_")
+
+        order = getattr(args, arg("order"))
+        log_file = getattr(args, arg("log_file"))
+        log_level = getattr(args, arg("log_level"))
+        log_format = getattr(args, arg("log_format"))
+
+        if order is None:
+            return None, None, None
+        else:
+            analyzer_args = Namespace()
+
+            for prop in analyzer.properties:
+                arg_value = getattr(args, arg(prop.id))
+                if arg_value is not None:
+                    setattr(analyzer_args, prop.id, arg_value)
+
+            if log_file is not None:
+                return analyzer_args, order, (log_file, log_level, log_format)
+            else:
+                return analyzer_args, order, None
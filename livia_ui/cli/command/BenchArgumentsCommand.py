@@ -0,0 +1,123 @@
+import json
+import sys
+from argparse import FileType, Namespace
+from typing import Dict, List, Tuple
+
+from livia.input.FileFrameInput import FileFrameInput
+from livia_ui.benchmarking.AnalyzerBenchmark import AnalyzerBenchmark, DEFAULT_BENCHMARK_FRAMES, \
+    DEFAULT_WARM_UP_FRAMES
+from livia_ui.benchmarking.BenchmarkBaseline import BenchmarkBaseline, DEFAULT_REGRESSION_THRESHOLD
+from livia_ui.benchmarking.BenchmarkPass import BenchmarkPass
+from livia_ui.benchmarking.SyntheticFrameInput import SyntheticFrameInput
+from livia_ui.cli import LIVIA_CLI_LOGGER
+from livia_ui.cli.command.AnalyzerArgumentsCommand import AnalyzerArgumentsCommand
+from livia_ui.process.analyzer import close_frame_analyzer
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def _parse_passes(value: str) -> List[BenchmarkPass]:
+    return [BenchmarkPass(item.strip()) for item in value.split(",") if item.strip()]
+
+
+class BenchArgumentsCommand(AnalyzerArgumentsCommand):
+    def __init__(self):
+        super().__init__("bench", "Analyzer throughput benchmark")
+
+    def _build_subparser(self, subparser):
+        input_group = subparser.add_mutually_exclusive_group(required=True)
+        input_group.add_argument("-in", "--input", dest="input", type=FileType("r"),
+                                 help="Video input file")
+        input_group.add_argument("--synthetic", dest="synthetic", type=_parse_size,
+                                 help="Uses random frames of the given size (WIDTHxHEIGHT) instead of a video")
+        subparser.add_argument("--synthetic-fps", dest="synthetic_fps", type=float, default=30.0,
+                               help="Frame rate of the synthetic input, used when encoding")
+
+        subparser.add_argument("--passes", dest="passes", type=_parse_passes, default=list(BenchmarkPass),
+                               help="Comma separated passes to run: "
+                                    f"{', '.join(benchmark_pass.value for benchmark_pass in BenchmarkPass)}")
+        subparser.add_argument("--frames", dest="frames", type=int, default=None,
+                               help=f"Frames measured in each pass (by default, {DEFAULT_BENCHMARK_FRAMES} unless "
+                                    f"--seconds is given)")
+        subparser.add_argument("--seconds", dest="seconds", type=float, default=None,
+                               help="Seconds measured in each pass")
+        subparser.add_argument("--warm-up", dest="warm_up", type=int, default=DEFAULT_WARM_UP_FRAMES,
+                               help="Frames processed before measuring each pass")
+        subparser.add_argument("--threads", dest="threads", type=int, default=1,
+                               help="Number of frames analyzed at the same time")
+        subparser.add_argument("--encode-output", dest="encode_output", type=str, default=None,
+                               help="Video file written by the encoding pass. A temporary file is used by default")
+
+        subparser.add_argument("--format", dest="format", type=str, choices=["table", "json"], default="table",
+                               help="Format of the results")
+        subparser.add_argument("--output", dest="output", type=FileType("w"), default=None,
+                               help="File the results are written to, instead of the standard output")
+        subparser.add_argument("--baseline", dest="baseline", type=str, default=None,
+                               help="JSON results of a previous run to compare with. The exit code is 1 if a metric "
+                                    "regresses")
+        subparser.add_argument("--threshold", dest="threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                               help="Relative change of a metric considered a regression")
+
+        self._add_analyzer_arguments(subparser)
+
+    def execute_command(self, args: Namespace):
+        analyzer = self._build_frame_analyzer(args)
+
+        if args.input is not None:
+            input_name = args.input.name
+
+            def open_input():
+                return FileFrameInput(input_name, 0)
+        else:
+            width, height = args.synthetic
+            input_name = f"synthetic {width}x{height}"
+
+            def open_input():
+                return SyntheticFrameInput(width, height, args.synthetic_fps)
+
+        frames = args.frames if args.frames is not None or args.seconds is not None else DEFAULT_BENCHMARK_FRAMES
+        benchmark = AnalyzerBenchmark(open_input, analyzer, args.threads, frames, args.seconds, args.warm_up,
+                                      args.encode_output)
+
+        results: Dict[str, Dict[str, float]] = {}
+        try:
+            for benchmark_pass in args.passes:
+                LIVIA_CLI_LOGGER.info(f"Benchmarking {benchmark_pass.value} of {input_name}")
+                results[benchmark_pass.value] = benchmark.run(benchmark_pass)
+        finally:
+            close_frame_analyzer(analyzer)
+
+        current = BenchmarkBaseline(results)
+        output = args.output if args.output is not None else sys.stdout
+
+        if args.format == "json":
+            json.dump(current.to_dict(), output, indent=2, sort_keys=True)
+            output.write("\n")
+        else:
+            BenchArgumentsCommand._print_table(results, output)
+
+        if args.output is not None:
+            args.output.close()
+
+        if args.baseline is not None:
+            regressions = BenchmarkBaseline.load(args.baseline).compare(current, args.threshold)
+            for regression in regressions:
+                print(f"Regression: {regression}", file=sys.stderr)
+
+            if regressions:
+                sys.exit(1)
+
+    @staticmethod
+    def _print_table(results: Dict[str, Dict[str, float]], output):
+        print(f"{'Pass':<24} {'Frames':>7} {'FPS':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+              f"{'CPU (s)':>8} {'CPU/frame (ms)':>14} {'Peak RSS (MB)':>13}", file=output)
+
+        for name, metrics in results.items():
+            peak_rss = f"{metrics['peak_rss_mb']:.1f}" if "peak_rss_mb" in metrics else "-"
+            print(f"{name:<24} {int(metrics['frames_count']):>7} {metrics['throughput_fps']:>8.2f} "
+                  f"{metrics['latency_p50_msec']:>9.2f} {metrics['latency_p95_msec']:>9.2f} "
+                  f"{metrics['latency_p99_msec']:>9.2f} {metrics['cpu_seconds']:>8.2f} "
+                  f"{metrics['cpu_per_frame_msec']:>14.2f} {peak_rss:>13}", file=output)
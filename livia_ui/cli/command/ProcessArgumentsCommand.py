@@ -1,20 +1,26 @@
-import logging
-from argparse import FileType, Namespace
-from functools import reduce
-from io import TextIOBase
-from typing import Optional, List, Tuple
+import os
+import sys
+from argparse import Namespace
+from typing import List
 
+from livia.benchmarking import LIVIA_BENCHMARK_LOGGER
 from livia.input.FileFrameInput import FileFrameInput
 from livia.output.FileFrameOutput import FileFrameOutput
 from livia.process.analyzer.AnalyzerFrameProcessor import AnalyzerFrameProcessor
-from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
-from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerMetadata
-from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
 from livia.process.listener.ProcessChangeListener import ProcessChangeListener
 from livia_ui.cli import LIVIA_CLI_LOGGER
-from livia_ui.cli.command.ArgumentsCommand import ArgumentsCommand
-from livia_ui.cli.command.converters.ValueConverterFactory import ValueConverterFactory
+from livia_ui.cli.command.AnalyzerArgumentsCommand import AnalyzerArgumentsCommand
+from livia_ui.process.analyzer import supports_batch_analysis
+from livia_ui.process.analyzer.AnalyzerBackend import AnalyzerBackend
+from livia_ui.process.analyzer.BatchAnalyzerFrameProcessor import BatchAnalyzerFrameProcessor
+from livia_ui.process.analyzer.PipelinedFrameProcessor import PipelinedFrameProcessor, DEFAULT_QUEUE_SIZE
+from livia_ui.process.checkpoint.ResumableVideoProcessor import ResumableVideoProcessor, DEFAULT_CHECKPOINT_INTERVAL
+from livia_ui.process.chunk.ChunkedVideoProcessor import ChunkedVideoProcessor
+from livia_ui.process.detections.DetectionsWriter import DetectionsWriter
+from livia_ui.process.files.VideoFileStatus import VideoFileStatus
+from livia_ui.process.files.VideoFilesProcessor import VideoFilesProcessor, DEFAULT_OUTPUT_TEMPLATE
 
 
 class ProcessorListener(ProcessChangeListener):
@@ -28,128 +34,279 @@ class ProcessorListener(ProcessChangeListener):
         LIVIA_CLI_LOGGER.info(f"Video analysis finished")
 
 
-class ProcessArgumentsCommand(ArgumentsCommand):
+class ProcessArgumentsCommand(AnalyzerArgumentsCommand):
     def __init__(self):
         super().__init__("process", "Video processing")
 
-        self.__value_converter_factory: ValueConverterFactory = ValueConverterFactory()
-
     def _build_subparser(self, subparser):
-        subparser.add_argument("-in", "--input", dest="input", type=FileType("r"), required=True,
-                               help="Video input file")
-        subparser.add_argument("-out", "--output", dest="output", type=FileType("w"), required=True,
-                               help="Video output file")
-
-        for analyzer in FrameAnalyzerManager.list_analyzers():
-            group = subparser.add_argument_group("Analyzer " + analyzer.name)
-
-            short_prefix = f"-an-{analyzer.id}-"
-            long_prefix = f"--analyzer-{analyzer.id}-"
-
-            group.add_argument(short_prefix + "order", long_prefix + "order", type=int, required=False,
-                               help="Priority order of the analyzer")
-
-            group.add_argument(short_prefix + "log-file", long_prefix + "log-file",
-                               type=FileType("a", encoding="UTF-8"), required=False,
-                               help="File to log analyzer messages to. \
-                               If not specified, logging for this analyzer will be disabled")
-
-            group.add_argument(short_prefix + "log-level", long_prefix + "log-level",
-                               required=False, default="INFO",
-                               help="Output log level name for the logger associated to the analyzer. \
-                               If not specified, any records for the INFO level or above will be logged. \
-                               Custom levels can be used with the help of the logging.addLevelName Python \
-                               function")
-
-            group.add_argument(short_prefix + "log-format", long_prefix + "log-format",
-                               required=False, default="%(message)s",
-                               help="Output format for the log records generated by the analyzer. \
-                               If not specified, a basic, message only format will be used for log records. \
-                               Analyzers may log records with custom fields, allowing them to be formatted \
-                               independently from other fields according to the provided log format. \
-                               For more information, check out Python's logging formatter documentation at \
-                               https://docs.python.org/3/library/logging.html#logging.Formatter")
-
-            for prop in analyzer.properties:
-                group.add_argument(short_prefix + prop.id, long_prefix + prop.id, help=prop.prop.__doc__,
-                                   required=False)
+        input_group = subparser.add_mutually_exclusive_group(required=True)
+        input_group.add_argument("-in", "--input", dest="input", nargs="+",
+                                 help="Video input files. More than one requires --output-dir")
+        input_group.add_argument("--input-dir", dest="input_dir",
+                                 help="Directory whose video files are processed")
+        input_group.add_argument("--manifest", dest="manifest",
+                                 help="File listing the videos to process, one per line. Empty lines and lines "
+                                      "starting with # are ignored, and relative paths are relative to the manifest")
+
+        output_group = subparser.add_mutually_exclusive_group()
+        output_group.add_argument("-out", "--output", dest="output",
+                                  help="Video output file. It can be omitted if --detections is used")
+        output_group.add_argument("--output-dir", dest="output_dir",
+                                  help="Directory where the outputs of several inputs are written")
+        subparser.add_argument("--detections", dest="detections",
+                               help="JSON Lines file (compressed if it ends with .gz) where the shapes found in each "
+                                    "frame are written. Without --output, frames are only analyzed, not modified or "
+                                    "encoded. With it, both are produced reading the video once")
+        subparser.add_argument("--output-template", dest="output_template", default=DEFAULT_OUTPUT_TEMPLATE,
+                               help="Name of each output in --output-dir. It can use {stem}, {ext} and {name} of the "
+                                    "input file, the name of its directory as {parent} and its position as {index}")
+        subparser.add_argument("--file-workers", dest="file_workers", type=int, default=1,
+                               help="Number of processes working on different files with --output-dir. Each one "
+                                    "builds its analyzers once and uses them for all the files it processes, with "
+                                    "the --analyzer-backend. Analyzer log files are not used with several workers")
+        subparser.add_argument("--summary", dest="summary",
+                               help="File where the throughput of each file processed with --output-dir is written "
+                                    "(JSON if it ends with .json, CSV otherwise)")
+        subparser.add_argument("--overwrite", dest="overwrite", action="store_true",
+                               help="Processes again inputs whose output in --output-dir already exists")
+        subparser.add_argument("--batch-size", dest="batch_size", type=int, default=1,
+                               help="Number of frames analyzed together by analyzers supporting batch analysis. "
+                                    "It is ignored by other analyzers, by chains of several analyzers and by the "
+                                    "process backend")
+        subparser.add_argument("--jobs", dest="jobs", type=int, default=1,
+                               help="Number of processes the video is split among. Each one processes a range of "
+                                    "frames starting at a keyframe with its own analyzers, and the parts are joined "
+                                    "into the output (ffmpeg and ffprobe are used if available). The pipelined mode "
+                                    "and batch analysis are not used with more than one job")
+        subparser.add_argument("--pipeline", dest="pipeline", action="store_true",
+                               help="Decodes, analyzes and encodes frames at the same time in separate stages, so the "
+                                    "processing is limited by the slowest stage. Every frame is analyzed")
+        subparser.add_argument("--pipeline-workers", dest="pipeline_workers", type=int, default=1,
+                               help="Number of threads analyzing frames in the pipelined mode and with --detections. "
+                                    "Analyzers of the thread backend must be thread-safe to use more than one")
+        subparser.add_argument("--pipeline-queue-size", dest="pipeline_queue_size", type=int,
+                               default=DEFAULT_QUEUE_SIZE,
+                               help="Number of decoded frames waiting to be analyzed in the pipelined mode")
+        subparser.add_argument("--checkpoint-interval", dest="checkpoint_interval", type=int,
+                               help="Writes the output in segments of this number of frames, saving a checkpoint after "
+                                    "each one so the processing can be resumed with --resume")
+        subparser.add_argument("--checkpoint", dest="checkpoint",
+                               help="Checkpoint file. By default, the output name followed by .checkpoint.json")
+        subparser.add_argument("--resume", dest="resume", action="store_true",
+                               help="Continues the processing from the checkpoint of a previous run with the same "
+                                    "input and analyzer configuration, or starts it if there is no checkpoint")
+
+        self._add_analyzer_arguments(subparser)
 
     def execute_command(self, args: Namespace):
-        analyzer = self._build_analyzer(args)
+        input_paths = ProcessArgumentsCommand._get_input_paths(args)
 
-        LIVIA_CLI_LOGGER.info(f"Processing {args.input.name} to {args.output.name}")
-        input = FileFrameInput(args.input.name, 0)
-        output = FileFrameOutput(args.output.name, input.get_fps(), *input.get_frame_size())
+        if args.output_dir is not None:
+            if args.detections is not None:
+                raise ValueError("--detections can not be used with --output-dir")
 
-        processor = AnalyzerFrameProcessor(input, output, analyzer, daemon=False)
-        processor.add_process_change_listener(ProcessorListener())
+            self._process_files(args, input_paths)
+            return
 
-        processor.start()
+        if args.output is None and args.detections is None:
+            raise ValueError("An --output, --output-dir or --detections is required")
 
-    def _build_analyzer(self, args):
-        analyzers: List[(int, FrameAnalyzerMetadata)] = []
+        if len(input_paths) != 1:
+            raise ValueError(f"{len(input_paths)} inputs can not be written to a single output. Use --output-dir")
 
-        for analyzer_metadata in FrameAnalyzerManager.list_analyzers():
-            analyzer_args, order, log_args = ProcessArgumentsCommand._extract_args_for_analyzer(args, analyzer_metadata)
+        input_path = input_paths[0]
 
-            if analyzer_args is not None:
-                analyzer = analyzer_metadata.analyzer_class()
+        if args.detections is not None:
+            self._process_with_detections(args, input_path)
+            return
 
-                for prop_id, value in analyzer_args.__dict__.items():
-                    prop = analyzer_metadata.get_property_by_id(prop_id)
-                    if prop is not None:
-                        try:
-                            converter = self.__value_converter_factory.get_converter(prop.prop_type)
-                            prop.set_value(analyzer, converter.convert(value))
-                        except ValueError:
-                            prop.set_value(analyzer, value)
+        if args.resume or args.checkpoint_interval is not None or args.checkpoint is not None:
+            self._process_resumable(args, input_path)
+            return
 
-                if log_args is not None:
-                    log_file, log_level, log_format = log_args
+        if args.jobs > 1:
+            self._process_in_chunks(args, input_path)
+            return
 
-                    logger = FrameAnalyzerManager.get_logger_for(analyzer)
-                    logger.setLevel(log_level)
-                    handler = logging.StreamHandler(log_file)
-                    handler.setFormatter(logging.Formatter(log_format))
-                    logger.addHandler(handler)
+        analyzer = self._build_frame_analyzer(args)
 
-                analyzers.append((order, analyzer))
+        LIVIA_CLI_LOGGER.info(f"Processing {input_path} to {args.output}")
+        input = FileFrameInput(input_path, 0)
+        output = FileFrameOutput(args.output, input.get_fps(), *input.get_frame_size())
 
-        if analyzers:
-            analyzers.sort(key=lambda item: item[0], reverse=True)
+        if args.pipeline:
+            if args.batch_size > 1:
+                LIVIA_CLI_LOGGER.warning("Batch analysis is not used in the pipelined mode")
 
-            def add_child(a1, a2):
-                a1.child = a2
-                return a1
+            self._process_pipelined(input, output, analyzer, args.pipeline_workers, args.pipeline_queue_size)
+            return
 
-            analyzer = reduce(add_child, [analyzer_order[1] for analyzer_order in analyzers])
-        else:
-            analyzer = NoChangeFrameAnalyzer()
+        if args.batch_size > 1:
+            if supports_batch_analysis(analyzer):
+                self._process_in_batches(input, output, analyzer, args.batch_size)
+                return
+            else:
+                LIVIA_CLI_LOGGER.warning("The analyzer does not support batch analysis. Frames will be analyzed one "
+                                         "by one")
 
-        return analyzer
+        processor = AnalyzerFrameProcessor(input, output, analyzer, daemon=False)
+        processor.add_process_change_listener(ProcessorListener())
+
+        processor.start()
 
     @staticmethod
-    def _extract_args_for_analyzer(args: Namespace, analyzer: FrameAnalyzerMetadata) -> \
-            Tuple[Optional[Namespace], Optional[int], Optional[Tuple[TextIOBase, str, str]]]:
-        def arg(arg_id):
-            return f"analyzer_{analyzer.id}_{arg_id}".replace("-", "_")
-
-        order = getattr(args, arg("order"))
-        log_file = getattr(args, arg("log_file"))
-        log_level = getattr(args, arg("log_level"))
-        log_format = getattr(args, arg("log_format"))
-
-        if order is None:
-            return None, None, None
+    def _get_input_paths(args: Namespace) -> List[str]:
+        if args.input_dir is not None:
+            input_paths = VideoFilesProcessor.list_directory(args.input_dir)
+        elif args.manifest is not None:
+            input_paths = VideoFilesProcessor.read_manifest(args.manifest)
+        else:
+            input_paths = args.input
+
+        if not input_paths:
+            raise ValueError("No video to process")
+
+        missing = [path for path in input_paths if not os.path.isfile(path)]
+        if missing:
+            raise FileNotFoundError(f"Video input not found: {', '.join(missing)}")
+
+        return input_paths
+
+    def _process_files(self, args: Namespace, input_paths: List[str]):
+        if args.jobs > 1 or args.pipeline or args.batch_size > 1:
+            LIVIA_CLI_LOGGER.warning("--jobs, --pipeline and --batch-size are ignored with --output-dir. Each file is "
+                                     "processed in the pipelined mode by one of the --file-workers")
+
+        tasks = VideoFilesProcessor.build_tasks(input_paths, args.output_dir, args.output_template)
+
+        if args.file_workers > 1:
+            # Analyzers are built in the file workers from their spec, so log files can not be used, as with the
+            # process backend. The backend is applied by each file worker.
+            spec = self._build_analyzer_spec(args)
+            analyzer_workers = args.analyzer_workers \
+                if AnalyzerBackend(args.analyzer_backend) == AnalyzerBackend.PROCESS else None
+
+            if analyzer_workers is not None and sys.version_info < (3, 9):
+                # Older pools run daemonic workers, which can not start the analyzer processes
+                LIVIA_CLI_LOGGER.warning("--analyzer-backend process is ignored with several --file-workers before "
+                                         "Python 3.9. Each file worker runs its analyzers in its own process")
+                analyzer_workers = None
+            processor = VideoFilesProcessor(tasks, spec, args.file_workers, args.overwrite,
+                                            analyzer_workers=analyzer_workers)
         else:
-            analyzer_args = Namespace()
+            processor = VideoFilesProcessor(tasks, None, args.file_workers, args.overwrite,
+                                            lambda: self._build_frame_analyzer(args))
+
+        LIVIA_CLI_LOGGER.info(f"Processing {len(tasks)} videos to {args.output_dir} with "
+                              f"{min(processor.workers, len(tasks))} workers")
+        results = processor.process()
+
+        for result in results:
+            LIVIA_BENCHMARK_LOGGER.info(f"file_processing,{result.task.input_path},{result.status.value},"
+                                        f"{result.frames},{result.elapsed_time:.4f},{result.frames_per_second}")
+
+        counts = {status: sum(1 for result in results if result.status == status) for status in VideoFileStatus}
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished: {counts[VideoFileStatus.PROCESSED]} processed, "
+                              f"{counts[VideoFileStatus.SKIPPED]} skipped, {counts[VideoFileStatus.FAILED]} failed")
+
+        if args.summary is not None:
+            VideoFilesProcessor.write_summary(results, args.summary)
+            LIVIA_CLI_LOGGER.info(f"Summary written to {args.summary}")
+
+        if counts[VideoFileStatus.FAILED] > 0:
+            sys.exit(1)
+
+    def _process_with_detections(self, args: Namespace, input_path: str):
+        if args.jobs > 1 or args.batch_size > 1 or args.resume or args.checkpoint_interval is not None:
+            LIVIA_CLI_LOGGER.warning("--jobs, --batch-size and checkpoints are ignored when --detections is used")
+
+        analyzer = self._build_frame_analyzer(args)
+
+        LIVIA_CLI_LOGGER.info(f"Processing {input_path} to {args.detections}"
+                              + (f" and {args.output}" if args.output is not None else ""))
+        input = FileFrameInput(input_path, 0)
+        output = FileFrameOutput(args.output, input.get_fps(), *input.get_frame_size()) \
+            if args.output is not None else None
+        writer = DetectionsWriter(args.detections, input.get_fps())
+
+        # Every frame is analyzed, as the detections of the whole video are expected
+        processor = PipelinedFrameProcessor(input, output, analyzer, args.pipeline_workers, args.pipeline_queue_size,
+                                            writer.write)
+        try:
+            processor.process()
+        finally:
+            processor.close()
+            writer.close()
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished: {writer.shapes} shapes in {writer.frames} frames at "
+                              f"{processor.frames_per_second:.2f} fps")
+        LIVIA_BENCHMARK_LOGGER.info(f"detections_processing,{output is not None},{processor.processed_frames},"
+                                    f"{writer.shapes},{processor.frames_per_second}")
+
+    def _process_resumable(self, args: Namespace, input_path: str):
+        if args.jobs > 1 or args.pipeline or args.batch_size > 1:
+            LIVIA_CLI_LOGGER.warning("--jobs, --pipeline and --batch-size are ignored when checkpoints are written")
+
+        spec = self._build_analyzer_spec(args)
+        fingerprint = spec.fingerprint() if spec is not None else "none"
+        checkpoint_interval = args.checkpoint_interval if args.checkpoint_interval is not None \
+            else DEFAULT_CHECKPOINT_INTERVAL
+
+        processor = ResumableVideoProcessor(input_path, args.output, self._build_frame_analyzer(args), fingerprint,
+                                            checkpoint_interval, args.checkpoint)
+
+        LIVIA_CLI_LOGGER.info(f"Processing {input_path} to {args.output} with a checkpoint every "
+                              f"{checkpoint_interval} frames in {processor.checkpoint_path}")
+        processor.process(args.resume)
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished: {processor.processed_frames} frames from frame "
+                              f"{processor.resumed_frame} at {processor.frames_per_second:.2f} fps")
+        LIVIA_BENCHMARK_LOGGER.info(f"resumable_processing,{processor.resumed_frame},{processor.processed_frames},"
+                                    f"{processor.frames_per_second}")
+
+    def _process_in_chunks(self, args: Namespace, input_path: str):
+        processor = ChunkedVideoProcessor(input_path, args.output, self._build_analyzer_spec(args), args.jobs)
+
+        LIVIA_CLI_LOGGER.info(f"Processing {input_path} to {args.output} in {processor.jobs} jobs")
+        processor.process()
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished: {processor.processed_frames} frames in "
+                              f"{len(processor.chunks)} chunks at {processor.frames_per_second:.2f} fps")
+        LIVIA_BENCHMARK_LOGGER.info(f"chunked_processing,{processor.jobs},{len(processor.chunks)},"
+                                    f"{processor.processed_frames},{processor.frames_per_second}")
 
-            for prop in analyzer.properties:
-                arg_value = getattr(args, arg(prop.id))
-                if arg_value is not None:
-                    setattr(analyzer_args, prop.id, arg_value)
+    @staticmethod
+    def _process_pipelined(input: FileFrameInput, output: FileFrameOutput, analyzer: FrameAnalyzer, workers: int,
+                           queue_size: int):
+        processor = PipelinedFrameProcessor(input, output, analyzer, workers, queue_size)
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis started (pipelined, {processor.analysis_workers} analysis workers)")
+        try:
+            processor.process()
+        finally:
+            processor.close()
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished: {processor.processed_frames} frames at "
+                              f"{processor.frames_per_second:.2f} fps")
+        LIVIA_BENCHMARK_LOGGER.info(f"pipelined_processing,{processor.processed_frames},"
+                                    f"{processor.frames_per_second}")
+
+        for stage in processor.get_stage_utilizations():
+            LIVIA_CLI_LOGGER.info(f"Stage {stage.stage}: {stage.utilization * 100:.1f}% busy "
+                                  f"({stage.workers} workers, {stage.busy_seconds:.2f} s)")
+            LIVIA_BENCHMARK_LOGGER.info(f"pipeline_stage,{stage.stage},{stage.workers},{stage.busy_seconds:.4f},"
+                                        f"{stage.utilization:.4f}")
 
-            if log_file is not None:
-                return analyzer_args, order, (log_file, log_level, log_format)
-            else:
-                return analyzer_args, order, None
+    @staticmethod
+    def _process_in_batches(input: FileFrameInput, output: FileFrameOutput, analyzer: FrameAnalyzer, batch_size: int):
+        processor = BatchAnalyzerFrameProcessor(input, output, analyzer, batch_size)
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis started (batches of {batch_size} frames)")
+        try:
+            processor.process()
+        finally:
+            processor.close()
+
+        LIVIA_CLI_LOGGER.info(f"Video analysis finished")
+        LIVIA_BENCHMARK_LOGGER.info(f"batch_processing,{processor.processed_frames},{processor.batches},"
+                                    f"{processor.frames_per_second}")
@@ -1,5 +1,7 @@
 import logging
 import os
+from time import perf_counter
+from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QApplication
 from argparse import ArgumentParser, FileType, Namespace, ArgumentTypeError, ArgumentDefaultsHelpFormatter
 
@@ -12,9 +14,18 @@ from livia_ui.gui import LIVIA_GUI_LOGGER
 from livia_ui.gui.LiviaWindow import LiviaWindow
 from livia_ui.gui.configuration.ConfigurationStorage import ConfigurationStorage
 from livia_ui.gui.status.DisplayStatus import DisplayStatus
+from livia_ui.gui.status.FrameProcessingSampler import DEFAULT_SAMPLING_RATE
 from livia_ui.gui.status.FrameProcessingStatus import FrameProcessingStatus
 from livia_ui.gui.status.LiviaStatus import LiviaStatus
 from livia_ui.gui.status.ShortcutStatus import ShortcutStatus
+from livia_ui.gui.views.builders.DefaultVideoPanelBuilder import DefaultVideoPanelBuilder
+from livia_ui.gui.views.builders.GuiBuilders import GuiBuilders
+from livia_ui.gui.views.utils.VideoRenderer import VideoRenderer
+from livia_ui.process.analyzer.AnalyzerBackend import AnalyzerBackend
+from livia_ui.process.analyzer.BatchingFrameAnalyzer import DEFAULT_BATCH_LATENCY
+from livia_ui.process.analyzer.AnalyzerAutoTuner import AnalyzerAutoTuner, DEFAULT_MAX_MODIFICATION_PERSISTENCE
+from livia_ui.process.analyzer.DeadlineScheduler import DEFAULT_LATENCY_BUDGET_FRAMES
+from livia_ui.process.analyzer.FrameAnalyzerPool import DEFAULT_ANALYZER_POOL_SIZE
 
 
 def at_least_one(value: str) -> int:
@@ -37,6 +48,7 @@ class LiviaGuiArgumentParser(ArgumentParser):
         self._app: QApplication = None
         self._livia_window: LiviaWindow = None
         self._configuration_storage: ConfigurationStorage = None
+        self._startup_time: float = perf_counter()
 
         default_modification_persistence = DEFAULT_MODIFICATION_PERSISTENCE
         default_frame_processor_threads = DEFAULT_NUM_THREADS
@@ -50,6 +62,54 @@ class LiviaGuiArgumentParser(ArgumentParser):
                           default=default_frame_processor_threads,
                           help="Number of thread used by the asynchronous frame processor "
                                f"(default: {default_frame_processor_threads})")
+        self.add_argument("--analyzer-backend", dest="analyzer_backend", type=str,
+                          choices=[backend.value for backend in AnalyzerBackend], default=AnalyzerBackend.THREAD.value,
+                          help="Backend running the live analyzer. The process backend runs a copy of the analyzer in "
+                               "a worker process for each frame processor thread, so CPU-bound Python analyzers are "
+                               "not serialized by the GIL. It requires Python 3.8 or newer")
+        self.add_argument("--analyzer-batch-size", dest="analyzer_batch_size", type=at_least_one, default=1,
+                          help="Maximum number of frames analyzed together by live analyzers supporting batch "
+                               "analysis. Batches can not be larger than the number of frame processor threads")
+        self.add_argument("--analyzer-batch-latency", dest="analyzer_batch_latency", type=float,
+                          default=DEFAULT_BATCH_LATENCY * 1000,
+                          help="Maximum time (in milliseconds) a frame waits for its batch to be completed")
+        self.add_argument("--auto-tune", dest="auto_tune", action="store_true",
+                          help="Adjusts the frame processor threads and the modification persistence at runtime to "
+                               "the analysis latency and the input frame rate")
+        self.add_argument("--auto-tune-max-threads", dest="auto_tune_max_threads", type=at_least_one,
+                          default=os.cpu_count() or 1,
+                          help="Maximum number of frame processor threads used by --auto-tune")
+        self.add_argument("--auto-tune-max-persistence", dest="auto_tune_max_persistence", type=at_least_one,
+                          default=DEFAULT_MAX_MODIFICATION_PERSISTENCE,
+                          help="Maximum modification persistence (in frames) used by --auto-tune")
+        self.add_argument("--deadline-scheduling", dest="deadline_scheduling", action="store_true",
+                          help="With devices, frames that can not start being analyzed within the latency budget are "
+                               "not analyzed and keep the last analysis result, so the latency stays bounded when "
+                               "the analyzer is slower than the device")
+        self.add_argument("--latency-budget-frames", dest="latency_budget_frames", type=float,
+                          default=DEFAULT_LATENCY_BUDGET_FRAMES,
+                          help="Frame periods a frame may wait for its analysis when --deadline-scheduling is used")
+        self.add_argument("--statistics-sampling-rate", dest="statistics_sampling_rate", type=float,
+                          default=DEFAULT_SAMPLING_RATE,
+                          help="Updates per second of the processing statistics shown (progress, time and FPS)")
+        self.add_argument("--performance-hud", dest="performance_hud", action="store_true",
+                          help="Shows the performance overlay (frame rates, latencies, analyzer usage and memory) "
+                               "on the video from the start. It can also be toggled with a shortcut")
+        self.add_argument("--analyzer-pool-size", dest="analyzer_pool_size", type=at_least_one,
+                          default=DEFAULT_ANALYZER_POOL_SIZE,
+                          help="Number of configured analyzers kept in memory, so switching between configurations "
+                               "does not require building them again")
+        self.add_argument("--analyzer-pool-memory", dest="analyzer_pool_memory", type=at_least_one, required=False,
+                          help="Maximum memory (in MB) taken by the configured analyzers kept in memory")
+        self.add_argument("--video-renderer", dest="video_renderer", type=str,
+                          choices=[renderer.value for renderer in VideoRenderer], default=VideoRenderer.SOFTWARE.value,
+                          help="Renderer used to display the video. If OpenGL is not available, the software renderer "
+                               "is used. The OpenGL renderer can be run with Mesa's software rasterizer by setting "
+                               "LIBGL_ALWAYS_SOFTWARE=1")
+
+        self.add_argument("--fast-startup", dest="fast_startup", action="store_true",
+                          help="Shows the window before loading the configuration. Configured analyzers are built in "
+                               "the background and warmed up with blank frames of the input size")
 
         config_group = self.add_argument_group("Configuration")
         config_group.add_argument("--config-file", dest="config_file", type=FileType("r"),
@@ -113,13 +173,37 @@ class LiviaGuiArgumentParser(ArgumentParser):
             frame_size = (800, 600)
 
         window_size = (frame_size[0] + 50, frame_size[1] + 100)
+        pool_memory = args.analyzer_pool_memory * 1024 * 1024 if args.analyzer_pool_memory is not None else None
+
+        if args.auto_tune:
+            auto_tuner = AnalyzerAutoTuner(args.frame_processor_threads, args.modification_persistence,
+                                           max_threads=args.auto_tune_max_threads,
+                                           max_persistence=args.auto_tune_max_persistence)
+        else:
+            auto_tuner = None
+
         return LiviaStatus(FrameProcessingStatus(input_frame, modification_persistence=args.modification_persistence,
-                                                 analyzer_threads=args.frame_processor_threads),
-                           DisplayStatus(window_size, status_message=f"Welcome to {self._app_name}"),
+                                                 analyzer_threads=args.frame_processor_threads,
+                                                 analyzer_pool_size=args.analyzer_pool_size,
+                                                 analyzer_pool_memory_bytes=pool_memory,
+                                                 warm_up_with_blank_frames=args.fast_startup,
+                                                 startup_time=self._startup_time,
+                                                 auto_tuner=auto_tuner,
+                                                 deadline_scheduling=args.deadline_scheduling,
+                                                 latency_budget_frames=args.latency_budget_frames,
+                                                 analyzer_backend=AnalyzerBackend(args.analyzer_backend),
+                                                 analyzer_batch_size=args.analyzer_batch_size,
+                                                 analyzer_batch_latency=args.analyzer_batch_latency / 1000,
+                                                 sampling_rate=args.statistics_sampling_rate),
+                           DisplayStatus(window_size, status_message=f"Welcome to {self._app_name}",
+                                         performance_hud=args.performance_hud),
                            ShortcutStatus())
 
-    def _build_window(self, livia_status: LiviaStatus) -> LiviaWindow:
-        livia_window = LiviaWindow(livia_status)
+    def _build_gui_builders(self, args: Namespace) -> GuiBuilders:
+        return GuiBuilders(video_panel_builder=DefaultVideoPanelBuilder.factory(VideoRenderer(args.video_renderer)))
+
+    def _build_window(self, livia_status: LiviaStatus, gui_builders: GuiBuilders) -> LiviaWindow:
+        livia_window = LiviaWindow(livia_status, gui_builders)
         livia_window.setWindowTitle(self._app_name)
 
         return livia_window
@@ -128,6 +212,9 @@ class LiviaGuiArgumentParser(ArgumentParser):
         return ConfigurationStorage(self._livia_window.status, args.config_file, not args.no_config,
                                     args.auto_update_config)
 
+    def _load_configuration_later(self, args: Namespace):
+        self._configuration_storage = self._build_configuration(args)
+
     def _configure_logs(self, args: Namespace) -> None:
         if args.log_all_level is not None:
             level = logging.getLevelName(args.log_all_level)
@@ -230,10 +317,11 @@ class LiviaGuiArgumentParser(ArgumentParser):
 
         livia_status = self._build_status(args)
 
-        self._livia_window = self._build_window(livia_status)
+        self._livia_window = self._build_window(livia_status, self._build_gui_builders(args))
         self._livia_window.adjustSize()
 
-        self._configuration_storage = self._build_configuration(args)
+        if not args.fast_startup:
+            self._configuration_storage = self._build_configuration(args)
 
         try:
             window_center = self._livia_window.rect().center()
@@ -244,7 +332,12 @@ class LiviaGuiArgumentParser(ArgumentParser):
             LIVIA_GUI_LOGGER.exception("Window could not be centered in the screen")
 
         self._livia_window.show()
+        LIVIA_BENCHMARK_LOGGER.info(f"startup,window_shown,{perf_counter() - self._startup_time:.3f}")
 
         self._livia_window.status.video_stream_status.frame_processor.start()
 
+        if args.fast_startup:
+            # Loaded once the event loop runs, so the window is painted first. Analyzers are then built in parallel.
+            QTimer.singleShot(0, lambda: self._load_configuration_later(args))
+
         self._app.exit(self._app.exec_())
@@ -71,3 +71,6 @@ class LiviaWindow(QMainWindow, UiLiviaWindow):
             if key_sequence == self._livia_status.shortcut_status.get_keys(
                     DefaultShortcutAction.TOGGLE_HIDE_CONTROLS_FULLSCREEN)[0]:
                 self._livia_status.display_status.toggle_hide_controls_fullscreen()
+            if key_sequence == self._livia_status.shortcut_status.get_keys(
+                    DefaultShortcutAction.TOGGLE_PERFORMANCE_HUD)[0]:
+                self._livia_status.display_status.toggle_performance_hud()
@@ -0,0 +1,141 @@
+import os
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide2.QtGui import QImage, QPixmap, QGuiApplication
+from numpy import ndarray
+
+from livia_ui.gui.views.utils.FrameConverter import FrameConverter
+
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160)
+}
+
+
+def _legacy_convert(frame: ndarray) -> QImage:
+    # Conversion used before FrameConverter: RGB888 wrapper plus a full copy to swap the channels
+    height, width, colors = frame.shape
+    return QImage(frame.data, width, height, colors * width, QImage.Format_RGB888).rgbSwapped()
+
+
+class ConversionBenchmarkResult:
+    def __init__(self, resolution: str, method: str, convert_msec: float, display_msec: float,
+                 copies_per_frame: float, allocations_per_frame: float, frame_bytes: int):
+        self._resolution: str = resolution
+        self._method: str = method
+        self._convert_msec: float = convert_msec
+        self._display_msec: float = display_msec
+        self._copies_per_frame: float = copies_per_frame
+        self._allocations_per_frame: float = allocations_per_frame
+        self._frame_bytes: int = frame_bytes
+
+    @property
+    def resolution(self) -> str:
+        return self._resolution
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def convert_msec(self) -> float:
+        return self._convert_msec
+
+    @property
+    def display_msec(self) -> float:
+        return self._display_msec
+
+    @property
+    def copies_per_frame(self) -> float:
+        return self._copies_per_frame
+
+    @property
+    def allocations_per_frame(self) -> float:
+        return self._allocations_per_frame
+
+    @property
+    def copied_megabytes_per_frame(self) -> float:
+        return self._copies_per_frame * self._frame_bytes / (1024 * 1024)
+
+
+class ConversionBenchmark:
+    def __init__(self, iterations: int = 50, resolutions: Dict[str, Tuple[int, int]] = RESOLUTIONS):
+        self._iterations: int = iterations
+        self._resolutions: Dict[str, Tuple[int, int]] = resolutions
+
+    def run(self) -> List[ConversionBenchmarkResult]:
+        results = []
+
+        for name, (width, height) in self._resolutions.items():
+            frame = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+            padded = np.random.randint(0, 256, (height, width + 32, 3), dtype=np.uint8)[:, 16:16 + width]
+
+            results.append(self._measure(name, "legacy (RGB888 + rgbSwapped)", frame, _legacy_convert, None))
+
+            converter = FrameConverter(prefer_32_bit=False)
+            results.append(self._measure(name, "BGR888 zero-copy", frame, converter.convert, converter))
+
+            converter = FrameConverter(prefer_32_bit=False)
+            results.append(self._measure(name, "BGR888 zero-copy (padded rows)", padded, converter.convert, converter))
+
+            converter = FrameConverter(prefer_32_bit=True)
+            results.append(self._measure(name, "RGB32 reused buffer", frame, converter.convert, converter))
+
+        return results
+
+    def _measure(self, resolution: str, method: str, frame: ndarray, convert: Callable[[ndarray], QImage],
+                 converter: Optional[FrameConverter]) -> ConversionBenchmarkResult:
+        convert(frame)  # Warm-up (buffer allocation, lazy initializations, etc.)
+        if converter is not None:
+            converter.reset_statistics()
+
+        convert_time = 0.0
+        display_time = 0.0
+        for _ in range(self._iterations):
+            start = perf_counter()
+            image = convert(frame)
+            converted = perf_counter()
+            QPixmap.fromImage(image)
+            displayed = perf_counter()
+
+            convert_time += converted - start
+            display_time += displayed - start
+
+        if converter is None:
+            # rgbSwapped always allocates and fills a new image
+            copies, allocations = 1.0, 1.0
+        else:
+            copies = converter.copies / self._iterations
+            allocations = converter.allocations / self._iterations
+
+        bytes_per_pixel = 4 if converter is not None and converter.prefer_32_bit else 3
+
+        return ConversionBenchmarkResult(resolution, method,
+                                         convert_time * 1000 / self._iterations,
+                                         display_time * 1000 / self._iterations,
+                                         copies, allocations, frame.shape[0] * frame.shape[1] * bytes_per_pixel)
+
+
+def print_results(results: List[ConversionBenchmarkResult]):
+    print(f"{'Resolution':<10} {'Method':<32} {'Convert (ms)':>12} {'+Pixmap (ms)':>12} "
+          f"{'Copies':>7} {'Allocs':>7} {'Copied MB':>10}")
+    for result in results:
+        print(f"{result.resolution:<10} {result.method:<32} {result.convert_msec:>12.3f} {result.display_msec:>12.3f} "
+              f"{result.copies_per_frame:>7.2f} {result.allocations_per_frame:>7.2f} "
+              f"{result.copied_megabytes_per_frame:>10.2f}")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Frame to QImage conversion micro-benchmark")
+    parser.add_argument("--iterations", dest="iterations", type=int, default=50,
+                        help="Number of conversions measured for each resolution and method")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication([])
+
+    print_results(ConversionBenchmark(args.iterations).run())
@@ -0,0 +1,345 @@
+import os
+import sys
+from argparse import ArgumentParser
+from time import perf_counter, sleep
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from PySide2.QtWidgets import QApplication
+from numpy import ndarray
+
+from livia_ui.benchmarking import get_rss_bytes
+from livia_ui.benchmarking.BenchmarkBaseline import BenchmarkBaseline, DEFAULT_REGRESSION_THRESHOLD
+from livia_ui.benchmarking.LatencyHistogram import LatencyHistogram
+from livia_ui.benchmarking.PipelineLatencyTracker import PipelineLatencyTracker
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui.benchmark.ConversionBenchmark import RESOLUTIONS
+from livia_ui.gui.views.utils.GLVideoPanel import GLVideoPanel
+from livia_ui.gui.views.utils.ImagePanel import ImagePanel
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
+from livia_ui.gui.views.utils.VideoPanel import VideoPanel
+
+PANELS: List[str] = ["video", "opengl", "image"]
+
+# Memory layouts of the synthetic frames, as produced by the usual inputs and analyzers
+LAYOUTS: List[str] = ["bgr", "gray", "bgra", "padded-bgr"]
+
+_SYNTHETIC_FRAMES: int = 8
+_DRAIN_TIMEOUT: float = 1.0
+_EVENTS_INTERVAL: float = 0.001
+
+_VideoPanel = Union[VideoPanel, GLVideoPanel]
+
+
+class RenderingBenchmarkCase:
+    def __init__(self, panel: str, resolution: str, layout: str, fps: float):
+        self._panel: str = panel
+        self._resolution: str = resolution
+        self._layout: str = layout
+        self._fps: float = fps
+
+    @property
+    def panel(self) -> str:
+        return self._panel
+
+    @property
+    def resolution(self) -> str:
+        return self._resolution
+
+    @property
+    def layout(self) -> str:
+        return self._layout
+
+    @property
+    def fps(self) -> float:
+        # Rate frames are fed at, or 0 to feed them as fast as they are accepted
+        return self._fps
+
+    @property
+    def key(self) -> str:
+        return f"{self._panel}/{self._resolution}/{self._layout}/{self._fps:g}fps"
+
+
+class RenderingBenchmarkResult:
+    def __init__(self, case: RenderingBenchmarkCase, metrics: Dict[str, float]):
+        self._case: RenderingBenchmarkCase = case
+        self._metrics: Dict[str, float] = metrics
+
+    @property
+    def case(self) -> RenderingBenchmarkCase:
+        return self._case
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        return self._metrics
+
+
+class RenderingBenchmark:
+    # Feeds synthetic frames to the display widgets at a steady rate, as the processor thread does while playing
+    def __init__(self, cases: List[RenderingBenchmarkCase], duration: float = 3.0, warm_up: float = 0.5,
+                 display_size: Tuple[int, int] = (1280, 720)):
+        self._cases: List[RenderingBenchmarkCase] = cases
+        self._duration: float = duration
+        self._warm_up: float = warm_up
+        self._display_size: Tuple[int, int] = display_size
+
+    def run(self) -> List[RenderingBenchmarkResult]:
+        results = []
+
+        for case in self._cases:
+            if case.panel == "opengl" and not GLVideoPanel.is_available():
+                print(f"Skipping {case.key}: OpenGL is not available", file=sys.stderr)
+                continue
+
+            frames = RenderingBenchmark.synthetic_frames(RESOLUTIONS[case.resolution], case.layout)
+
+            if case.panel == "image":
+                metrics = self._measure_image_panel(case, frames)
+            else:
+                metrics = self._measure_video_panel(case, frames)
+
+            results.append(RenderingBenchmarkResult(case, metrics))
+
+        return results
+
+    @staticmethod
+    def synthetic_frames(size: Tuple[int, int], layout: str, count: int = _SYNTHETIC_FRAMES) -> List[ndarray]:
+        width, height = size
+
+        # Different frames prevent caches (e.g. of the last frame) from hiding the real cost
+        if layout == "gray":
+            shape = (count, height, width)
+        elif layout == "bgra":
+            shape = (count, height, width, 4)
+        elif layout in ("bgr", "padded-bgr"):
+            shape = (count, height, width + 32 if layout == "padded-bgr" else width, 3)
+        else:
+            raise ValueError(f"Unknown frame layout: {layout}")
+
+        frames = np.random.randint(0, 256, shape, dtype=np.uint8)
+
+        if layout == "padded-bgr":
+            # Crops of bigger frames have padded rows
+            return [frame[:, 16:16 + width] for frame in frames]
+        else:
+            return list(frames)
+
+    def _measure_video_panel(self, case: RenderingBenchmarkCase, frames: List[ndarray]) -> Dict[str, float]:
+        if case.panel == "opengl":
+            panel: _VideoPanel = GLVideoPanel(True, ScalingQuality.FAST)
+        else:
+            panel = VideoPanel(True, ScalingQuality.FAST)
+
+        tracker = PipelineLatencyTracker()
+        panel.set_latency_tracker(tracker)
+        panel.resize(*self._display_size)
+        panel.show()
+
+        def show_frame(num_frame: int, frame: ndarray):
+            tracker.frame_started(num_frame, perf_counter())
+            panel.show_frame(frame, num_frame=num_frame)
+
+        try:
+            self._feed(case.fps, frames, self._warm_up, show_frame)
+            self._drain(panel)
+            tracker.reset()
+            panel.reset_statistics()
+
+            rss_before = get_rss_bytes()
+            elapsed, submitted = self._feed(case.fps, frames, self._duration, show_frame)
+            self._drain(panel)
+            rss_after = get_rss_bytes()
+
+            statistics = panel.get_statistics()
+            presentation = panel.get_presentation_statistics()
+            latencies = tracker.get_statistics()
+
+            dropped = statistics.frames_dropped + presentation.frames_coalesced
+
+            metrics = {
+                "submitted_fps": submitted / elapsed,
+                "rendered_fps": statistics.frames_rendered / elapsed,
+                "painted_fps": latencies[PipelineStage.PAINT].count / elapsed,
+                "dropped_percent": 100 * dropped / max(1, submitted),
+                "queue_p95_msec": latencies[PipelineStage.QUEUE].p95_msec,
+                "conversion_mean_msec": latencies[PipelineStage.CONVERSION].mean_msec,
+                "paint_mean_msec": latencies[PipelineStage.PAINT].mean_msec,
+                "end_to_end_p50_msec": latencies[PipelineStage.END_TO_END].p50_msec,
+                "end_to_end_p95_msec": latencies[PipelineStage.END_TO_END].p95_msec
+            }
+            if latencies[PipelineStage.SCALING].count > 0:
+                metrics["scaling_mean_msec"] = latencies[PipelineStage.SCALING].mean_msec
+
+            RenderingBenchmark._add_memory_growth(metrics, rss_before, rss_after)
+
+            return metrics
+        finally:
+            panel.hide()
+            if isinstance(panel, VideoPanel):
+                panel.stop()
+            panel.deleteLater()
+            QApplication.processEvents()
+
+    def _measure_image_panel(self, case: RenderingBenchmarkCase, frames: List[ndarray]) -> Dict[str, float]:
+        panel = ImagePanel()
+        panel.resize(*self._display_size)
+        panel.show()
+
+        display_histogram = LatencyHistogram()
+        paint_histogram = LatencyHistogram()
+
+        # Image panels scale and convert the frame synchronously, so the whole display is measured in the caller
+        def show_frame(num_frame: int, frame: ndarray):
+            start = perf_counter()
+            panel.show_frame(frame)
+            displayed = perf_counter()
+            panel.repaint()
+            painted = perf_counter()
+
+            display_histogram.record(displayed - start)
+            paint_histogram.record(painted - displayed)
+
+        try:
+            self._feed(case.fps, frames, self._warm_up, show_frame)
+            display_histogram.reset()
+            paint_histogram.reset()
+
+            rss_before = get_rss_bytes()
+            elapsed, submitted = self._feed(case.fps, frames, self._duration, show_frame)
+            rss_after = get_rss_bytes()
+
+            display = display_histogram.get_statistics()
+            paint = paint_histogram.get_statistics()
+
+            metrics = {
+                "submitted_fps": submitted / elapsed,
+                "painted_fps": paint.count / elapsed,
+                "display_mean_msec": display.mean_msec,
+                "display_p95_msec": display.p95_msec,
+                "paint_mean_msec": paint.mean_msec,
+                "paint_p95_msec": paint.p95_msec
+            }
+
+            RenderingBenchmark._add_memory_growth(metrics, rss_before, rss_after)
+
+            return metrics
+        finally:
+            panel.hide()
+            panel.deleteLater()
+            QApplication.processEvents()
+
+    @staticmethod
+    def _feed(fps: float, frames: List[ndarray], duration: float,
+              show_frame: Callable[[int, ndarray], None]) -> Tuple[float, int]:
+        interval = 1.0 / fps if fps > 0 else 0.0
+        submitted = 0
+
+        start = perf_counter()
+        next_frame = start
+        now = start
+
+        while now - start < duration:
+            if now >= next_frame:
+                show_frame(submitted, frames[submitted % len(frames)])
+                submitted += 1
+                # Late frames are not fed in a burst to catch up, as a live input would not produce them either
+                next_frame = max(next_frame + interval, now) if interval > 0 else now
+
+            QApplication.processEvents()
+
+            now = perf_counter()
+            if next_frame > now:
+                sleep(min(_EVENTS_INTERVAL, next_frame - now))
+                now = perf_counter()
+
+        return now - start, submitted
+
+    @staticmethod
+    def _drain(panel: _VideoPanel):
+        deadline = perf_counter() + _DRAIN_TIMEOUT
+
+        while panel.get_statistics().backlog > 0 and perf_counter() < deadline:
+            QApplication.processEvents()
+            sleep(_EVENTS_INTERVAL)
+
+        # Pending presentations and paints of the last frames
+        drained = perf_counter() + 0.1
+        while perf_counter() < drained:
+            QApplication.processEvents()
+            sleep(_EVENTS_INTERVAL)
+
+    @staticmethod
+    def _add_memory_growth(metrics: Dict[str, float], rss_before: Optional[int], rss_after: Optional[int]):
+        if rss_before is not None and rss_after is not None:
+            metrics["rss_growth_mb"] = (rss_after - rss_before) / (1024 * 1024)
+
+
+def to_baseline(results: List[RenderingBenchmarkResult]) -> BenchmarkBaseline:
+    return BenchmarkBaseline({result.case.key: result.metrics for result in results})
+
+
+def print_results(results: List[RenderingBenchmarkResult]):
+    for result in results:
+        print(result.case.key)
+        for metric, value in result.metrics.items():
+            print(f"    {metric:<24} {value:>10.3f}")
+
+
+def _parse_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Headless benchmark of the video and image panels")
+    parser.add_argument("--panels", dest="panels", type=_parse_list, default=["video", "image"],
+                        help=f"Comma separated panels to measure ({', '.join(PANELS)})")
+    parser.add_argument("--resolutions", dest="resolutions", type=_parse_list, default=["720p", "1080p"],
+                        help=f"Comma separated resolutions of the frames ({', '.join(RESOLUTIONS)})")
+    parser.add_argument("--layouts", dest="layouts", type=_parse_list, default=["bgr"],
+                        help=f"Comma separated memory layouts of the frames ({', '.join(LAYOUTS)})")
+    parser.add_argument("--fps", dest="fps", type=lambda value: [float(fps) for fps in _parse_list(value)],
+                        default=[30.0], help="Comma separated rates the frames are fed at (0 for as fast as possible)")
+    parser.add_argument("--duration", dest="duration", type=float, default=3.0,
+                        help="Seconds measured for each case")
+    parser.add_argument("--warm-up", dest="warm_up", type=float, default=0.5,
+                        help="Seconds frames are fed before measuring each case")
+    parser.add_argument("--display-size", dest="display_size", type=_parse_size, default=(1280, 720),
+                        help="Size of the panels, as WIDTHxHEIGHT")
+    parser.add_argument("--output", dest="output", type=str, default=None,
+                        help="JSON file the results are written to")
+    parser.add_argument("--baseline", dest="baseline", type=str, default=None,
+                        help="JSON results of a previous run to compare with. The exit code is 1 if a metric regresses")
+    parser.add_argument("--threshold", dest="threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Relative change of a metric considered a regression")
+    args = parser.parse_args()
+
+    for name, values, known in (("panel", args.panels, PANELS), ("resolution", args.resolutions, RESOLUTIONS),
+                                ("layout", args.layouts, LAYOUTS)):
+        unknown = [value for value in values if value not in known]
+        if unknown:
+            parser.error(f"Unknown {name}: {', '.join(unknown)}")
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+
+    benchmark_cases = [RenderingBenchmarkCase(panel, resolution, layout, fps)
+                       for panel in args.panels for resolution in args.resolutions
+                       for layout in args.layouts for fps in args.fps]
+    benchmark_results = RenderingBenchmark(benchmark_cases, args.duration, args.warm_up, args.display_size).run()
+    print_results(benchmark_results)
+
+    current = to_baseline(benchmark_results)
+    if args.output is not None:
+        current.save(args.output)
+
+    if args.baseline is not None:
+        regressions = BenchmarkBaseline.load(args.baseline).compare(current, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+
+        sys.exit(1 if regressions else 0)
@@ -1,3 +1,4 @@
+from hashlib import sha1
 from typing import List, Any, Tuple
 
 from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerPropertyMetadata
@@ -25,3 +26,12 @@ class FrameAnalyzerConfiguration:
     @property
     def parameters(self) -> List[Tuple[FrameAnalyzerPropertyMetadata, Any]]:
         return self._analyzer_params
+
+    def fingerprint(self) -> str:
+        # Identifies the analysis done with this configuration, regardless of its name and the parameters order
+        parameters = sorted((prop.id, repr(value)) for prop, value in self._analyzer_params)
+
+        return sha1(repr((self._analyzer_id, parameters)).encode("utf-8")).hexdigest()
+
+    def copy(self) -> "FrameAnalyzerConfiguration":
+        return FrameAnalyzerConfiguration(self._configuration_name, self._analyzer_id, list(self._analyzer_params))
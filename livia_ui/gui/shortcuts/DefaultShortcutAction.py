@@ -12,6 +12,7 @@ class DefaultShortcutAction(ShortcutAction):
     TOGGLE_FULLSCREEN = 2001
     TOGGLE_HIDE_CONTROLS_FULLSCREEN = 2002
     TOGGLE_RESIZABLE = 2003
+    TOGGLE_PERFORMANCE_HUD = 2004
     TOGGLE_VIDEO_ANALYSIS = 3001
     ANALYZE_IMAGE = 3002
     CONFIGURE_VIDEO_ANALYZER = 10001
@@ -40,6 +41,7 @@ DEFAULT_SHORTCUTS: Dict[ShortcutAction, str] = {
     DefaultShortcutAction.TOGGLE_FULLSCREEN: "F",
     DefaultShortcutAction.TOGGLE_HIDE_CONTROLS_FULLSCREEN: "M",
     DefaultShortcutAction.TOGGLE_RESIZABLE: "R",
+    DefaultShortcutAction.TOGGLE_PERFORMANCE_HUD: "H",
     DefaultShortcutAction.TOGGLE_VIDEO_ANALYSIS: "V",
     DefaultShortcutAction.ANALYZE_IMAGE: "I",
     DefaultShortcutAction.CONFIGURE_VIDEO_ANALYZER: "Alt+V",
@@ -56,6 +58,7 @@ GROUPS: Dict[ShortcutAction, str] = {
     DefaultShortcutAction.TOGGLE_FULLSCREEN: "View",
     DefaultShortcutAction.TOGGLE_HIDE_CONTROLS_FULLSCREEN: "View",
     DefaultShortcutAction.TOGGLE_RESIZABLE: "View",
+    DefaultShortcutAction.TOGGLE_PERFORMANCE_HUD: "View",
     DefaultShortcutAction.TOGGLE_VIDEO_ANALYSIS: "Analysis",
     DefaultShortcutAction.ANALYZE_IMAGE: "Analysis",
     DefaultShortcutAction.CONFIGURE_VIDEO_ANALYZER: "Configuration",
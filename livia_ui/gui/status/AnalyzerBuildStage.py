@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class AnalyzerBuildStage(Enum):
+    BUILDING = "building"
+    WARMING_UP = "warming_up"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    UPDATED = "updated"
@@ -11,12 +11,14 @@ class DisplayStatus:
                  fullscreen: bool = False,
                  resizable: bool = True,
                  status_message: str = "",
-                 hide_controls_fullscreen: bool = False):
+                 hide_controls_fullscreen: bool = False,
+                 performance_hud: bool = False):
         self._window_size: Tuple[int, int] = window_size
         self._fullscreen: bool = fullscreen
         self._resizable: bool = resizable
         self._status_message: str = status_message
         self._hide_controls_fullscreen: bool = hide_controls_fullscreen
+        self._performance_hud: bool = performance_hud
 
         self._listeners: EventListeners[DisplayStatusChangeListener] =\
             EventListeners[DisplayStatusChangeListener]()
@@ -78,6 +80,21 @@ class DisplayStatus:
     def toggle_resizable(self):
         self.resizable = not self.resizable
 
+    @property
+    def performance_hud(self) -> bool:
+        return self._performance_hud
+
+    @performance_hud.setter
+    def performance_hud(self, performance_hud: bool):
+        if self._performance_hud != performance_hud:
+            self._performance_hud = performance_hud
+
+            event = DisplayStatusChangeEvent(self, self._performance_hud)
+            self._listeners.notify(DisplayStatusChangeListener.performance_hud_changed, event)
+
+    def toggle_performance_hud(self):
+        self.performance_hud = not self.performance_hud
+
     @property
     def status_message(self) -> str:
         return self._status_message
@@ -0,0 +1,37 @@
+from typing import Optional
+
+
+class FrameProcessingSample:
+    def __init__(self, sample_time: float, frames_outputted: int, frame_index: Optional[int], msec: Optional[int],
+                 output_fps: float):
+        self._sample_time: float = sample_time
+        self._frames_outputted: int = frames_outputted
+        self._frame_index: Optional[int] = frame_index
+        self._msec: Optional[int] = msec
+        self._output_fps: float = output_fps
+
+    @property
+    def sample_time(self) -> float:
+        return self._sample_time
+
+    @property
+    def frames_outputted(self) -> int:
+        # Frames outputted since the processor started, was resumed or its input changed
+        return self._frames_outputted
+
+    @property
+    def frame_index(self) -> Optional[int]:
+        # Index of the last frame outputted, if the input provides it
+        return self._frame_index
+
+    @property
+    def msec(self) -> Optional[int]:
+        return self._msec
+
+    @property
+    def output_fps(self) -> float:
+        return self._output_fps
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(frames_outputted={self._frames_outputted}, " \
+               f"frame_index={self._frame_index}, msec={self._msec}, output_fps={self._output_fps:.2f})"
@@ -0,0 +1,133 @@
+from collections import deque
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Deque, Optional
+
+from livia.input.FrameInput import FrameInput
+from livia.input.SeekableFrameInput import SeekableFrameInput
+from livia.process.FrameProcessor import FrameProcessor
+from livia.process.listener import build_listener
+from livia.process.listener.EventListeners import EventListeners
+from livia.process.listener.IOChangeEvent import IOChangeEvent
+from livia.process.listener.IOChangeListener import IOChangeListener
+from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
+from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+from livia_ui.gui import LIVIA_GUI_LOGGER
+from livia_ui.gui.status.FrameProcessingSample import FrameProcessingSample
+from livia_ui.gui.status.listener.FrameProcessingSampleListener import FrameProcessingSampleListener
+
+DEFAULT_SAMPLING_RATE: float = 12.0
+
+_FRAMES_DEQUE_SIZE: int = 100
+_MIN_FRAMES_IN_DEQUE: int = 5
+
+
+class FrameProcessingSampler:
+    # Outputted frames are only recorded by the processor thread. Listeners receive a sample of the processing state
+    # at a fixed rate from the sampler thread, so the updates of the GUI do not depend on the frame rate.
+    def __init__(self, frame_processor: FrameProcessor, rate: float = DEFAULT_SAMPLING_RATE):
+        self._frame_processor: FrameProcessor = frame_processor
+        self._interval: float = 1 / rate
+
+        self._lock: Lock = Lock()
+        self._frames_outputted: int = 0
+        self._frame_times: Deque[float] = deque([], _FRAMES_DEQUE_SIZE)
+        self._frame_index: Optional[int] = None
+        self._msec: Optional[int] = None
+        self._changed: bool = True
+
+        self._last_sample: Optional[FrameProcessingSample] = None
+
+        self._listeners: EventListeners[FrameProcessingSampleListener] = \
+            EventListeners[FrameProcessingSampleListener]()
+
+        self._stop_event: Event = Event()
+        self._thread: Optional[Thread] = None
+
+        self._frame_processor.add_process_change_listener(
+            build_listener(ProcessChangeListener,
+                           started=self._on_process_reset,
+                           resumed=self._on_process_reset,
+                           frame_outputted=self._on_frame_outputted)
+        )
+        self._frame_processor.add_io_change_listener(
+            build_listener(IOChangeListener, input_changed=self._on_input_changed)
+        )
+
+    @property
+    def rate(self) -> float:
+        return 1 / self._interval
+
+    @property
+    def last_sample(self) -> Optional[FrameProcessingSample]:
+        return self._last_sample
+
+    def add_sample_listener(self, listener: FrameProcessingSampleListener):
+        self._listeners.append(listener)
+        self._start()
+
+    def remove_sample_listener(self, listener: FrameProcessingSampleListener):
+        self._listeners.remove(listener)
+
+    def has_sample_listener(self, listener: FrameProcessingSampleListener) -> bool:
+        return listener in self._listeners
+
+    def sample(self) -> FrameProcessingSample:
+        with self._lock:
+            frames = len(self._frame_times)
+            if frames >= _MIN_FRAMES_IN_DEQUE and self._frame_times[-1] > self._frame_times[0]:
+                fps = frames / (self._frame_times[-1] - self._frame_times[0])
+            else:
+                fps = 0.0
+
+            self._changed = False
+
+            return FrameProcessingSample(perf_counter(), self._frames_outputted, self._frame_index, self._msec, fps)
+
+    def close(self):
+        self._stop_event.set()
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="livia-processing-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            # Samples are only published when something changed, so an idle processor produces no GUI events
+            if self._changed:
+                self._last_sample = self.sample()
+
+                try:
+                    self._listeners.notify(FrameProcessingSampleListener.sampled, self._last_sample)
+                except Exception:
+                    LIVIA_GUI_LOGGER.exception("Error notifying processing sample")
+
+    def _on_frame_outputted(self, event: ProcessChangeEvent):
+        frame_input = self._frame_processor.input
+
+        # The input is queried in the processor thread, as it is not expected to be used from other threads
+        if isinstance(frame_input, SeekableFrameInput):
+            frame_index = frame_input.get_current_frame_index()
+            msec = frame_input.get_current_msec()
+        else:
+            frame_index, msec = None, None
+
+        with self._lock:
+            self._frames_outputted += 1
+            self._frame_times.append(perf_counter())
+            self._frame_index = frame_index
+            self._msec = msec
+            self._changed = True
+
+    def _on_process_reset(self, event: ProcessChangeEvent):
+        self._reset()
+
+    def _on_input_changed(self, event: IOChangeEvent[FrameInput]):
+        self._reset()
+
+    def _reset(self):
+        with self._lock:
+            self._frames_outputted = 0
+            self._frame_times.clear()
+            self._changed = True
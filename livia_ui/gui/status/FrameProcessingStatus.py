@@ -1,5 +1,15 @@
-from typing import List, Optional
-
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from threading import Lock, RLock
+from time import perf_counter
+from io import IOBase
+from typing import Any, Deque, List, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from livia.benchmarking import LIVIA_BENCHMARK_LOGGER
+from livia.input.DeviceFrameInput import DeviceFrameInput
 from livia.input.FrameInput import FrameInput
 from livia.input.NoFrameInput import NoFrameInput
 from livia.output.FrameOutput import FrameOutput
@@ -9,7 +19,7 @@ from livia.process.analyzer.AsyncAnalyzerFrameProcessor import AsyncAnalyzerFram
     DEFAULT_MODIFICATION_PERSISTENCE, DEFAULT_NUM_THREADS
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
-from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerMetadata
+from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerMetadata, FrameAnalyzerPropertyMetadata
 from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
 from livia.process.analyzer.listener.FrameAnalyzerChangeEvent import FrameAnalyzerChangeEvent
 from livia.process.analyzer.listener.FrameAnalyzerChangeListener import FrameAnalyzerChangeListener
@@ -17,10 +27,40 @@ from livia.process.listener import build_listener
 from livia.process.listener.EventListeners import EventListeners
 from livia.process.listener.IOChangeEvent import IOChangeEvent
 from livia.process.listener.IOChangeListener import IOChangeListener
+from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
+from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+from livia_ui.benchmarking.PipelineLatencyTracker import PipelineLatencyTracker
+from livia_ui.benchmarking.PipelineStage import PipelineStage
 from livia_ui.gui import LIVIA_GUI_LOGGER
 from livia_ui.gui.configuration.FrameAnalyzerConfiguration import FrameAnalyzerConfiguration
+from livia_ui.gui.status.AnalyzerBuildStage import AnalyzerBuildStage
+from livia_ui.gui.status.FrameProcessingSampler import FrameProcessingSampler, DEFAULT_SAMPLING_RATE
+from livia_ui.gui.status.listener.AnalyzerBuildEvent import AnalyzerBuildEvent
 from livia_ui.gui.status.listener.FrameProcessingStatusChangeEvent import FrameProcessingStatusChangeEvent
 from livia_ui.gui.status.listener.FrameProcessingStatusChangeListener import FrameProcessingStatusChangeListener
+from livia_ui.process.analyzer import unwrap_frame_analyzer, requires_analyzer_rebuild, supports_batch_analysis, \
+    close_frame_analyzer, build_process_frame_analyzer
+from livia_ui.process.analyzer.AnalyzerAutoTuner import AnalyzerAutoTuner
+from livia_ui.process.analyzer.AnalyzerBackend import AnalyzerBackend
+from livia_ui.process.analyzer.AutoTuningDecision import AutoTuningDecision
+from livia_ui.process.analyzer.BatchingFrameAnalyzer import BatchingFrameAnalyzer, DEFAULT_BATCH_LATENCY
+from livia_ui.process.analyzer.DeadlineFrameAnalyzer import DeadlineFrameAnalyzer
+from livia_ui.process.analyzer.DeadlineScheduler import DeadlineScheduler, DEFAULT_LATENCY_BUDGET_FRAMES
+from livia_ui.process.analyzer.FrameAnalyzerPool import FrameAnalyzerPool, DEFAULT_ANALYZER_POOL_SIZE
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+from livia_ui.process.analyzer.OverlayFrameAnalyzer import OverlayFrameAnalyzer
+from livia_ui.process.analyzer.SchedulingStatistics import SchedulingStatistics
+from livia_ui.process.analyzer.TimedFrameAnalyzer import TimedFrameAnalyzer
+from livia_ui.process.analyzer.listener.OverlayEvent import OverlayEvent
+from livia_ui.process.analyzer.listener.OverlayListener import OverlayListener
+from livia_ui.process.input import unwrap_frame_input
+from livia_ui.process.input.StampedFrameInput import StampedFrameInput
+
+DEFAULT_ANALYZER_WARM_UP_FRAMES: int = 2
+DEFAULT_FPS: float = 30.0
+
+# Unmodified copies of the frames being drawn into, kept until they are displayed
+_MAX_PENDING_SNAPSHOTS: int = 8
 
 
 class FrameProcessingStatus:
@@ -33,19 +73,98 @@ class FrameProcessingStatus:
                  static_frame_analyzer: FrameAnalyzer = NoChangeFrameAnalyzer(),
                  activate_live_analysis: bool = False,
                  modification_persistence: int = DEFAULT_MODIFICATION_PERSISTENCE,
-                 analyzer_threads: int = DEFAULT_NUM_THREADS):
+                 analyzer_threads: int = DEFAULT_NUM_THREADS,
+                 overlays_enabled: bool = True,
+                 analyzer_pool_size: int = DEFAULT_ANALYZER_POOL_SIZE,
+                 analyzer_pool_memory_bytes: Optional[int] = None,
+                 analyzer_warm_up_frames: int = DEFAULT_ANALYZER_WARM_UP_FRAMES,
+                 warm_up_with_blank_frames: bool = False,
+                 startup_time: Optional[float] = None,
+                 auto_tuner: Optional[AnalyzerAutoTuner] = None,
+                 deadline_scheduling: bool = False,
+                 latency_budget_frames: float = DEFAULT_LATENCY_BUDGET_FRAMES,
+                 analyzer_backend: AnalyzerBackend = AnalyzerBackend.THREAD,
+                 analyzer_batch_size: int = 1,
+                 analyzer_batch_latency: float = DEFAULT_BATCH_LATENCY,
+                 sampling_rate: float = DEFAULT_SAMPLING_RATE):
         self._static_frame_analyzer: FrameAnalyzer = static_frame_analyzer
+        self._static_analyzer_fingerprint: Optional[str] = None
         self._live_frame_analyzer: FrameAnalyzer = live_frame_analyzer
+        self._overlays_enabled: bool = overlays_enabled
+        self._last_displayed_frame: Optional[Tuple[int, ndarray]] = None
+        self._recent_frames: Deque[Tuple[int, ndarray]] = deque(maxlen=max(1, analyzer_warm_up_frames))
+        self._pending_snapshots: Deque[Tuple[int, ndarray]] = deque(maxlen=_MAX_PENDING_SNAPSHOTS)
+        self._pending_snapshots_lock: Lock = Lock()
+        self._analyzer_warm_up_frames: int = analyzer_warm_up_frames
+        self._warm_up_with_blank_frames: bool = warm_up_with_blank_frames
+
+        # perf_counter() value when the application started, used to log the time to the first analyzed frame
+        self._startup_time: Optional[float] = startup_time
+        self._first_live_analysis_logged: bool = False
+
+        self._auto_tuner: Optional[AnalyzerAutoTuner] = auto_tuner
+        self._tuning_decision: Optional[AutoTuningDecision] = None
+        self._unsupported_tuning_logged: bool = False
+
+        # Frames of live inputs waiting too long for their analysis are not analyzed, so the latency stays bounded
+        self._deadline_scheduling: bool = deadline_scheduling
+        self._latency_budget_frames: float = latency_budget_frames
+        self._scheduler: DeadlineScheduler = DeadlineScheduler(latency_budget_frames / DEFAULT_FPS, False)
+
+        # With the process backend, live analyzers run in one worker process per processor thread
+        self._analyzer_backend: AnalyzerBackend = analyzer_backend
+        self._analyzer_workers: int = analyzer_threads
+
+        # Live analyzers supporting batch analysis get the frames of concurrent processor threads in a single batch
+        self._analyzer_batch_size: int = analyzer_batch_size
+        self._analyzer_batch_latency: float = analyzer_batch_latency
+
+        # Analyzers are built in the background, so loading a model does not freeze the GUI nor the video. Live and
+        # static builds run in parallel, each kind one at a time, and the analyzers are swapped under the lock once
+        # they are ready.
+        self._live_build_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="livia-live-analyzer-build"
+        )
+        self._static_build_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="livia-static-analyzer-build"
+        )
+        self._analyzer_lock: RLock = RLock()
+        self._live_build_id: int = 0
+        self._static_build_id: int = 0
+        self._pending_builds: int = 0
+
+        # Copies of the configurations the analyzers in use were built with, to update them in place when possible
+        self._live_applied_configuration: Optional[FrameAnalyzerConfiguration] = None
+        self._static_applied_configuration: Optional[FrameAnalyzerConfiguration] = None
+
+        # Live and static analyzers are pooled apart, so an instance is never used by two threads at the same time
+        self._live_analyzer_pool: FrameAnalyzerPool = FrameAnalyzerPool(
+            analyzer_pool_size, analyzer_pool_memory_bytes, lambda analyzer: analyzer is self._live_frame_analyzer
+        )
+        self._static_analyzer_pool: FrameAnalyzerPool = FrameAnalyzerPool(
+            analyzer_pool_size, analyzer_pool_memory_bytes, lambda analyzer: analyzer is self._static_frame_analyzer
+        )
+
+        # Latency of each stage of the live frames, from the analysis to their display
+        self._latency_tracker: PipelineLatencyTracker = PipelineLatencyTracker()
 
         self._listeners: EventListeners[FrameProcessingStatusChangeListener] = \
             EventListeners[FrameProcessingStatusChangeListener]()
+        self._overlay_listeners: EventListeners[OverlayListener] = EventListeners[OverlayListener]()
+        self._overlay_listener: OverlayListener = build_listener(OverlayListener,
+                                                                 overlay_changed=self._on_overlay_changed)
 
         self._frame_processor: AnalyzerFrameProcessor = self._build_frame_processor(
-            frame_input, frame_output,
-            live_frame_analyzer if activate_live_analysis else FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER,
+            self._wrap_input(frame_input), frame_output,
+            self._wrap_live_analyzer(live_frame_analyzer) if activate_live_analysis
+            else FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER,
             modification_persistence, analyzer_threads
         )
 
+        self._update_scheduler(frame_input)
+
+        self._sampler: FrameProcessingSampler = FrameProcessingSampler(self._frame_processor, sampling_rate)
+
         self._active_live_analyzer_configuration_index = None
         self._active_static_analyzer_configuration_index = None
         self._live_analyzer_configurations: List[FrameAnalyzerConfiguration] = []
@@ -67,15 +186,21 @@ class FrameProcessingStatus:
         analyzer.add_frame_analyzer_change_listener(
             build_listener(FrameAnalyzerChangeListener, analyzer_changed=self._on_analyzer_changed)
         )
+        analyzer.add_process_change_listener(
+            build_listener(ProcessChangeListener,
+                           started=self._on_process_started,
+                           stopped=self._on_process_ended,
+                           finished=self._on_process_ended)
+        )
         return analyzer
 
     @property
     def frame_input(self) -> FrameInput:
-        return self._frame_processor.input
+        return unwrap_frame_input(self._frame_processor.input)
 
     @frame_input.setter
     def frame_input(self, frame_input: FrameInput):
-        self._frame_processor.input = frame_input
+        self._frame_processor.input = self._wrap_input(frame_input)
 
     @property
     def frame_output(self) -> FrameOutput:
@@ -97,6 +222,101 @@ class FrameProcessingStatus:
     def frame_processor(self) -> AnalyzerFrameProcessor:
         return self._frame_processor
 
+    @property
+    def analyzer_threads(self) -> int:
+        # Threads analyzing live frames, which the auto-tuner may have changed since the processor was built
+        return self._tuning_decision.num_threads if self._tuning_decision is not None else self._analyzer_workers
+
+    @property
+    def latency_tracker(self) -> PipelineLatencyTracker:
+        return self._latency_tracker
+
+    @property
+    def sampler(self) -> FrameProcessingSampler:
+        return self._sampler
+
+    @property
+    def live_analyzer_pool(self) -> FrameAnalyzerPool:
+        return self._live_analyzer_pool
+
+    @property
+    def static_analyzer_pool(self) -> FrameAnalyzerPool:
+        return self._static_analyzer_pool
+
+    @property
+    def auto_tuner(self) -> Optional[AnalyzerAutoTuner]:
+        return self._auto_tuner
+
+    @property
+    def analyzer_backend(self) -> AnalyzerBackend:
+        return self._analyzer_backend
+
+    @property
+    def deadline_scheduling(self) -> bool:
+        return self._deadline_scheduling
+
+    def get_scheduling_statistics(self) -> SchedulingStatistics:
+        return self._scheduler.get_statistics()
+
+    @property
+    def last_displayed_frame(self) -> Optional[Tuple[int, ndarray]]:
+        return self._last_displayed_frame
+
+    def set_last_displayed_frame(self, num_frame: int, frame: ndarray):
+        # Frames are kept without the live modifications, so static analyses and warm-ups get the input images
+        frame = self._take_snapshot(num_frame, frame)
+
+        # A single reference assignment, so it can be safely read from any thread
+        self._last_displayed_frame = (num_frame, frame)
+        self._recent_frames.append((num_frame, frame))
+        self._scheduler.frame_output(num_frame)
+
+        if self._auto_tuner is not None:
+            self._auto_tuner.record_frame()
+
+    def clear_last_displayed_frame(self):
+        self._last_displayed_frame = None
+        self._recent_frames.clear()
+
+        with self._pending_snapshots_lock:
+            self._pending_snapshots.clear()
+
+    def get_static_analyzer_fingerprint(self) -> Optional[str]:
+        # Fingerprint of the configuration of the static analyzer in use, which may not be the active configuration
+        # while it is being built
+        return self._static_analyzer_fingerprint
+
+    def get_static_analyzer(self) -> Tuple[FrameAnalyzer, Optional[str]]:
+        # The static analyzer and its fingerprint, read together so the fingerprint always describes the analyzer
+        with self._analyzer_lock:
+            return self._static_frame_analyzer, self._static_analyzer_fingerprint
+
+    def is_building_analyzer(self) -> bool:
+        return self._pending_builds > 0
+
+    def wait_for_analyzer_builds(self, timeout: Optional[float] = None) -> bool:
+        # Builds of each kind are run in order by a single worker, so an empty task finishes after the pending builds
+        deadline = perf_counter() + timeout if timeout is not None else None
+        try:
+            for executor in (self._live_build_executor, self._static_build_executor):
+                remaining = max(0.0, deadline - perf_counter()) if deadline is not None else None
+                executor.submit(lambda: None).result(remaining)
+            return True
+        except TimeoutError:
+            return False
+
+    @property
+    def overlays_enabled(self) -> bool:
+        return self._overlays_enabled
+
+    @overlays_enabled.setter
+    def overlays_enabled(self, overlays_enabled: bool):
+        self._overlays_enabled = overlays_enabled
+
+        analyzer = self._frame_processor.frame_analyzer
+        if isinstance(analyzer, OverlayFrameAnalyzer):
+            analyzer.overlay_enabled = overlays_enabled
+
     @property
     def live_analyzer_configurations(self) -> List[FrameAnalyzerConfiguration]:
         return self._live_analyzer_configurations
@@ -108,6 +328,9 @@ class FrameProcessingStatus:
         else:
             old = self._live_analyzer_configurations
             self._live_analyzer_configurations = live_analyzer_configurations
+            self._live_analyzer_pool.retain(
+                self._get_pooled_fingerprints(live_analyzer_configurations, self._live_applied_configuration)
+            )
             event = FrameProcessingStatusChangeEvent(self, self._live_analyzer_configurations, old)
             self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_configurations_changed,
                                    event)
@@ -137,10 +360,13 @@ class FrameProcessingStatus:
     def set_static_analyzer_configurations(self, static_analyzer_configurations: List[FrameAnalyzerConfiguration],
                                            index_selected: Optional[int] = None):
         if static_analyzer_configurations is None or static_analyzer_configurations == []:
-            self._static_frame_analyzer = NoChangeFrameAnalyzer()
+            self._reset_static_analyzer()
         else:
             old = self._static_analyzer_configurations
             self._static_analyzer_configurations = static_analyzer_configurations
+            self._static_analyzer_pool.retain(
+                self._get_pooled_fingerprints(static_analyzer_configurations, self._static_applied_configuration)
+            )
             event = FrameProcessingStatusChangeEvent(self, self._static_analyzer_configurations, old)
             self._listeners.notify(FrameProcessingStatusChangeListener.static_frame_analyzer_configurations_changed,
                                    event)
@@ -154,7 +380,7 @@ class FrameProcessingStatus:
     @active_static_analyzer_configuration_index.setter
     def active_static_analyzer_configuration_index(self, index: Optional[int] = None):
         if index is None:
-            self._static_frame_analyzer = NoChangeFrameAnalyzer()
+            self._reset_static_analyzer()
         else:
             old = self._active_static_analyzer_configuration_index
             self._active_static_analyzer_configuration_index = index
@@ -174,18 +400,22 @@ class FrameProcessingStatus:
         return self._frame_processor.frame_analyzer != FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER
 
     def activate_live_analysis(self):
-        if self._frame_processor.frame_analyzer != self._live_frame_analyzer:
-            self._frame_processor.frame_analyzer = self._live_frame_analyzer
+        with self._analyzer_lock:
+            if unwrap_frame_analyzer(self._frame_processor.frame_analyzer) != self._live_frame_analyzer:
+                self._frame_processor.frame_analyzer = self._wrap_live_analyzer(self._live_frame_analyzer)
 
-            event = FrameProcessingStatusChangeEvent(self, True, False)
-            self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed, event)
+                event = FrameProcessingStatusChangeEvent(self, True, False)
+                self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed,
+                                       event)
 
     def deactivate_live_analysis(self):
-        if self._frame_processor.frame_analyzer != FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
-            self._frame_processor.frame_analyzer = FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER
+        with self._analyzer_lock:
+            if self._frame_processor.frame_analyzer != FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
+                self._frame_processor.frame_analyzer = FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER
 
-            event = FrameProcessingStatusChangeEvent(self, False, True)
-            self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed, event)
+                event = FrameProcessingStatusChangeEvent(self, False, True)
+                self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed,
+                                       event)
 
     def add_frame_processing_status_change_listener(self, listener: FrameProcessingStatusChangeListener):
         self._listeners.append(listener)
@@ -196,8 +426,144 @@ class FrameProcessingStatus:
     def has_frame_processing_status_change_listener(self, listener: FrameProcessingStatusChangeListener) -> bool:
         return listener in self._listeners
 
+    def add_overlay_listener(self, listener: OverlayListener):
+        self._overlay_listeners.append(listener)
+
+    def remove_overlay_listener(self, listener: OverlayListener):
+        self._overlay_listeners.remove(listener)
+
+    def has_overlay_listener(self, listener: OverlayListener) -> bool:
+        return listener in self._overlay_listeners
+
+    def _wrap_live_analyzer(self, analyzer: FrameAnalyzer) -> FrameAnalyzer:
+        if self._analyzer_batch_size > 1 and supports_batch_analysis(analyzer):
+            analyzer = BatchingFrameAnalyzer(analyzer, self._analyzer_batch_size, self._analyzer_batch_latency)
+
+        # Modifications providing shapes are drawn by the display instead of being drawn into every frame
+        analyzer = TimedFrameAnalyzer(analyzer, self._on_live_frame_analyzed, self._on_live_frame_modified)
+        if self._deadline_scheduling:
+            analyzer = DeadlineFrameAnalyzer(analyzer, self._scheduler)
+
+        overlay_analyzer = OverlayFrameAnalyzer(analyzer, self._overlays_enabled, self._on_live_frame_snapshot)
+        overlay_analyzer.add_overlay_listener(self._overlay_listener)
+
+        return overlay_analyzer
+
+    def _on_live_frame_analyzed(self, num_frame: int, analysis_time: float):
+        analyzed = perf_counter()
+        self._latency_tracker.frame_started(num_frame, analyzed - analysis_time)
+        self._latency_tracker.record(PipelineStage.ANALYSIS, analysis_time)
+        self._latency_tracker.frame_checkpoint(num_frame, analyzed)
+
+        if self._auto_tuner is not None:
+            decision = self._auto_tuner.record_analysis(analysis_time)
+            if decision is not None:
+                self._apply_tuning(decision)
+
+        if not self._first_live_analysis_logged and self._startup_time is not None:
+            self._first_live_analysis_logged = True
+
+            LIVIA_BENCHMARK_LOGGER.info(f"startup,first_analyzed_frame,{perf_counter() - self._startup_time:.3f},"
+                                        f"{analysis_time:.3f}")
+
+    def _on_live_frame_snapshot(self, num_frame: int, frame: ndarray):
+        with self._pending_snapshots_lock:
+            self._pending_snapshots.append((num_frame, frame))
+
+    def _take_snapshot(self, num_frame: int, frame: ndarray) -> ndarray:
+        # Snapshots of older frames are discarded too, as those frames were already displayed or dropped
+        with self._pending_snapshots_lock:
+            snapshot = next((snapshot for snapshot_frame, snapshot in self._pending_snapshots
+                             if snapshot_frame == num_frame), None)
+
+            pending = [entry for entry in self._pending_snapshots if entry[0] > num_frame]
+            self._pending_snapshots.clear()
+            self._pending_snapshots.extend(pending)
+
+        return snapshot if snapshot is not None else frame
+
+    def _on_live_frame_modified(self, num_frame: int, modification_time: float):
+        self._latency_tracker.record(PipelineStage.MODIFICATION, modification_time)
+        self._latency_tracker.frame_checkpoint(num_frame, perf_counter())
+
+    def _apply_tuning(self, decision: AutoTuningDecision):
+        applied = self._set_processor_property("num_threads", decision.num_threads)
+        applied = self._set_processor_property("modification_persistence", decision.modification_persistence) \
+            and applied
+
+        if not applied and not self._unsupported_tuning_logged:
+            self._unsupported_tuning_logged = True
+            LIVIA_GUI_LOGGER.warning("The frame processor can not be tuned at runtime. Tuned values are only reported")
+
+        LIVIA_GUI_LOGGER.info(f"Analysis tuned to {decision.num_threads} threads and a modification persistence of "
+                              f"{decision.modification_persistence} frames: {decision.reason}")
+        LIVIA_BENCHMARK_LOGGER.info(f"tuning,{decision.num_threads},{decision.modification_persistence},"
+                                    f"{decision.analysis_latency:.4f},{decision.frame_rate:.2f}")
+
+        old = self._tuning_decision
+        self._tuning_decision = decision
+
+        event = FrameProcessingStatusChangeEvent(self, decision, old)
+        self._listeners.notify(FrameProcessingStatusChangeListener.analyzer_tuning_changed, event)
+
+    def _set_processor_property(self, name: str, value: int) -> bool:
+        # Only settable properties are used, as setting a plain attribute would be silently ignored by the processor
+        attribute = getattr(type(self._frame_processor), name, None)
+
+        if isinstance(attribute, property) and attribute.fset is not None:
+            if getattr(self._frame_processor, name) != value:
+                setattr(self._frame_processor, name, value)
+            return True
+        else:
+            return False
+
+    def _on_overlay_changed(self, event: OverlayEvent):
+        # Overlays are published instead of modifying the frame, so it is the end of the modification stage
+        self._latency_tracker.frame_checkpoint(event.num_frame, perf_counter())
+        self._overlay_listeners.notify(OverlayListener.overlay_changed, event)
+
+    def _is_deadline_scheduled(self, frame_input: FrameInput) -> bool:
+        return self._deadline_scheduling and isinstance(frame_input, DeviceFrameInput)
+
+    def _wrap_input(self, frame_input: FrameInput) -> FrameInput:
+        # Frames are stamped as soon as they are read, so the budget covers all the time until their analysis
+        if self._is_deadline_scheduled(frame_input):
+            return StampedFrameInput(frame_input, self._scheduler.frame_captured)
+        else:
+            return frame_input
+
+    def _update_scheduler(self, frame_input: FrameInput):
+        self._scheduler.enabled = self._is_deadline_scheduled(frame_input)
+
+        if self._scheduler.enabled:
+            try:
+                fps = frame_input.get_fps() or DEFAULT_FPS
+            except Exception:
+                fps = DEFAULT_FPS
+
+            self._scheduler.latency_budget = self._latency_budget_frames / fps
+
+    def _on_process_started(self, event: ProcessChangeEvent):
+        self._scheduler.reset_statistics()
+        self._latency_tracker.reset()
+
+    def _on_process_ended(self, event: ProcessChangeEvent):
+        self._latency_tracker.log()
+
+        if self._scheduler.enabled:
+            statistics = self._scheduler.get_statistics()
+            LIVIA_BENCHMARK_LOGGER.info(f"scheduling,{statistics.captured},{statistics.analyzed},{statistics.reused},"
+                                        f"{statistics.dropped},{statistics.in_flight},{statistics.max_wait_msec:.1f}")
+
     def _on_input_changed(self, event: IOChangeEvent[FrameInput]):
-        event = FrameProcessingStatusChangeEvent(self, event.new, event.old)
+        new_input, old_input = unwrap_frame_input(event.new), unwrap_frame_input(event.old)
+        self._update_scheduler(new_input)
+
+        # Frame numbers of the new input would match snapshots of the old one
+        with self._pending_snapshots_lock:
+            self._pending_snapshots.clear()
+
+        event = FrameProcessingStatusChangeEvent(self, new_input, old_input)
         self._listeners.notify(FrameProcessingStatusChangeListener.frame_input_changed, event)
 
     def _on_output_changed(self, event: IOChangeEvent[FrameOutput]):
@@ -205,51 +571,46 @@ class FrameProcessingStatus:
         self._listeners.notify(FrameProcessingStatusChangeListener.frame_output_changed, event)
 
     def _on_analyzer_changed(self, event: FrameAnalyzerChangeEvent):
-        if event.new != FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
-            self._live_frame_analyzer = event.new
+        new_analyzer = unwrap_frame_analyzer(event.new)
+        old_analyzer = unwrap_frame_analyzer(event.old)
+
+        if isinstance(event.old, OverlayFrameAnalyzer):
+            event.old.remove_overlay_listener(self._overlay_listener)
 
-            change_event = FrameProcessingStatusChangeEvent(self, event.new, event.old)
+        if new_analyzer != FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
+            self._live_frame_analyzer = new_analyzer
+
+            change_event = FrameProcessingStatusChangeEvent(self, new_analyzer, old_analyzer)
             self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_changed, change_event)
 
-        if event.new == FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
+            self._close_replaced_analyzer(old_analyzer, new_analyzer, self._live_analyzer_pool)
+
+        if new_analyzer == FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
             activation_event = FrameProcessingStatusChangeEvent(self, False, True)
             self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed,
                                    activation_event)
-        elif event.old == FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
+        elif old_analyzer == FrameProcessingStatus.NO_CHANGE_LIVE_ANALYZER:
             activation_event = FrameProcessingStatusChangeEvent(self, True, False)
             self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_activation_changed,
                                    activation_event)
 
     def _build_live_analyzer(self):
         if self._active_live_analyzer_configuration_index < len(self._live_analyzer_configurations):
+            configuration = self._live_analyzer_configurations[self._active_live_analyzer_configuration_index]
             analyzer_metadata: FrameAnalyzerMetadata = FrameAnalyzerManager.get_metadata_by_id(
-                self._live_analyzer_configurations[self._active_live_analyzer_configuration_index].analyzer_id)
+                configuration.analyzer_id)
 
             if analyzer_metadata in FrameAnalyzerManager.list_analyzers():
-                analyzer = analyzer_metadata.analyzer_class()
-
-                if isinstance(self._live_frame_analyzer, analyzer_metadata.analyzer_class):
-                    analyzer_old = self._live_frame_analyzer
-
-                    for prop in analyzer_metadata.properties:
-                        prop.set_value(analyzer, prop.get_value(analyzer_old))
-
-                for prop in analyzer_metadata.properties:
-                    for modified_prop in self._live_analyzer_configurations[
-                        self._active_live_analyzer_configuration_index].parameters:
-                        if modified_prop[0].id == prop.id:
-                            prop.set_value(analyzer, modified_prop[1])
-
-                if self.is_live_analysis_active():
-                    # self._live_frame_analyzer will be updated in _on_analyzer_changed event
-                    self._frame_processor.frame_analyzer = analyzer
-                else:
-                    old = self._live_frame_analyzer
-                    self._live_frame_analyzer = analyzer
+                if self._update_analyzer_in_place(True, analyzer_metadata, configuration):
+                    return
 
-                    event = FrameProcessingStatusChangeEvent(self, self._live_frame_analyzer, old)
-                    self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_changed, event)
+                with self._analyzer_lock:
+                    self._live_build_id += 1
+                    self._pending_builds += 1
+                    build_id = self._live_build_id
 
+                self._live_build_executor.submit(self._build_analyzer, True, build_id, analyzer_metadata,
+                                                 configuration)
             else:
                 LIVIA_GUI_LOGGER.exception("Error Configuring live analyzer")
         else:
@@ -257,31 +618,284 @@ class FrameProcessingStatus:
 
     def _build_static_analyzer(self):
         if self._active_static_analyzer_configuration_index < len(self._static_analyzer_configurations):
+            configuration = self._static_analyzer_configurations[self._active_static_analyzer_configuration_index]
             analyzer_metadata: FrameAnalyzerMetadata = FrameAnalyzerManager.get_metadata_by_id(
-                self._static_analyzer_configurations[self._active_static_analyzer_configuration_index].analyzer_id)
+                configuration.analyzer_id)
 
             if analyzer_metadata in FrameAnalyzerManager.list_analyzers():
-                analyzer = analyzer_metadata.analyzer_class()
+                if self._update_analyzer_in_place(False, analyzer_metadata, configuration):
+                    return
 
-                if isinstance(self._static_frame_analyzer, analyzer_metadata.analyzer_class):
-                    analyzer_old = self._static_frame_analyzer
+                with self._analyzer_lock:
+                    self._static_build_id += 1
+                    self._pending_builds += 1
+                    build_id = self._static_build_id
 
-                    for prop in analyzer_metadata.properties:
-                        prop.set_value(analyzer, prop.get_value(analyzer_old))
+                self._static_build_executor.submit(self._build_analyzer, False, build_id, analyzer_metadata,
+                                                   configuration)
+            else:
+                LIVIA_GUI_LOGGER.exception("Error Configuring static analyzer")
+        else:
+            LIVIA_GUI_LOGGER.exception("Error static analyzer configuration not found")
+
+    def _build_analyzer(self, live: bool, build_id: int, analyzer_metadata: FrameAnalyzerMetadata,
+                        configuration: FrameAnalyzerConfiguration):
+        try:
+            self._run_build(live, build_id, analyzer_metadata, configuration)
+        finally:
+            with self._analyzer_lock:
+                self._pending_builds -= 1
+
+    def _run_build(self, live: bool, build_id: int, analyzer_metadata: FrameAnalyzerMetadata,
+                   configuration: FrameAnalyzerConfiguration):
+        # Runs in the build worker. Meanwhile, the previous analyzer keeps processing frames.
+        if not self._is_current_build(live, build_id):
+            self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.CANCELLED, live))
+            return
+
+        self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.BUILDING, live))
+
+        pool = self._live_analyzer_pool if live else self._static_analyzer_pool
+        start = perf_counter()
+        try:
+            analyzer, reused = self._get_analyzer(
+                pool, analyzer_metadata, configuration,
+                self._live_frame_analyzer if live else self._static_frame_analyzer,
+                self._analyzer_workers if live and self._analyzer_backend == AnalyzerBackend.PROCESS else None
+            )
+
+            warm_up_frames = self._get_warm_up_frames() if not reused else []
+            if len(warm_up_frames) > 0:
+                self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.WARMING_UP, live))
+                self._warm_up(analyzer, warm_up_frames)
+        except Exception as error:
+            LIVIA_GUI_LOGGER.exception("Error building analyzer " + configuration.analyzer_id)
+            pool.evict(configuration.fingerprint())
+
+            self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.FAILED, live,
+                                                  build_time=perf_counter() - start, error=error))
+            return
+
+        build_time = perf_counter() - start
+
+        with self._analyzer_lock:
+            if not self._is_current_build(live, build_id):
+                # Another configuration was activated meanwhile. The analyzer stays pooled for later.
+                self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.CANCELLED, live,
+                                                      analyzer=analyzer, build_time=build_time, reused=reused))
+                return
+
+            if live:
+                self._live_applied_configuration = configuration.copy()
+                self._set_live_analyzer(analyzer)
+            else:
+                self._static_applied_configuration = configuration.copy()
+                self._set_static_analyzer(analyzer, configuration.fingerprint())
+
+        LIVIA_GUI_LOGGER.info(f"Analyzer {configuration.analyzer_id} ready in {build_time:.3f} s "
+                              f"({'reused' if reused else 'built'})")
+        self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.FINISHED, live,
+                                              analyzer=analyzer, build_time=build_time, reused=reused))
+
+    def _update_analyzer_in_place(self, live: bool, analyzer_metadata: FrameAnalyzerMetadata,
+                                  configuration: FrameAnalyzerConfiguration) -> bool:
+        # Changes of properties not requiring a new analyzer (e.g. colors or labels) are set on the analyzer in use,
+        # which is cheaper than building a new one and reloading its model
+        with self._analyzer_lock:
+            if live:
+                applied, analyzer, pool = \
+                    self._live_applied_configuration, self._live_frame_analyzer, self._live_analyzer_pool
+            else:
+                applied, analyzer, pool = \
+                    self._static_applied_configuration, self._static_frame_analyzer, self._static_analyzer_pool
 
-                for prop in analyzer_metadata.properties:
-                    for modified_prop in self._static_analyzer_configurations[
-                        self._active_static_analyzer_configuration_index].parameters:
-                        if modified_prop[0].id == prop.id:
-                            prop.set_value(analyzer, modified_prop[1])
+            if applied is None or applied.analyzer_id != configuration.analyzer_id \
+                    or not isinstance(analyzer, analyzer_metadata.analyzer_class):
+                return False
 
-                old = self._static_frame_analyzer
-                self._static_frame_analyzer = analyzer
+            new_fingerprint = configuration.fingerprint()
+            if pool.contains(new_fingerprint):
+                # The pooled analyzer is already configured
+                return False
 
-                event = FrameProcessingStatusChangeEvent(self, self._static_frame_analyzer, old)
-                self._listeners.notify(FrameProcessingStatusChangeListener.static_frame_analyzer_changed, event)
+            changes = FrameProcessingStatus._get_changed_properties(analyzer_metadata, applied, configuration)
+            if any(requires_analyzer_rebuild(prop) for prop, _ in changes):
+                return False
 
+            start = perf_counter()
+
+            # Pending builds would replace the updated analyzer
+            if live:
+                self._live_build_id += 1
             else:
-                LIVIA_GUI_LOGGER.exception("Error Configuring static analyzer")
+                self._static_build_id += 1
+
+            for prop, value in changes:
+                prop.set_value(analyzer, value)
+
+            pool.rekey(applied.fingerprint(), new_fingerprint)
+
+            if live:
+                self._live_applied_configuration = configuration.copy()
+            else:
+                self._static_applied_configuration = configuration.copy()
+                self._static_analyzer_fingerprint = new_fingerprint
+
+        LIVIA_GUI_LOGGER.info(f"Analyzer {configuration.analyzer_id} updated in place: "
+                              f"{', '.join(prop.id for prop, _ in changes) or 'no changes'}")
+        self._notify_build(AnalyzerBuildEvent(self, configuration, AnalyzerBuildStage.UPDATED, live,
+                                              analyzer=analyzer, build_time=perf_counter() - start, reused=True))
+
+        return True
+
+    @staticmethod
+    def _get_changed_properties(analyzer_metadata: FrameAnalyzerMetadata, old: FrameAnalyzerConfiguration,
+                                new: FrameAnalyzerConfiguration) -> List[Tuple[FrameAnalyzerPropertyMetadata, Any]]:
+        old_values = {prop.id: value for prop, value in old.parameters}
+        new_values = {prop.id: value for prop, value in new.parameters}
+
+        changes = []
+        for prop in analyzer_metadata.properties:
+            if prop.id in new_values:
+                if prop.id not in old_values or not FrameProcessingStatus._same_value(old_values[prop.id],
+                                                                                     new_values[prop.id]):
+                    changes.append((prop, new_values[prop.id]))
+            elif prop.id in old_values:
+                # A new analyzer would have the default value
+                changes.append((prop, prop.default_value))
+
+        return changes
+
+    @staticmethod
+    def _same_value(old: Any, new: Any) -> bool:
+        # Files are reopened when configurations are edited or loaded
+        if isinstance(old, IOBase) and isinstance(new, IOBase):
+            return getattr(old, "name", None) == getattr(new, "name", None)
         else:
-            LIVIA_GUI_LOGGER.exception("Error static analyzer configuration not found")
+            return old == new
+
+    @staticmethod
+    def _get_pooled_fingerprints(configurations: List[FrameAnalyzerConfiguration],
+                                 applied: Optional[FrameAnalyzerConfiguration]) -> List[str]:
+        # The analyzer in use is kept, as it may be updated in place to match one of the new configurations
+        fingerprints = [configuration.fingerprint() for configuration in configurations]
+        if applied is not None:
+            fingerprints.append(applied.fingerprint())
+
+        return fingerprints
+
+    def _is_current_build(self, live: bool, build_id: int) -> bool:
+        return build_id == (self._live_build_id if live else self._static_build_id)
+
+    def _get_warm_up_frames(self) -> List[Tuple[int, ndarray]]:
+        if self._analyzer_warm_up_frames < 1:
+            return []
+
+        frames = [(num_frame, frame.copy()) for num_frame, frame in self._recent_frames]
+
+        if len(frames) == 0 and self._warm_up_with_blank_frames:
+            # Nothing was displayed yet (e.g. on startup), so blank frames with the input size are analyzed
+            try:
+                width, height = self.frame_input.get_frame_size()
+                frames = [(0, np.zeros((height, width, 3), dtype=np.uint8))] * self._analyzer_warm_up_frames
+            except Exception:
+                LIVIA_GUI_LOGGER.warning("Input frame size is not available. Analyzer will not be warmed up")
+
+        return frames[-self._analyzer_warm_up_frames:]
+
+    @staticmethod
+    def _warm_up(analyzer: FrameAnalyzer, frames: List[Tuple[int, ndarray]]):
+        # First analyses usually pay for lazy initializations (e.g. model loading or kernel compilation)
+        for num_frame, frame in frames:
+            analyzer.analyze(num_frame, frame)
+
+    def _set_live_analyzer(self, analyzer: FrameAnalyzer):
+        if self.is_live_analysis_active():
+            # Swapping the processor analyzer is atomic. self._live_frame_analyzer will be updated in
+            # _on_analyzer_changed event.
+            self._frame_processor.frame_analyzer = self._wrap_live_analyzer(analyzer)
+        else:
+            old = self._live_frame_analyzer
+            self._live_frame_analyzer = analyzer
+
+            event = FrameProcessingStatusChangeEvent(self, self._live_frame_analyzer, old)
+            self._listeners.notify(FrameProcessingStatusChangeListener.live_frame_analyzer_changed, event)
+
+            self._close_replaced_analyzer(old, analyzer, self._live_analyzer_pool)
+
+    def _set_static_analyzer(self, analyzer: FrameAnalyzer, fingerprint: Optional[str]):
+        old = self._static_frame_analyzer
+        self._static_frame_analyzer = analyzer
+        self._static_analyzer_fingerprint = fingerprint
+
+        event = FrameProcessingStatusChangeEvent(self, self._static_frame_analyzer, old)
+        self._listeners.notify(FrameProcessingStatusChangeListener.static_frame_analyzer_changed, event)
+
+        self._close_replaced_analyzer(old, analyzer, self._static_analyzer_pool)
+
+    def _reset_static_analyzer(self):
+        with self._analyzer_lock:
+            # Pending static builds are discarded
+            self._static_build_id += 1
+            old = self._static_frame_analyzer
+            self._static_frame_analyzer = NoChangeFrameAnalyzer()
+            self._static_analyzer_fingerprint = None
+            self._static_applied_configuration = None
+
+        self._close_replaced_analyzer(old, self._static_frame_analyzer, self._static_analyzer_pool)
+
+    @staticmethod
+    def _close_replaced_analyzer(old: FrameAnalyzer, new: FrameAnalyzer, pool: FrameAnalyzerPool):
+        # Analyzers evicted from the pool while they were in use are closed once they are replaced
+        if old is not new and not pool.contains_analyzer(old):
+            try:
+                close_frame_analyzer(old)
+            except Exception:
+                LIVIA_GUI_LOGGER.exception("Replaced analyzer could not be closed")
+
+    def _notify_build(self, event: AnalyzerBuildEvent):
+        self._listeners.notify(FrameProcessingStatusChangeListener.analyzer_build_changed, event)
+
+    @staticmethod
+    def _get_analyzer(pool: FrameAnalyzerPool, analyzer_metadata: FrameAnalyzerMetadata,
+                      configuration: FrameAnalyzerConfiguration,
+                      analyzer_old: FrameAnalyzer,
+                      process_workers: Optional[int] = None) -> Tuple[FrameAnalyzer, bool]:
+        configured_values = {prop.id: value for prop, value in configuration.parameters}
+
+        def build_analyzer() -> FrameAnalyzer:
+            if process_workers is not None:
+                spec = FrameAnalyzerSpec(analyzer_metadata.analyzer_class, analyzer_metadata.id, configured_values)
+                return build_process_frame_analyzer(spec, process_workers)
+
+            new_analyzer = analyzer_metadata.analyzer_class()
+
+            for prop in analyzer_metadata.properties:
+                if prop.id in configured_values:
+                    prop.set_value(new_analyzer, configured_values[prop.id])
+
+            return new_analyzer
+
+        analyzer, reused = pool.get_or_create(configuration.fingerprint(), build_analyzer)
+
+        if not isinstance(analyzer, analyzer_metadata.analyzer_class):
+            # Analyzers running in other processes are configured when they are built
+            return analyzer, reused
+
+        # Properties not present in the configuration are inherited from the previous analyzer of the same class, and
+        # pooled analyzers may have been changed while they were in use (e.g. their threshold)
+        inherit = analyzer is not analyzer_old and isinstance(analyzer_old, analyzer_metadata.analyzer_class)
+
+        for prop in analyzer_metadata.properties:
+            if prop.id in configured_values:
+                value = configured_values[prop.id]
+            elif inherit:
+                value = prop.get_value(analyzer_old)
+            else:
+                continue
+
+            # Reopened files are the same value, so file-backed properties are not set (and reloaded) again
+            if not FrameProcessingStatus._same_value(prop.get_value(analyzer), value):
+                prop.set_value(analyzer, value)
+
+        return analyzer, reused
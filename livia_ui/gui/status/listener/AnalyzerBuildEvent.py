@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia_ui.gui.configuration.FrameAnalyzerConfiguration import FrameAnalyzerConfiguration
+from livia_ui.gui.status.AnalyzerBuildStage import AnalyzerBuildStage
+
+if TYPE_CHECKING:
+    from livia_ui.gui.status.FrameProcessingStatus import FrameProcessingStatus
+
+
+class AnalyzerBuildEvent:
+    def __init__(self, status: FrameProcessingStatus, configuration: FrameAnalyzerConfiguration,
+                 stage: AnalyzerBuildStage, live: bool,
+                 analyzer: Optional[FrameAnalyzer] = None,
+                 build_time: Optional[float] = None,
+                 reused: bool = False,
+                 error: Optional[BaseException] = None):
+        self._status: FrameProcessingStatus = status
+        self._configuration: FrameAnalyzerConfiguration = configuration
+        self._stage: AnalyzerBuildStage = stage
+        self._live: bool = live
+        self._analyzer: Optional[FrameAnalyzer] = analyzer
+        self._build_time: Optional[float] = build_time
+        self._reused: bool = reused
+        self._error: Optional[BaseException] = error
+
+    @property
+    def status(self) -> FrameProcessingStatus:
+        return self._status
+
+    @property
+    def configuration(self) -> FrameAnalyzerConfiguration:
+        return self._configuration
+
+    @property
+    def stage(self) -> AnalyzerBuildStage:
+        return self._stage
+
+    @property
+    def live(self) -> bool:
+        return self._live
+
+    @property
+    def analyzer(self) -> Optional[FrameAnalyzer]:
+        return self._analyzer
+
+    @property
+    def build_time(self) -> Optional[float]:
+        # Seconds spent building (and warming up) the analyzer, available when the build finished or failed
+        return self._build_time
+
+    @property
+    def reused(self) -> bool:
+        return self._reused
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        return self._error
@@ -19,3 +19,6 @@ class DisplayStatusChangeListener(EventListener):
 
     def hide_controls_fullscreen_changed(self, event: DisplayStatusChangeEvent[bool]):
         pass
+
+    def performance_hud_changed(self, event: DisplayStatusChangeEvent[bool]):
+        pass
@@ -0,0 +1,7 @@
+from livia.process.listener.EventListener import EventListener
+from livia_ui.gui.status.FrameProcessingSample import FrameProcessingSample
+
+
+class FrameProcessingSampleListener(EventListener):
+    def sampled(self, sample: FrameProcessingSample):
+        pass
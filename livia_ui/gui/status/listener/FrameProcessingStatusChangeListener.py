@@ -5,6 +5,8 @@ from livia.output.FrameOutput import FrameOutput
 from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 from livia.process.listener.EventListener import EventListener
 from livia_ui.gui.configuration.FrameAnalyzerConfiguration import FrameAnalyzerConfiguration
+from livia_ui.gui.status.listener.AnalyzerBuildEvent import AnalyzerBuildEvent
+from livia_ui.process.analyzer.AutoTuningDecision import AutoTuningDecision
 from livia_ui.gui.status.listener.FrameProcessingStatusChangeEvent import FrameProcessingStatusChangeEvent
 
 
@@ -38,3 +40,8 @@ class FrameProcessingStatusChangeListener(EventListener):
     def static_frame_analyzer_configuration_index_changed(self, event: FrameProcessingStatusChangeEvent[int]):
         pass
 
+    def analyzer_build_changed(self, event: AnalyzerBuildEvent):
+        pass
+
+    def analyzer_tuning_changed(self, event: FrameProcessingStatusChangeEvent[AutoTuningDecision]):
+        pass
@@ -72,8 +72,9 @@ class DefaultBottomToolBarBuilder(BottomToolBarBuilder):
         self._change_video_bar_visibility_signal.disconnect(self._on_change_video_bar_visibility_signal)
 
     def _build_video_bar(self):
-        frame_processor = self._livia_status.video_stream_status.frame_processor
-        self._video_bar = VideoBar(frame_processor, self._parent_widget)
+        video_stream_status = self._livia_status.video_stream_status
+        self._video_bar = VideoBar(video_stream_status.frame_processor, video_stream_status.sampler,
+                                   self._parent_widget)
         self._video_bar.setContentsMargins(0, 0, 0, 0)
 
         return self._video_bar
@@ -40,6 +40,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
     _check_play_action_signal: Signal = Signal(bool)
     _check_fullscreen_action_signal: Signal = Signal(bool)
     _check_resizable_action_signal: Signal = Signal(bool)
+    _check_performance_hud_action_signal: Signal = Signal(bool)
     _toggle_video_analyzer_action_signal: Signal = Signal(bool)
     _check_video_analyzer_action_signal: Signal = Signal(bool)
     _enable_analyze_image_action_signal: Signal = Signal(bool)
@@ -72,6 +73,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._fullscreen_action: QAction = None
         self._hide_controls_fullscreen_action: QAction = None
         self._resizable_action: QAction = None
+        self._performance_hud_action: QAction = None
         self._configure_shortcuts_action: QAction = None
         self._configure_video_analyzer_action: QAction = None
         self._configure_image_analyzer_action: QAction = None
@@ -103,6 +105,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._release_device_action.triggered.connect(self._on_release_device)
         self._quit_action.triggered.connect(self._on_quit)
         self._resizable_action.triggered.connect(self._on_toggle_resizable)
+        self._performance_hud_action.triggered.connect(self._on_toggle_performance_hud)
         self._fullscreen_action.triggered.connect(self._on_toggle_fullscreen)
         self._hide_controls_fullscreen_action.triggered.connect(self._on_toggle_hide_controls_fullscreen)
         self._toggle_video_analyzer_action.triggered.connect(self._on_toggle_live_video_analysis)
@@ -116,6 +119,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._check_play_action_signal.connect(self._on_check_play_action_signal)
         self._check_fullscreen_action_signal.connect(self._on_check_play_action_signal)
         self._check_resizable_action_signal.connect(self._on_check_fullscreen_action_signal)
+        self._check_performance_hud_action_signal.connect(self._on_check_performance_hud_action_signal)
         self._toggle_video_analyzer_action_signal.connect(self._on_toggle_video_analyzer_action_signal)
         self._enable_analyze_image_action_signal.connect(self._on_enable_analyze_image_action_signal)
 
@@ -124,6 +128,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
             build_listener(DisplayStatusChangeListener,
                            fullscreen_changed=self._on_fullscreen_changed,
                            resizable_changed=self._on_resizable_changed,
+                           performance_hud_changed=self._on_performance_hud_changed,
                            hide_controls_fullscreen_changed=self._on_hide_controls_fullscreen_changed
                            )
         )
@@ -157,6 +162,7 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._check_play_action_signal.disconnect(self._on_check_play_action_signal)
         self._check_fullscreen_action_signal.disconnect(self._on_check_play_action_signal)
         self._check_resizable_action_signal.disconnect(self._on_check_fullscreen_action_signal)
+        self._check_performance_hud_action_signal.disconnect(self._on_check_performance_hud_action_signal)
         self._toggle_video_analyzer_action_signal.disconnect(self._on_toggle_video_analyzer_action_signal)
         self._enable_analyze_image_action_signal.disconnect(self._on_enable_analyze_image_action_signal)
 
@@ -276,6 +282,14 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._resizable_action.setChecked(self._livia_status.display_status.resizable)
         self._resizable_action.setObjectName("_menu_bar__resizable_action")
         self._resizable_action.setText(self._translate("Resizable"))
+        self._performance_hud_action = QAction(self._livia_window)
+        self._performance_hud_action.setShortcuts(self._get_shortcuts(DefaultShortcutAction.TOGGLE_PERFORMANCE_HUD))
+        self._shortcuts_widgets[self._performance_hud_action] = self._get_shortcuts(
+            DefaultShortcutAction.TOGGLE_PERFORMANCE_HUD)
+        self._performance_hud_action.setCheckable(True)
+        self._performance_hud_action.setChecked(self._livia_status.display_status.performance_hud)
+        self._performance_hud_action.setObjectName("_menu_bar__performance_hud_action")
+        self._performance_hud_action.setText(self._translate("Performance HUD"))
 
         self._view_menu = QMenu(self._parent_widget)
         self._view_menu.setObjectName("_menu_bar__view_menu")
@@ -283,6 +297,8 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         self._view_menu.addAction(self._fullscreen_action)
         self._view_menu.addAction(self._hide_controls_fullscreen_action)
         self._view_menu.addAction(self._resizable_action)
+        self._view_menu.addSeparator()
+        self._view_menu.addAction(self._performance_hud_action)
 
         self._parent_widget.addAction(self._view_menu.menuAction())
 
@@ -383,6 +399,9 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
     def _on_toggle_resizable(self):
         self._livia_status.display_status.toggle_resizable()
 
+    def _on_toggle_performance_hud(self):
+        self._livia_status.display_status.toggle_performance_hud()
+
     def _on_toggle_fullscreen(self):
         self._livia_status.display_status.toggle_fullscreen()
 
@@ -417,6 +436,10 @@ class DefaultMenuBarBuilder(MenuBarBuilder):
         if self._resizable_action.isChecked() != event.value:
             self._check_resizable_action_signal.emit(event.value)
 
+    def _on_performance_hud_changed(self, event: DisplayStatusChangeEvent):
+        if self._performance_hud_action.isChecked() != event.value:
+            self._check_performance_hud_action_signal.emit(event.value)
+
     def _on_video_started(self, event: ProcessChangeEvent):
         if not self._play_action.isChecked():
             self._check_play_action_signal.emit(True)
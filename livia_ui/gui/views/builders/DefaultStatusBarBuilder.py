@@ -13,10 +13,15 @@ from livia.output.FileFrameOutput import FileFrameOutput
 from livia.process.listener import build_listener
 from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
 from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+from livia_ui.gui.status.AnalyzerBuildStage import AnalyzerBuildStage
+from livia_ui.gui.status.listener.AnalyzerBuildEvent import AnalyzerBuildEvent
 from livia_ui.gui.status.listener.DisplayStatusChangeEvent import DisplayStatusChangeEvent
 from livia_ui.gui.status.listener.DisplayStatusChangeListener import DisplayStatusChangeListener
+from livia_ui.gui.status.listener.FrameProcessingStatusChangeEvent import FrameProcessingStatusChangeEvent
+from livia_ui.gui.status.listener.FrameProcessingStatusChangeListener import FrameProcessingStatusChangeListener
 from livia_ui.gui.views.builders.GuiBuilderFactory import GuiBuilderFactory
 from livia_ui.gui.views.builders.StatusBarBuilder import StatusBarBuilder
+from livia_ui.process.analyzer.AutoTuningDecision import AutoTuningDecision
 
 if TYPE_CHECKING:
     from livia_ui.gui.LiviaWindow import LiviaWindow
@@ -24,6 +29,7 @@ if TYPE_CHECKING:
 
 class DefaultStatusBarBuilder(StatusBarBuilder):
     _update_status_signal: Signal = Signal(str)
+    _update_tuning_signal: Signal = Signal(str, str)
 
     @staticmethod
     def factory() -> GuiBuilderFactory[StatusBarBuilder]:
@@ -39,6 +45,7 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
         self._recording_file: str = None
 
         self._status_label: QLabel = None
+        self._tuning_label: QLabel = None
         self._recording_panel: QWidget = None
         self._record_button: QToolButton = None
         self._record_settings_button: QToolButton = None
@@ -53,6 +60,7 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
         self._build_status_label()
 
         self._parent_widget.addWidget(self._status_label)
+        self._parent_widget.addPermanentWidget(self._build_tuning_label())
         self._parent_widget.addPermanentWidget(self._build_recording_panel())
 
     def _connect_widgets(self):
@@ -61,6 +69,7 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
 
     def _connect_signals(self):
         self._update_status_signal.connect(self._on_update_status_signal)
+        self._update_tuning_signal.connect(self._on_update_tuning_signal)
         self._recording_timer.timeout.connect(self.__update_recording_timer)
 
     def _listen_livia(self):
@@ -82,6 +91,13 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
                            )
         )
 
+        self._livia_status.video_stream_status.add_frame_processing_status_change_listener(
+            build_listener(FrameProcessingStatusChangeListener,
+                           analyzer_build_changed=self._on_analyzer_build_changed,
+                           analyzer_tuning_changed=self._on_analyzer_tuning_changed
+                           )
+        )
+
     def _after_init(self):
         display_status = self._livia_status.display_status
         if display_status.fullscreen and display_status.hide_controls_fullscreen:
@@ -89,12 +105,20 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
 
     def _disconnect_signals(self):
         self._update_status_signal.disconnect(self._on_update_status_signal)
+        self._update_tuning_signal.disconnect(self._on_update_tuning_signal)
 
     def _build_status_label(self):
         self._status_label = QLabel()
         self._status_label.setObjectName("_status_bar__status_label")
         self._status_label.setText(self._translate("Starting System"))
 
+    def _build_tuning_label(self) -> QLabel:
+        self._tuning_label = QLabel()
+        self._tuning_label.setObjectName("_status_bar__tuning_label")
+        self._tuning_label.setVisible(False)
+
+        return self._tuning_label
+
     def _build_recording_panel(self) -> QWidget:
         self._recording_panel = QWidget()
         self._recording_panel.setObjectName("_status_bar__recording_panel")
@@ -137,6 +161,12 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
     def _on_update_status_signal(self, status: str):
         self._status_label.setText(self._translate(status))
 
+    @Slot(str, str)
+    def _on_update_tuning_signal(self, text: str, reason: str):
+        self._tuning_label.setText(text)
+        self._tuning_label.setToolTip(reason)
+        self._tuning_label.setVisible(True)
+
     def _on_video_stream_started(self, event: ProcessChangeEvent):
         self._livia_status.display_status.status_message = "Video started"
 
@@ -152,6 +182,25 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
     def _on_video_stream_finished(self, event: ProcessChangeEvent):
         self._livia_status.display_status.status_message = "Video finished"
 
+    def _on_analyzer_build_changed(self, event: AnalyzerBuildEvent):
+        if event.stage == AnalyzerBuildStage.BUILDING:
+            self._livia_status.display_status.status_message = "Loading analyzer"
+        elif event.stage == AnalyzerBuildStage.WARMING_UP:
+            self._livia_status.display_status.status_message = "Warming up analyzer"
+        elif event.stage == AnalyzerBuildStage.FINISHED:
+            self._livia_status.display_status.status_message = "Analyzer ready"
+        elif event.stage == AnalyzerBuildStage.UPDATED:
+            self._livia_status.display_status.status_message = "Analyzer updated"
+        elif event.stage == AnalyzerBuildStage.FAILED:
+            self._livia_status.display_status.status_message = "Error loading analyzer"
+
+    def _on_analyzer_tuning_changed(self, event: FrameProcessingStatusChangeEvent[AutoTuningDecision]):
+        decision = event.new
+        text = self._translate("Threads: ") + str(decision.num_threads) + " | " + \
+            self._translate("Persistence: ") + str(decision.modification_persistence)
+
+        self._update_tuning_signal.emit(text, decision.reason)
+
     def _on_status_message_change(self, event: DisplayStatusChangeEvent[str]):
         self._update_status_signal.emit(event.value)
 
@@ -195,6 +244,8 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
         self._file_frame_output = FileFrameOutput(self._recording_file,
                                                   self._livia_status.video_stream_status.frame_input.get_fps(), x, y)
 
+        # Recorded frames must contain the analysis results, so they cannot be left to the display
+        self._livia_status.video_stream_status.overlays_enabled = False
         self._livia_status.video_stream_status.frame_output = \
             CompositeFrameOutput(self._file_frame_output, self._livia_status.video_stream_status.frame_output)
 
@@ -206,6 +257,7 @@ class DefaultStatusBarBuilder(StatusBarBuilder):
             self._file_frame_output.close()
             self._file_frame_output = None
             self._composite_frame_output = None
+            self._livia_status.video_stream_status.overlays_enabled = True
         else:
             raise RuntimeError('frame_output does not contain the recording output')
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from collections import deque
-from time import time
-from typing import Deque, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from PySide2.QtCore import QLocale, Qt, Slot, Signal
 from PySide2.QtGui import QFont
@@ -19,21 +17,19 @@ from livia.process.analyzer.listener.ThresholdChangeListener import ThresholdCha
 from livia.process.listener import build_listener
 from livia.process.listener.IOChangeEvent import IOChangeEvent
 from livia.process.listener.IOChangeListener import IOChangeListener
-from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
-from livia.process.listener.ProcessChangeListener import ProcessChangeListener
 from livia_ui.gui import LIVIA_GUI_LOGGER
+from livia_ui.gui.status.FrameProcessingSample import FrameProcessingSample
 from livia_ui.gui.status.listener.DisplayStatusChangeEvent import DisplayStatusChangeEvent
 from livia_ui.gui.status.listener.DisplayStatusChangeListener import DisplayStatusChangeListener
+from livia_ui.gui.status.listener.FrameProcessingSampleListener import FrameProcessingSampleListener
 from livia_ui.gui.views.builders.GuiBuilderFactory import GuiBuilderFactory
 from livia_ui.gui.views.builders.TopToolBarBuilder import TopToolBarBuilder
 from livia_ui.gui.views.utils.BorderLayout import BorderLayout
+from livia_ui.process.analyzer import unwrap_frame_analyzer
 
 if TYPE_CHECKING:
     from livia_ui.gui.LiviaWindow import LiviaWindow
 
-_FRAMES_DEQUE_SIZE: int = 100
-_MIN_FRAMES_IN_DEQUE: int = 5
-
 
 class DefaultTopToolBarBuilder(TopToolBarBuilder):
     _update_progress_signal: Signal = Signal(int)
@@ -54,7 +50,8 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
 
     def __init__(self, livia_window: LiviaWindow, *args, **kwargs):
         super(DefaultTopToolBarBuilder, self).__init__(livia_window, *args, **kwargs)
-        self._last_frames_time: Deque[float] = deque([], _FRAMES_DEQUE_SIZE)
+        self._last_progress: int = -1
+        self._last_fps: float = -1.0
 
         self._progress_bar: QProgressBar = None
         self._fps_counter: QLCDNumber = None
@@ -89,11 +86,8 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
 
     def _listen_livia(self):
         frame_processor = self._livia_status.video_stream_status.frame_processor
-        frame_processor.add_process_change_listener(
-            build_listener(ProcessChangeListener,
-                           resumed=self._on_stream_resumed,
-                           started=self._on_stream_started,
-                           frame_outputted=self._on_frame_outputted)
+        self._livia_status.video_stream_status.sampler.add_sample_listener(
+            build_listener(FrameProcessingSampleListener, sampled=self._on_processing_sampled)
         )
 
         frame_processor.add_io_change_listener(
@@ -177,7 +171,7 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
         layout.addWidget(self._threshold_label)
         layout.addWidget(self._threshold_spin)
 
-        analyzer = self._livia_status.video_stream_status.frame_processor.frame_analyzer
+        analyzer = unwrap_frame_analyzer(self._livia_status.video_stream_status.frame_processor.frame_analyzer)
         if isinstance(analyzer, HasThreshold):
             self._threshold_spin.setValue(analyzer.threshold)
             self._threshold_spin.setMaximum(analyzer.max_threshold)
@@ -255,20 +249,18 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
     def _on_hide_progress_signal(self):
         self._progress_bar.hide()
 
-    def _on_stream_started(self, event: ProcessChangeEvent):
-        self._reset_fps()
-
-    def _on_stream_resumed(self, event: ProcessChangeEvent):
-        self._reset_fps()
+    def _on_processing_sampled(self, sample: FrameProcessingSample):
+        # Samples are received at a fixed rate, so signals are only emitted for the values that changed
+        if sample.output_fps != self._last_fps:
+            self._last_fps = sample.output_fps
+            self._update_fps_signal.emit(sample.output_fps)
 
-    def _on_frame_outputted(self, event: ProcessChangeEvent):
-        self._last_frames_time.append(time())
-        self._update_fps()
-        self._update_progress_signal.emit(
-            self._livia_status.video_stream_status.frame_input.get_current_frame_index() + 1)
+        if sample.frame_index is not None and sample.frame_index + 1 != self._last_progress:
+            self._last_progress = sample.frame_index + 1
+            self._update_progress_signal.emit(self._last_progress)
 
     def _on_input_changed(self, event: IOChangeEvent[FrameInput]):
-        self._reset_fps()
+        self._last_progress = -1
 
         if isinstance(event.old, SeekableFrameInput):
             self._hide_progress_signal.emit()
@@ -276,8 +268,8 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
             self._show_progress_signal.emit(event.new.get_current_frame_index() + 1, event.new.get_length_in_frames())
 
     def _on_analyzer_changed(self, event: FrameAnalyzerChangeEvent):
-        old_analyzer = event.old
-        new_analyzer = event.new
+        old_analyzer = unwrap_frame_analyzer(event.old)
+        new_analyzer = unwrap_frame_analyzer(event.new)
 
         if isinstance(old_analyzer, HasThreshold):
             was_threshold_visible = True
@@ -298,7 +290,7 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
         self._change_threshold_signal.emit(event.new)
 
     def _on_threshold_spin_value_changed(self):
-        analyzer = self._livia_status.video_stream_status.frame_processor.frame_analyzer
+        analyzer = unwrap_frame_analyzer(self._livia_status.video_stream_status.frame_processor.frame_analyzer)
         if isinstance(analyzer, HasThreshold):
             analyzer.threshold = self._threshold_spin.value()
         else:
@@ -313,13 +305,3 @@ class DefaultTopToolBarBuilder(TopToolBarBuilder):
 
     def _change_visibility(self, visible: bool):
         self._parent_widget.setVisible(visible)
-
-    def _update_fps(self):
-        frames = len(self._last_frames_time)
-        if frames >= _MIN_FRAMES_IN_DEQUE:
-            elapsed = self._last_frames_time[-1] - self._last_frames_time[0]
-            self._update_fps_signal.emit(frames / elapsed)
-
-    def _reset_fps(self):
-        self._last_frames_time.clear()
-        self._update_fps_signal.emit(0.0)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from time import perf_counter
+from typing import List, Optional, TYPE_CHECKING, Tuple, Union
 
+from PySide2.QtCore import Signal, Slot, QTimer
 from PySide2.QtGui import QImage
 from PySide2.QtWidgets import QVBoxLayout
 from numpy import ndarray
 
+from livia.input.FileFrameInput import FileFrameInput
+from livia.input.FrameInput import FrameInput
 from livia.output.CallbackFrameOutput import CallbackFrameOutput
 from livia.output.CompositeFrameOutput import CompositeFrameOutput
 from livia.output.FrameOutput import FrameOutput
@@ -13,32 +17,54 @@ from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
 from livia.process.listener import build_listener
 from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
 from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui import LIVIA_GUI_LOGGER
 from livia_ui.gui.status.listener.DisplayStatusChangeEvent import DisplayStatusChangeEvent
 from livia_ui.gui.status.listener.DisplayStatusChangeListener import DisplayStatusChangeListener
 from livia_ui.gui.status.listener.FrameProcessingStatusChangeEvent import FrameProcessingStatusChangeEvent
 from livia_ui.gui.status.listener.FrameProcessingStatusChangeListener import FrameProcessingStatusChangeListener
 from livia_ui.gui.views.builders.GuiBuilderFactory import GuiBuilderFactory
 from livia_ui.gui.views.builders.VideoPanelBuilder import VideoPanelBuilder
+from livia_ui.gui.views.utils.GLVideoPanel import GLVideoPanel
+from livia_ui.gui.views.utils.PerformanceMonitor import PerformanceMonitor
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
 from livia_ui.gui.views.utils.VideoPanel import VideoPanel
+from livia_ui.gui.views.utils.VideoRenderer import VideoRenderer
+from livia_ui.process.analyzer.listener.OverlayEvent import OverlayEvent
+from livia_ui.process.analyzer.listener.OverlayListener import OverlayListener
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
 
 if TYPE_CHECKING:
     from livia_ui.gui.LiviaWindow import LiviaWindow
 
+DEFAULT_PERFORMANCE_HUD_REFRESH_MSEC: int = 250
+
 
 class DefaultVideoPanelBuilder(VideoPanelBuilder):
+    _show_performance_hud_signal: Signal = Signal(bool)
+    _update_presentation_smoothing_signal: Signal = Signal(bool)
+    _update_scaling_quality_signal: Signal = Signal(object)
+
     @staticmethod
-    def factory() -> GuiBuilderFactory[VideoPanelBuilder]:
+    def factory(renderer: VideoRenderer = VideoRenderer.SOFTWARE) -> GuiBuilderFactory[VideoPanelBuilder]:
         class DefaultGuiBuilderFactory(GuiBuilderFactory[VideoPanelBuilder]):
             def create_builder(self, *args, **kwargs) -> DefaultVideoPanelBuilder:
-                return DefaultVideoPanelBuilder(*args, **kwargs)
+                return DefaultVideoPanelBuilder(*args, renderer=renderer, **kwargs)
 
         return DefaultGuiBuilderFactory()
 
-    def __init__(self, livia_window: LiviaWindow, *args, **kwargs):
+    def __init__(self, livia_window: LiviaWindow, *args, renderer: VideoRenderer = VideoRenderer.SOFTWARE, **kwargs):
         super(DefaultVideoPanelBuilder, self).__init__(livia_window, *args, **kwargs)
-        self._video_panel: VideoPanel = None
+        self._renderer: VideoRenderer = renderer
+        self._layout: QVBoxLayout = None
+        self._video_panel: Union[VideoPanel, GLVideoPanel] = None
         self._last_image: Optional[QImage] = None
         self._live_frame_analyzer: FrameAnalyzer = None
+        self._overlay: Optional[Tuple[int, List[OverlayShape]]] = None
+
+        # The HUD is refreshed a few times per second from a snapshot, instead of on every frame
+        self._performance_monitor: Optional[PerformanceMonitor] = None
+        self._performance_hud_timer: Optional[QTimer] = None
 
         self._frame_output_callback: CallbackFrameOutput = CallbackFrameOutput(
             output_frame_callback=self._on_show_frame
@@ -47,37 +73,93 @@ class DefaultVideoPanelBuilder(VideoPanelBuilder):
     def _build_widgets(self):
         self._live_frame_analyzer = self._livia_window.status.video_stream_status.live_frame_analyzer
 
-        layout = QVBoxLayout(self._parent_widget)
+        self._layout = QVBoxLayout(self._parent_widget)
 
         self._parent_widget.setContentsMargins(0, 0, 0, 0)
-        layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        self._performance_monitor = PerformanceMonitor(self._livia_status.video_stream_status)
+        self._performance_hud_timer = QTimer(self)
+        self._performance_hud_timer.setInterval(DEFAULT_PERFORMANCE_HUD_REFRESH_MSEC)
+
+        self._layout.addWidget(self._build_video_panel())
+
+    def _connect_widgets(self):
+        self._performance_hud_timer.timeout.connect(self._on_refresh_performance_hud)
+
+    def _connect_signals(self):
+        self._show_performance_hud_signal.connect(self._on_show_performance_hud_signal)
+        self._update_presentation_smoothing_signal.connect(self._on_update_presentation_smoothing_signal)
+        self._update_scaling_quality_signal.connect(self._on_update_scaling_quality_signal)
+
+    def _after_init(self):
+        if self._livia_status.display_status.performance_hud:
+            self._on_show_performance_hud_signal(True)
 
-        layout.addWidget(self._build_video_panel())
+    def _disconnect_signals(self):
+        self._show_performance_hud_signal.disconnect(self._on_show_performance_hud_signal)
+        self._update_presentation_smoothing_signal.disconnect(self._on_update_presentation_smoothing_signal)
+        self._update_scaling_quality_signal.disconnect(self._on_update_scaling_quality_signal)
 
     def _listen_livia(self):
         self._add_frame_output_callback()
 
         self._livia_status.video_stream_status.add_frame_processing_status_change_listener(
             build_listener(FrameProcessingStatusChangeListener,
+                           frame_input_changed=self._on_frame_input_changed,
                            frame_output_changed=self._on_frame_output_changed)
         )
 
         self._livia_status.display_status.add_display_status_change_listener(
             build_listener(DisplayStatusChangeListener,
-                           resizable_changed=self._on_resizable_changed)
+                           resizable_changed=self._on_resizable_changed,
+                           performance_hud_changed=self._on_performance_hud_changed)
+        )
+
+        self._livia_status.video_stream_status.add_overlay_listener(
+            build_listener(OverlayListener,
+                           overlay_changed=self._on_overlay_changed)
         )
 
         self._livia_status.video_stream_status.frame_processor.add_process_change_listener(
             build_listener(ProcessChangeListener,
+                           started=self._on_stream_playing,
+                           resumed=self._on_stream_playing,
+                           paused=self._on_stream_still,
+                           stopped=self._on_stream_still,
                            finished=self._on_stream_finished)
         )
 
-    def _build_video_panel(self) -> VideoPanel:
-        self._video_panel = VideoPanel(self._livia_status.display_status.resizable, self._parent_widget)
+    def _build_video_panel(self) -> Union[VideoPanel, GLVideoPanel]:
+        resizable = self._livia_status.display_status.resizable
+
+        if self._renderer == VideoRenderer.OPENGL and GLVideoPanel.is_available():
+            self._video_panel = GLVideoPanel(resizable, self._current_scaling_quality(), self._parent_widget)
+            self._video_panel.renderer_failed.connect(self._on_renderer_failed)
+        else:
+            if self._renderer == VideoRenderer.OPENGL:
+                LIVIA_GUI_LOGGER.warning("OpenGL is not available. Software video renderer will be used")
+
+            self._video_panel = VideoPanel(resizable, self._current_scaling_quality(), self._parent_widget)
+
         self._video_panel.setObjectName("_video_panel__video_label")
+        self._video_panel.set_presentation_smoothing(
+            DefaultVideoPanelBuilder._is_presentation_smoothed(self._livia_status.video_stream_status.frame_input)
+        )
+        self._video_panel.set_latency_tracker(self._livia_status.video_stream_status.latency_tracker)
+        self._performance_monitor.video_panel = self._video_panel
 
         return self._video_panel
 
+    def _on_renderer_failed(self):
+        LIVIA_GUI_LOGGER.warning("OpenGL video renderer failed. Software video renderer will be used")
+
+        failed_panel = self._video_panel
+        self._renderer = VideoRenderer.SOFTWARE
+
+        self._layout.replaceWidget(failed_panel, self._build_video_panel())
+        failed_panel.deleteLater()
+
     def _add_frame_output_callback(self):
         frame_output = self._livia_status.video_stream_status.frame_output
 
@@ -89,17 +171,80 @@ class DefaultVideoPanelBuilder(VideoPanelBuilder):
             self._livia_status.video_stream_status.frame_output
         )
 
+    @staticmethod
+    def _is_presentation_smoothed(frame_input: Optional[FrameInput]) -> bool:
+        # Smoothing delays frames, which is only acceptable for files. Live inputs show the newest frame
+        return isinstance(frame_input, FileFrameInput)
+
+    def _on_frame_input_changed(self, event: FrameProcessingStatusChangeEvent[FrameInput]):
+        self._update_presentation_smoothing_signal.emit(DefaultVideoPanelBuilder._is_presentation_smoothed(event.new))
+
+    @Slot(bool)
+    def _on_update_presentation_smoothing_signal(self, smoothing: bool):
+        self._video_panel.set_presentation_smoothing(smoothing)
+
     def _on_frame_output_changed(self, event: FrameProcessingStatusChangeEvent[FrameOutput]):
         if isinstance(event.old, CompositeFrameOutput):
             event.old.remove_output(self._frame_output_callback)
 
         self._add_frame_output_callback()
 
+    def _on_overlay_changed(self, event: OverlayEvent):
+        self._overlay = (event.num_frame, event.shapes)
+
     def _on_show_frame(self, num_frame: int, frame: ndarray):
-        self._video_panel.show_frame(frame)
+        video_stream_status = self._livia_status.video_stream_status
+        video_stream_status.latency_tracker.frame_reached(num_frame, PipelineStage.OUTPUT, perf_counter())
+        video_stream_status.set_last_displayed_frame(num_frame, frame)
+
+        # Overlays are published while the frame is being modified, just before it is sent to the outputs
+        overlay = self._overlay
+        if overlay is not None and overlay[0] == num_frame:
+            self._video_panel.show_frame(frame, overlay[1], num_frame)
+        else:
+            self._video_panel.show_frame(frame, num_frame=num_frame)
+
+    def _current_scaling_quality(self) -> ScalingQuality:
+        # Fast scaling keeps up with playback, while a still image deserves the best quality
+        frame_processor = self._livia_status.video_stream_status.frame_processor
+
+        if frame_processor.is_running() and not frame_processor.is_paused():
+            return ScalingQuality.FAST
+        else:
+            return ScalingQuality.HIGH
+
+    # Process events may come from the processor thread, so the panel is updated in the GUI thread
+    def _on_stream_playing(self, event: ProcessChangeEvent):
+        self._update_scaling_quality_signal.emit(ScalingQuality.FAST)
+
+    def _on_stream_still(self, event: ProcessChangeEvent):
+        self._update_scaling_quality_signal.emit(ScalingQuality.HIGH)
 
     def _on_stream_finished(self, event: ProcessChangeEvent):
+        self._update_scaling_quality_signal.emit(ScalingQuality.HIGH)
         self._video_panel.clear_frame()
+        self._livia_status.video_stream_status.clear_last_displayed_frame()
+
+    @Slot(object)
+    def _on_update_scaling_quality_signal(self, scaling_quality: ScalingQuality):
+        self._video_panel.set_scaling_quality(scaling_quality)
 
     def _on_resizable_changed(self, event: DisplayStatusChangeEvent):
         self._video_panel.set_image_resizable(event.value)
+
+    def _on_performance_hud_changed(self, event: DisplayStatusChangeEvent):
+        self._show_performance_hud_signal.emit(event.value)
+
+    @Slot(bool)
+    def _on_show_performance_hud_signal(self, show: bool):
+        if show:
+            self._performance_monitor.reset()
+            self._on_refresh_performance_hud()
+            self._performance_hud_timer.start()
+        else:
+            self._performance_hud_timer.stop()
+            self._video_panel.set_performance_snapshot(None)
+
+    @Slot()
+    def _on_refresh_performance_hud(self):
+        self._video_panel.set_performance_snapshot(self._performance_monitor.snapshot())
@@ -1,12 +1,42 @@
-from PySide2.QtCore import Qt, QCoreApplication
-from PySide2.QtWidgets import QDialog, QVBoxLayout
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Optional, Tuple
 
+from PySide2.QtCore import Qt, QCoreApplication, QTimer, Signal, Slot, QElapsedTimer
+from PySide2.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QProgressBar, QLabel, QPushButton, QWidget
+from numpy import ndarray
+
+from livia.input.FrameInput import FrameInput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.listener import build_listener
+from livia_ui.gui import LIVIA_GUI_LOGGER
 from livia_ui.gui.status.FrameProcessingStatus import FrameProcessingStatus
+from livia_ui.gui.status.listener.FrameProcessingStatusChangeEvent import FrameProcessingStatusChangeEvent
+from livia_ui.gui.status.listener.FrameProcessingStatusChangeListener import FrameProcessingStatusChangeListener
 from livia_ui.gui.views.utils.ImagePanel import ImagePanel
+from livia_ui.process.analyzer.modification.HasOverlayShapes import HasOverlayShapes
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+DEFAULT_ANALYSIS_TIMEOUT_MSEC: int = 60000
+DEFAULT_CACHE_SIZE: int = 8
+
+# Result of an analysis: the frame to show and its overlay, if any
+_AnalysisResult = Tuple[ndarray, Optional[List[OverlayShape]]]
+
+# Cached results are identified by the input they come from, the frame index and the analyzer fingerprint
+_CacheKey = Tuple[int, int, str]
 
 
 class AnalyzeImageDialog(QDialog):
-    def __init__(self, video_stream_status: FrameProcessingStatus, *args, **kwargs):
+    _analysis_started_signal: Signal = Signal(int)
+    _analysis_finished_signal: Signal = Signal(int, object)
+    _analysis_failed_signal: Signal = Signal(int, str)
+    _input_changed_signal: Signal = Signal()
+
+    def __init__(self, video_stream_status: FrameProcessingStatus,
+                 timeout_msec: int = DEFAULT_ANALYSIS_TIMEOUT_MSEC,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 *args, **kwargs):
         super(AnalyzeImageDialog, self).__init__(*args, **kwargs)
         self.setWindowTitle(QCoreApplication.translate(self.__class__.__name__, "Image Analysis"))
         self.setWindowModality(Qt.ApplicationModal)
@@ -14,25 +44,234 @@ class AnalyzeImageDialog(QDialog):
         self._video_stream_status: FrameProcessingStatus = video_stream_status
         self._image_panel: ImagePanel = ImagePanel()
 
+        # Analyzers are not expected to be thread-safe, so static analyses are run one at a time
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1,
+                                                                thread_name_prefix="livia-static-analysis")
+        self._future: Optional[Future] = None
+        self._analysis_id: int = 0
+
+        # Running analysis that was cancelled or timed out. It can not be interrupted, so new analyses wait for it.
+        self._abandoned_future: Optional[Future] = None
+
+        # Frame indexes of different inputs (or of the same device opened again) do not refer to the same image
+        self._input_id: int = 0
+        self._cache: "OrderedDict[_CacheKey, _AnalysisResult]" = OrderedDict()
+        self._cache_size: int = cache_size
+
+        self._elapsed_timer: QElapsedTimer = QElapsedTimer()
+        self._timeout_msec: int = timeout_msec
+        self._timeout_timer: QTimer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._progress_timer: QTimer = QTimer(self)
+        self._progress_timer.setInterval(100)
+
+        self._progress_panel: QWidget = QWidget(self)
+        self._progress_bar: QProgressBar = QProgressBar(self._progress_panel)
+        self._progress_label: QLabel = QLabel(self._progress_panel)
+        self._cancel_button: QPushButton = QPushButton(
+            QCoreApplication.translate(self.__class__.__name__, "Cancel"), self._progress_panel
+        )
+
+        self._progress_bar.setRange(0, 0)  # Inference progress is unknown, so a busy indicator is shown
+        self._progress_bar.setTextVisible(False)
+
+        progress_layout = QHBoxLayout(self._progress_panel)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        progress_layout.addWidget(self._progress_bar, 1)
+        progress_layout.addWidget(self._progress_label)
+        progress_layout.addWidget(self._cancel_button)
+
         layout = QVBoxLayout()
         layout.addWidget(self._image_panel)
+        layout.addWidget(self._progress_panel)
 
         self.setLayout(layout)
 
+        self._cancel_button.clicked.connect(self._on_cancel)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+        self._progress_timer.timeout.connect(self._update_progress)
+        self._analysis_started_signal.connect(self._on_analysis_started)
+        self._analysis_finished_signal.connect(self._on_analysis_finished)
+        self._analysis_failed_signal.connect(self._on_analysis_failed)
+        self._input_changed_signal.connect(self._on_input_changed)
+
+        self._video_stream_status.add_frame_processing_status_change_listener(
+            build_listener(FrameProcessingStatusChangeListener, frame_input_changed=self._on_frame_input_changed)
+        )
+
     def open(self):
         super(AnalyzeImageDialog, self).open()
         self._analyze_image()
 
+    def done(self, result: int):
+        self._cancel_analysis()
+        super(AnalyzeImageDialog, self).done(result)
+
+    def clear_cache(self):
+        self._cache.clear()
+
     def _analyze_image(self):
-        frame_input = self._video_stream_status.frame_input
-        frame = frame_input.get_current_frame()
-        frame_index = frame_input.get_current_frame_index()
+        self._cancel_analysis()
+
+        # The processor thread owns the input, so the last frame shown (without the live modifications) is analyzed
+        # instead of reading the input
+        snapshot = self._video_stream_status.last_displayed_frame
+
+        if snapshot is None:
+            self._image_panel.clear_frame()
+            self._show_message(self._translate("No frame to analyze"))
+            return
+
+        frame_index, frame = snapshot
+        analyzer, fingerprint = self._video_stream_status.get_static_analyzer()
+        key = (self._input_id, frame_index, fingerprint) if fingerprint is not None else None
+
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            self._show_result(self._cache[key])
+            self._progress_panel.hide()
+            return
+
+        self._analysis_id += 1
+
+        analysis_id = self._analysis_id
+        frame = frame.copy()
+
+        self._image_panel.clear_frame()
+
+        if self._abandoned_future is not None and not self._abandoned_future.done():
+            # The timeout starts with the analysis, not while it waits
+            self._show_waiting()
+        else:
+            self._start_progress()
+
+        self._future = self._executor.submit(self._analyze, analysis_id, analyzer, frame_index, frame)
+        self._future.add_done_callback(lambda future: self._on_future_done(analysis_id, key, future))
+
+    def _analyze(self, analysis_id: int, analyzer: FrameAnalyzer, frame_index: int,
+                 frame: ndarray) -> _AnalysisResult:
+        self._analysis_started_signal.emit(analysis_id)
+
+        modification = analyzer.analyze(frame_index, frame)
+
+        if isinstance(modification, HasOverlayShapes):
+            return frame, modification.get_overlay_shapes()
+        else:
+            return modification.modify(frame_index, frame), None
+
+    def _on_future_done(self, analysis_id: int, key: Optional[_CacheKey], future: Future):
+        # Called from the worker thread, so results are moved to the GUI thread with signals
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            self._analysis_finished_signal.emit(analysis_id, (key, future.result()))
+        else:
+            LIVIA_GUI_LOGGER.error("Error analyzing image", exc_info=error)
+            self._analysis_failed_signal.emit(analysis_id, str(error))
+
+    @Slot(int)
+    def _on_analysis_started(self, analysis_id: int):
+        if analysis_id == self._analysis_id and self._future is not None and not self._timeout_timer.isActive():
+            self._start_progress()
+
+    @Slot(int, object)
+    def _on_analysis_finished(self, analysis_id: int,
+                              keyed_result: Tuple[Optional[_CacheKey], _AnalysisResult]):
+        key, result = keyed_result
+
+        # Results of cancelled or timed out analyses are still cached, as they were already paid for, unless the input
+        # changed meanwhile
+        if key is not None and key[0] == self._input_id:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        if analysis_id != self._analysis_id or self._future is None:
+            return
+
+        self._future = None
+        self._stop_progress()
+        self._progress_panel.hide()
+
+        self._show_result(result)
+
+    @Slot(int, str)
+    def _on_analysis_failed(self, analysis_id: int, message: str):
+        if analysis_id != self._analysis_id or self._future is None:
+            return
+
+        self._future = None
+        self._stop_progress()
+        self._show_message(self._translate("Analysis failed: ") + message)
+
+    def _on_frame_input_changed(self, event: FrameProcessingStatusChangeEvent[FrameInput]):
+        # Called from the thread changing the input, so the cache is cleared in the GUI thread
+        self._input_changed_signal.emit()
+
+    @Slot()
+    def _on_input_changed(self):
+        self._input_id += 1
+        self.clear_cache()
+
+    def _on_cancel(self):
+        self._cancel_analysis()
+        self._show_message(self._translate("Analysis cancelled"))
+
+    def _on_timeout(self):
+        self._cancel_analysis()
+        self._show_message(self._translate("Analysis timed out"))
+
+    def _cancel_analysis(self):
+        if self._future is not None:
+            if not self._future.cancel():
+                # A running inference cannot be interrupted, so it is left to finish and its result is only cached
+                self._abandoned_future = self._future
+
+            self._future = None
+            self._analysis_id += 1
+
+        self._stop_progress()
+
+    def _start_progress(self):
+        self._elapsed_timer.start()
+        self._timeout_timer.start(self._timeout_msec)
+        self._progress_timer.start()
+
+        self._progress_bar.setRange(0, 0)
+        self._progress_bar.show()
+        self._cancel_button.show()
+        self._update_progress()
+        self._progress_panel.show()
+
+    def _show_waiting(self):
+        self._timeout_timer.stop()
+        self._progress_timer.stop()
+
+        self._progress_bar.setRange(0, 0)
+        self._progress_bar.show()
+        self._cancel_button.show()
+        self._progress_label.setText(self._translate("Waiting for the previous analysis to finish..."))
+        self._progress_panel.show()
+
+    def _stop_progress(self):
+        self._timeout_timer.stop()
+        self._progress_timer.stop()
 
-        if frame is not None and frame_index is not None:
-            analyzer = self._video_stream_status.static_frame_analyzer
+    def _update_progress(self):
+        elapsed = self._elapsed_timer.elapsed() / 1000
+        self._progress_label.setText(self._translate("Analyzing... ") + f"{elapsed:.1f} s")
 
-            modification = analyzer.analyze(frame_index, frame)
+    def _show_message(self, message: str):
+        self._progress_bar.hide()
+        self._cancel_button.hide()
+        self._progress_label.setText(message)
+        self._progress_panel.show()
 
-            frame_modified = modification.modify(frame_index, frame)
+    def _show_result(self, result: _AnalysisResult):
+        frame, overlay = result
+        self._image_panel.show_frame(frame, overlay)
 
-            self._image_panel.show_frame(frame_modified)
+    def _translate(self, text: str) -> str:
+        return QCoreApplication.translate(self.__class__.__name__, text)
@@ -0,0 +1,182 @@
+import sys
+from typing import Optional, Dict, Tuple
+
+import cv2
+import numpy as np
+from PySide2.QtGui import QImage
+from numpy import ndarray
+
+from livia_ui.gui import LIVIA_GUI_LOGGER
+
+_LITTLE_ENDIAN: bool = sys.byteorder == "little"
+
+# Format_BGR888 is only available since Qt 5.14
+_FORMAT_BGR888: Optional[QImage.Format] = getattr(QImage, "Format_BGR888", None)
+
+
+class _BufferImage(QImage):
+    # QImage does not own the memory it wraps, so the buffer must be kept alive as long as the image lives
+    def __init__(self, buffer: ndarray, width: int, height: int, bytes_per_line: int, image_format: QImage.Format):
+        super(_BufferImage, self).__init__(buffer.data, width, height, bytes_per_line, image_format)
+        self._buffer: ndarray = buffer
+
+    @property
+    def buffer(self) -> ndarray:
+        return self._buffer
+
+
+class FrameConverter:
+    # Images share the memory of the frame or of a buffer reused by the next conversions, so they are only valid until
+    # the next one in the same thread. Detached images own their memory instead, so they can be used from other
+    # threads (e.g. queued for display) while more frames are converted.
+    def __init__(self, prefer_32_bit: bool = True, detached: bool = False):
+        self._prefer_32_bit: bool = prefer_32_bit and _LITTLE_ENDIAN
+        self._detached: bool = detached
+
+        self._buffers: Dict[Tuple[int, ...], ndarray] = {}
+
+        self._conversions: int = 0
+        self._copies: int = 0
+        self._allocations: int = 0
+
+    @property
+    def prefer_32_bit(self) -> bool:
+        return self._prefer_32_bit
+
+    @property
+    def detached(self) -> bool:
+        return self._detached
+
+    @property
+    def conversions(self) -> int:
+        return self._conversions
+
+    @property
+    def copies(self) -> int:
+        return self._copies
+
+    @property
+    def allocations(self) -> int:
+        return self._allocations
+
+    def reset_statistics(self):
+        self._conversions = 0
+        self._copies = 0
+        self._allocations = 0
+
+    def release_buffers(self):
+        self._buffers.clear()
+
+    def convert(self, frame: Optional[ndarray]) -> Optional[QImage]:
+        if frame is None:
+            return None
+
+        try:
+            if frame.dtype != np.uint8:
+                raise ValueError(f"Unsupported frame type: {frame.dtype}")
+
+            if frame.ndim == 2 or (frame.ndim == 3 and frame.shape[2] == 1):
+                image = self._convert_gray(frame.reshape(frame.shape[:2]))
+            elif frame.ndim == 3 and frame.shape[2] == 3:
+                image = self._convert_bgr(frame)
+            elif frame.ndim == 3 and frame.shape[2] == 4:
+                image = self._convert_bgra(frame)
+            else:
+                raise ValueError(f"Unsupported frame shape: {frame.shape}")
+
+            self._conversions += 1
+
+            return image
+        except (AttributeError, ValueError, cv2.error):
+            LIVIA_GUI_LOGGER.exception("Unknown frame format")
+            return None
+
+    def _convert_gray(self, frame: ndarray) -> QImage:
+        if self._prefer_32_bit:
+            return self._expand_to_32_bit(frame, cv2.COLOR_GRAY2BGRA)
+        else:
+            return self._wrap(frame, QImage.Format_Grayscale8)
+
+    def _convert_bgr(self, frame: ndarray) -> QImage:
+        if self._prefer_32_bit or _FORMAT_BGR888 is None:
+            return self._expand_to_32_bit(frame, cv2.COLOR_BGR2BGRA)
+        else:
+            return self._wrap(frame, _FORMAT_BGR888)
+
+    def _convert_bgra(self, frame: ndarray) -> QImage:
+        if _LITTLE_ENDIAN:
+            # In little endian machines, BGRA memory layout is the ARGB32 layout
+            return self._wrap(frame, QImage.Format_ARGB32)
+        else:
+            return self._wrap(cv2.cvtColor(frame, cv2.COLOR_BGRA2RGBA), QImage.Format_RGBA8888)
+
+    def _expand_to_32_bit(self, frame: ndarray, conversion: int) -> QImage:
+        height, width = frame.shape[:2]
+
+        if self._detached:
+            image, buffer = self._new_image(width, height, 4, QImage.Format_RGB32)
+        else:
+            buffer = self._get_buffer((height, width, 4))
+            image = _BufferImage(buffer, width, height, buffer.strides[0], QImage.Format_RGB32)
+
+        cv2.cvtColor(frame, conversion, dst=buffer)
+        self._copies += 1
+
+        return image
+
+    def _wrap(self, frame: ndarray, image_format: QImage.Format) -> QImage:
+        height, width = frame.shape[:2]
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+
+        if self._detached:
+            image, buffer = self._new_image(width, height, channels, image_format)
+            np.copyto(buffer, frame.reshape(buffer.shape))
+            self._copies += 1
+
+            return image
+
+        if not FrameConverter._has_packed_rows(frame):
+            buffer = self._get_buffer(frame.shape)
+            np.copyto(buffer, frame)
+            self._copies += 1
+            frame = buffer
+
+        # A flat view over the rows (padding included) lets QImage use the original stride without copying
+        row_size = width * channels
+        span = frame.strides[0] * (height - 1) + row_size
+        data = np.lib.stride_tricks.as_strided(frame, shape=(span,), strides=(1,))
+
+        return _BufferImage(data, width, height, frame.strides[0], image_format)
+
+    def _get_buffer(self, shape: Tuple[int, ...]) -> ndarray:
+        buffer = self._buffers.get(shape)
+
+        if buffer is None:
+            # Buffers of older sizes are not useful anymore (e.g. the window or the input changed)
+            self._buffers.clear()
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[shape] = buffer
+            self._allocations += 1
+
+        return buffer
+
+    def _new_image(self, width: int, height: int, channels: int,
+                   image_format: QImage.Format) -> Tuple[QImage, ndarray]:
+        # The image allocates its memory, and the view returned writes the frame into it without intermediate copies
+        image = QImage(width, height, image_format)
+        rows = np.frombuffer(image.bits(), dtype=np.uint8).reshape(height, image.bytesPerLine())
+        self._allocations += 1
+
+        return image, rows[:, :width * channels].reshape((height, width, channels))
+
+    @staticmethod
+    def _has_packed_rows(frame: ndarray) -> bool:
+        height, width = frame.shape[:2]
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+
+        if frame.ndim == 3 and frame.strides[2] != 1:
+            return False
+        if width > 1 and frame.strides[1] != channels:
+            return False
+
+        return height == 1 or frame.strides[0] >= width * channels
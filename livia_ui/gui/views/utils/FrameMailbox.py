@@ -0,0 +1,87 @@
+from threading import Condition
+from typing import Generic, TypeVar, Optional
+
+T = TypeVar('T')
+
+
+class FrameMailbox(Generic[T]):
+    def __init__(self):
+        self._condition: Condition = Condition()
+
+        self._item: Optional[T] = None
+        self._has_item: bool = False
+        self._item_counted: bool = False
+        self._closed: bool = False
+
+        self._received: int = 0
+        self._dropped: int = 0
+
+    def put(self, item: T, counted: bool = True) -> None:
+        with self._condition:
+            if self._has_item and self._item_counted:
+                self._dropped += 1
+
+            if counted:
+                self._received += 1
+
+            self._item = item
+            self._has_item = True
+            self._item_counted = counted
+
+            self._condition.notify()
+
+    def offer(self, item: T) -> bool:
+        with self._condition:
+            if self._has_item:
+                return False
+
+            self._item = item
+            self._has_item = True
+            self._item_counted = False
+
+            self._condition.notify()
+
+            return True
+
+    def take(self, timeout: Optional[float] = None) -> Optional[T]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_item or self._closed, timeout)
+
+            if not self._has_item:
+                return None
+
+            item = self._item
+            self._item = None
+            self._has_item = False
+            self._item_counted = False
+
+            return item
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def has_pending(self) -> bool:
+        return self._has_item
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def backlog(self) -> int:
+        with self._condition:
+            return 1 if self._has_item and self._item_counted else 0
+
+    def reset_statistics(self) -> None:
+        with self._condition:
+            self._received = 0
+            self._dropped = 0
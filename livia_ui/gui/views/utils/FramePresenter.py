@@ -0,0 +1,209 @@
+from collections import deque
+from math import sqrt
+from time import perf_counter
+from typing import Callable, Deque, Generic, Optional, Tuple, TypeVar
+
+from PySide2.QtCore import QObject, QTimer, Qt, Slot
+from PySide2.QtGui import QGuiApplication
+
+from livia_ui.gui.views.utils.PresentationStatistics import PresentationStatistics
+
+_DEFAULT_REFRESH_RATE: float = 60.0
+
+# Bursts are spread over time, but a frame is never held back for longer than these refresh intervals
+_MAX_SMOOTHING_INTERVALS: float = 2.0
+
+# Pending frames beyond this limit are dropped when smoothing, as they could never be presented in time
+_MAX_PENDING_FRAMES: int = 3
+
+# Gaps longer than these refresh intervals are pauses in the stream, not presentation jitter
+_MAX_JITTER_INTERVALS: float = 4.0
+
+_FRAME_INTERVAL_SMOOTHING: float = 0.1
+
+T = TypeVar('T')
+
+
+class FramePresenter(QObject, Generic[T]):
+    # Presents frames at most once per display refresh. Without smoothing (e.g. live inputs), only the newest frame is
+    # kept and it is presented on the next refresh, so the display is never more than one frame behind. Smoothing
+    # (only meant for file inputs) spreads bursts of frames at the stream rate, holding a few of them back.
+    def __init__(self, present: Callable[[Optional[T]], None], refresh_rate: Optional[float] = None,
+                 smoothing: bool = False, *args, **kwargs):
+        super(FramePresenter, self).__init__(*args, **kwargs)
+
+        self._present: Callable[[Optional[T]], None] = present
+        self._smoothing: bool = smoothing
+
+        self._refresh_interval: float = 0.0
+        self.set_refresh_rate(refresh_rate or FramePresenter.detect_refresh_rate())
+
+        # Pending frames as (presentation time, frame timestamp, frame)
+        self._pending: Deque[Tuple[float, float, T]] = deque()
+        self._last_timestamp: Optional[float] = None
+        self._last_target: Optional[float] = None
+        self._frame_interval: Optional[float] = None
+        self._last_present: Optional[float] = None
+
+        self._timer: QTimer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+        self._frames_presented: int = 0
+        self._frames_coalesced: int = 0
+        self._interval_count: int = 0
+        self._interval_mean: float = 0.0
+        self._interval_m2: float = 0.0
+        self._max_deviation: float = 0.0
+        self._latency_sum: float = 0.0
+
+    @staticmethod
+    def detect_refresh_rate() -> float:
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0.0
+
+        return refresh_rate if refresh_rate > 0 else _DEFAULT_REFRESH_RATE
+
+    @property
+    def refresh_rate(self) -> float:
+        return 1.0 / self._refresh_interval
+
+    def set_refresh_rate(self, refresh_rate: float):
+        if refresh_rate <= 0:
+            raise ValueError("refresh_rate must be positive")
+
+        self._refresh_interval = 1.0 / refresh_rate
+
+    @property
+    def smoothing(self) -> bool:
+        return self._smoothing
+
+    @smoothing.setter
+    def smoothing(self, smoothing: bool):
+        if self._smoothing != smoothing:
+            self._smoothing = smoothing
+            self._last_target = None
+
+            # Frames held back by the smoothing are not waited for anymore
+            if not smoothing and self._pending:
+                self._drop_pending(1, perf_counter())
+                self._schedule()
+
+    def submit(self, frame: T, timestamp: Optional[float] = None):
+        now = perf_counter()
+        timestamp = now if timestamp is None else timestamp
+
+        if self._last_timestamp is not None and timestamp > self._last_timestamp:
+            interval = timestamp - self._last_timestamp
+            if self._frame_interval is None:
+                self._frame_interval = interval
+            else:
+                self._frame_interval += _FRAME_INTERVAL_SMOOTHING * (interval - self._frame_interval)
+        self._last_timestamp = timestamp
+
+        if not self._smoothing:
+            # The newest frame replaces the pending one, and it is presented on the next refresh
+            self._pending.append((now, timestamp, frame))
+            self._drop_pending(1, now)
+            self._schedule()
+            return
+
+        # Frames arriving together are spread at the usual frame rate of the stream, with a bounded delay
+        target = max(timestamp, now)
+        if self._last_target is not None and self._frame_interval is not None:
+            target = max(target, min(self._last_target + self._frame_interval,
+                                     now + _MAX_SMOOTHING_INTERVALS * self._refresh_interval))
+        self._last_target = target
+
+        self._pending.append((target, timestamp, frame))
+        if len(self._pending) > _MAX_PENDING_FRAMES:
+            # The stream is faster than the smoothing allows, so the oldest frame is presented as soon as possible
+            self._drop_pending(_MAX_PENDING_FRAMES, now)
+
+        self._schedule()
+
+    def clear(self):
+        self._timer.stop()
+        self._frames_coalesced += len(self._pending)
+        self._pending.clear()
+        self._last_timestamp = None
+        self._last_target = None
+        self._frame_interval = None
+
+        self._present(None)
+
+    def get_statistics(self) -> PresentationStatistics:
+        count = self._interval_count
+        mean = self._interval_mean if count > 0 else 0.0
+        jitter = sqrt(self._interval_m2 / count) if count > 1 else 0.0
+        latency = self._latency_sum / self._frames_presented if self._frames_presented > 0 else 0.0
+
+        return PresentationStatistics(self._frames_presented, self._frames_coalesced, self._refresh_interval * 1000,
+                                      mean * 1000, jitter * 1000, self._max_deviation * 1000, latency * 1000)
+
+    def reset_statistics(self):
+        self._frames_presented = 0
+        self._frames_coalesced = 0
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+        self._max_deviation = 0.0
+        self._latency_sum = 0.0
+
+    def _drop_pending(self, max_pending: int, now: float):
+        while len(self._pending) > max_pending:
+            self._pending.popleft()
+            self._frames_coalesced += 1
+
+        head_target, head_timestamp, head_frame = self._pending[0]
+        if head_target > now:
+            self._pending[0] = (now, head_timestamp, head_frame)
+            self._timer.stop()
+
+    def _schedule(self):
+        if not self._pending or self._timer.isActive():
+            return
+
+        # Presentations are never closer than a display refresh
+        due = self._pending[0][0]
+        if self._last_present is not None:
+            due = max(due, self._last_present + self._refresh_interval)
+
+        self._timer.start(max(0, round((due - perf_counter()) * 1000)))
+
+    @Slot()
+    def _on_timeout(self):
+        now = perf_counter()
+
+        pending = None
+        while self._pending and self._pending[0][0] <= now:
+            if pending is not None:
+                self._frames_coalesced += 1
+            pending = self._pending.popleft()
+
+        if pending is None:
+            self._schedule()
+            return
+
+        target, timestamp, frame = pending
+        self._record_presentation(now, timestamp)
+        self._present(frame)
+
+        self._schedule()
+
+    def _record_presentation(self, now: float, timestamp: float):
+        if self._last_present is not None:
+            interval = now - self._last_present
+
+            if interval <= _MAX_JITTER_INTERVALS * self._refresh_interval:
+                # Welford's online algorithm, so the statistics take constant memory
+                self._interval_count += 1
+                delta = interval - self._interval_mean
+                self._interval_mean += delta / self._interval_count
+                self._interval_m2 += delta * (interval - self._interval_mean)
+                self._max_deviation = max(self._max_deviation, abs(interval - self._interval_mean))
+
+        self._last_present = now
+        self._frames_presented += 1
+        self._latency_sum += now - timestamp
@@ -0,0 +1,54 @@
+from typing import Dict, Tuple
+
+import cv2
+import numpy as np
+from numpy import ndarray
+
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
+
+
+class FrameScaler:
+    def __init__(self):
+        self._buffers: Dict[Tuple[int, ...], ndarray] = {}
+
+    def scale(self, frame: ndarray, width: int, height: int, quality: ScalingQuality = ScalingQuality.FAST) -> ndarray:
+        if frame.ndim == 3 and frame.shape[2] == 1:
+            frame = frame.reshape(frame.shape[:2])
+
+        frame_height, frame_width = frame.shape[:2]
+        target_width, target_height = FrameScaler.fit_size(frame_width, frame_height, width, height)
+
+        if (target_width, target_height) == (frame_width, frame_height):
+            return frame
+
+        shrinking = target_width < frame_width
+        if quality == ScalingQuality.HIGH:
+            interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_CUBIC
+        else:
+            interpolation = cv2.INTER_LINEAR
+
+        buffer = self._get_buffer((target_height, target_width) + frame.shape[2:])
+
+        return cv2.resize(frame, (target_width, target_height), dst=buffer, interpolation=interpolation)
+
+    def release_buffers(self):
+        self._buffers.clear()
+
+    def _get_buffer(self, shape: Tuple[int, ...]) -> ndarray:
+        buffer = self._buffers.get(shape)
+
+        if buffer is None:
+            self._buffers.clear()
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[shape] = buffer
+
+        return buffer
+
+    @staticmethod
+    def fit_size(width: int, height: int, max_width: int, max_height: int) -> Tuple[int, int]:
+        if width <= 0 or height <= 0 or max_width <= 0 or max_height <= 0:
+            return width, height
+
+        ratio = min(max_width / width, max_height / height)
+
+        return max(1, round(width * ratio)), max(1, round(height * ratio))
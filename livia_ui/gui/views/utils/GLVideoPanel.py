@@ -0,0 +1,531 @@
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide2.QtCore import Qt, Signal, Slot, QCoreApplication, QTimer, QRect
+from PySide2.QtGui import QOpenGLContext, QOffscreenSurface, QOpenGLShaderProgram, QOpenGLShader, QOpenGLTexture, \
+    QOpenGLBuffer, QOpenGLVertexArrayObject, QOpenGLPixelTransferOptions, QVector2D, QPainter
+from PySide2.QtWidgets import QOpenGLWidget, QSizePolicy
+from numpy import ndarray
+
+from livia_ui.benchmarking.PipelineLatencyTracker import PipelineLatencyTracker
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui import LIVIA_GUI_LOGGER
+from livia_ui.gui.views.utils.FrameMailbox import FrameMailbox
+from livia_ui.gui.views.utils.FramePresenter import FramePresenter
+from livia_ui.gui.views.utils.OverlayRenderer import OverlayRenderer
+from livia_ui.gui.views.utils.PerformanceHud import PerformanceHud
+from livia_ui.gui.views.utils.PerformanceSnapshot import PerformanceSnapshot
+from livia_ui.gui.views.utils.PresentationStatistics import PresentationStatistics
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
+from livia_ui.gui.views.utils.VideoPanelStatistics import VideoPanelStatistics
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+_GL_FLOAT: int = 0x1406
+_GL_TRIANGLE_STRIP: int = 0x0005
+_GL_COLOR_BUFFER_BIT: int = 0x4000
+
+# Number of a frame and the moment it was taken from the mailbox
+_ReceivedFrame = Tuple[int, float]
+
+_VERTEX_SHADER: str = """
+attribute vec2 a_position;
+uniform vec2 u_scale;
+varying vec2 v_texcoord;
+
+void main() {
+    v_texcoord = vec2(a_position.x + 1.0, 1.0 - a_position.y) * 0.5;
+    gl_Position = vec4(a_position * u_scale, 0.0, 1.0);
+}
+"""
+
+# Frames are uploaded with their memory layout (BGR or gray), so the channels are arranged here. Gray textures are red
+# or luminance ones, which both have the value in the red channel.
+_FRAGMENT_SHADER: str = """
+#ifdef GL_ES
+precision mediump float;
+#endif
+
+uniform sampler2D u_texture;
+uniform float u_gray;
+varying vec2 v_texcoord;
+
+void main() {
+    vec4 texel = texture2D(u_texture, v_texcoord);
+    gl_FragColor = vec4(mix(texel.bgr, texel.rrr, u_gray), 1.0);
+}
+"""
+
+_QUAD: ndarray = np.array([-1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+
+# Formats used for each number of channels: (texture format, source format)
+_TextureFormats = Dict[int, Tuple[QOpenGLTexture.TextureFormat, QOpenGLTexture.PixelFormat]]
+
+_TEXTURE_FORMATS: _TextureFormats = {
+    1: (QOpenGLTexture.R8_UNorm, QOpenGLTexture.Red),
+    3: (QOpenGLTexture.RGB8_UNorm, QOpenGLTexture.RGB),
+    4: (QOpenGLTexture.RGBA8_UNorm, QOpenGLTexture.RGBA)
+}
+
+# Formats for contexts without red textures (OpenGL 2.1 or OpenGL ES 2.0). OpenGL ES 2.0 only has unsized formats.
+_LEGACY_TEXTURE_FORMATS: _TextureFormats = {
+    1: (QOpenGLTexture.LuminanceFormat, QOpenGLTexture.Luminance),
+    3: (QOpenGLTexture.RGB8_UNorm, QOpenGLTexture.RGB),
+    4: (QOpenGLTexture.RGBA8_UNorm, QOpenGLTexture.RGBA)
+}
+_ES2_TEXTURE_FORMATS: _TextureFormats = {
+    1: (QOpenGLTexture.LuminanceFormat, QOpenGLTexture.Luminance),
+    3: (QOpenGLTexture.RGBFormat, QOpenGLTexture.RGB),
+    4: (QOpenGLTexture.RGBAFormat, QOpenGLTexture.RGBA)
+}
+
+_PIXEL_BUFFER_COUNT: int = 2
+
+_available: Optional[bool] = None
+
+
+class GLVideoPanel(QOpenGLWidget):
+    renderer_failed: Signal = Signal()
+
+    _frame_available_signal: Signal = Signal()
+    _scaling_quality_signal: Signal = Signal(object)
+
+    @staticmethod
+    def is_available() -> bool:
+        global _available
+
+        if _available is None:
+            _available = GLVideoPanel._check_availability()
+
+        return _available
+
+    @staticmethod
+    def _check_availability() -> bool:
+        context = QOpenGLContext()
+        if not context.create():
+            return False
+
+        surface = QOffscreenSurface()
+        surface.setFormat(context.format())
+        surface.create()
+
+        try:
+            if not surface.isValid() or not context.makeCurrent(surface):
+                return False
+
+            return QOpenGLShaderProgram.hasOpenGLShaderPrograms(context)
+        finally:
+            context.doneCurrent()
+            surface.destroy()
+
+    def __init__(self, resize_image: bool = True, scaling_quality: ScalingQuality = ScalingQuality.FAST,
+                 *args, **kwargs):
+        super(GLVideoPanel, self).__init__(*args, **kwargs)
+
+        self._resize_image: bool = resize_image
+        self._scaling_quality: ScalingQuality = scaling_quality
+
+        self._mailbox: FrameMailbox = FrameMailbox()
+        self._presenter: FramePresenter[Tuple[ndarray, Optional[List[OverlayShape]], Optional[_ReceivedFrame]]] = \
+            FramePresenter(self._present_frame, parent=self)
+        self._overlay: Optional[List[OverlayShape]] = None
+        self._overlay_renderer: OverlayRenderer = OverlayRenderer()
+        self._performance_hud: PerformanceHud = PerformanceHud()
+        self._frames_rendered: int = 0
+        self._latency_tracker: Optional[PipelineLatencyTracker] = None
+        self._received_frame: Optional[_ReceivedFrame] = None
+
+        # Last presented frame and frame waiting to be uploaded to the texture
+        self._last_frame: Optional[ndarray] = None
+        self._upload_frame: Optional[ndarray] = None
+        self._has_image: bool = False
+        self._rebuild_texture: bool = False
+        self._image_size: Tuple[int, int] = (0, 0)
+        self._channels: int = 0
+
+        self._program: Optional[QOpenGLShaderProgram] = None
+        self._texture: Optional[QOpenGLTexture] = None
+        self._vertex_array: Optional[QOpenGLVertexArrayObject] = None
+        self._vertex_buffer: Optional[QOpenGLBuffer] = None
+        self._pixel_buffers: Tuple[QOpenGLBuffer, ...] = ()
+        self._pixel_buffer_index: int = 0
+        self._failed: bool = False
+
+        # Features of the context, known once it is initialized
+        self._texture_formats: _TextureFormats = _TEXTURE_FORMATS
+        self._supports_row_length: bool = True
+        self._supports_mipmaps: bool = True
+
+        self._no_image_text: str = QCoreApplication.translate(self.__class__.__name__, "No image")
+
+        self.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding)
+
+        self._frame_available_signal.connect(self._on_frame_available_signal)
+        self._scaling_quality_signal.connect(self._on_scaling_quality_signal)
+
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    def initializeGL(self):
+        self.context().aboutToBeDestroyed.connect(self._cleanup)
+
+        try:
+            self._program = QOpenGLShaderProgram(self)
+            if not self._program.addShaderFromSourceCode(QOpenGLShader.Vertex, _VERTEX_SHADER) \
+                    or not self._program.addShaderFromSourceCode(QOpenGLShader.Fragment, _FRAGMENT_SHADER) \
+                    or not self._program.link():
+                raise RuntimeError(f"Video shaders could not be built: {self._program.log()}")
+
+            self._vertex_array = QOpenGLVertexArrayObject(self)
+            self._vertex_array.create()
+
+            self._vertex_buffer = QOpenGLBuffer(QOpenGLBuffer.VertexBuffer)
+            self._vertex_buffer.create()
+            self._vertex_buffer.bind()
+            self._vertex_buffer.allocate(_QUAD.ctypes.data, _QUAD.nbytes)
+            self._vertex_buffer.release()
+
+            if self._supports_pixel_buffers():
+                self._pixel_buffers = tuple(self._create_pixel_buffer() for _ in range(_PIXEL_BUFFER_COUNT))
+
+            self._detect_texture_support()
+
+            LIVIA_GUI_LOGGER.info(f"OpenGL video panel initialized (pixel buffers: {bool(self._pixel_buffers)}, "
+                                  f"legacy textures: {self._texture_formats is not _TEXTURE_FORMATS})")
+        except RuntimeError:
+            LIVIA_GUI_LOGGER.exception("OpenGL video panel could not be initialized")
+            self._failed = True
+            # The panel is replaced by the listeners, which must not be done while it is being painted
+            QTimer.singleShot(0, self.renderer_failed.emit)
+
+    def paintGL(self):
+        start = perf_counter()
+        functions = self.context().functions()
+        functions.glClearColor(0.0, 0.0, 0.0, 1.0)
+        functions.glClear(_GL_COLOR_BUFFER_BIT)
+
+        if self._failed:
+            return
+
+        if self._upload_frame is not None:
+            self._upload(self._upload_frame)
+            self._upload_frame = None
+
+            if self._latency_tracker is not None and self._received_frame is not None:
+                # Uploading the texture is the conversion of this renderer, as the GPU scales the frame
+                self._latency_tracker.record(PipelineStage.CONVERSION, perf_counter() - start)
+
+        if self._has_image:
+            self._draw()
+
+            if self._overlay:
+                painter = QPainter(self)
+                self._overlay_renderer.paint(painter, self._overlay, self._image_size, self._image_rect())
+                painter.end()
+        else:
+            painter = QPainter(self)
+            painter.setPen(Qt.white)
+            painter.drawText(self.rect().center(), self._no_image_text)
+            painter.end()
+
+        if self._performance_hud.lines:
+            painter = QPainter(self)
+            self._performance_hud.paint(painter, self.rect())
+            painter.end()
+
+        if self._received_frame is not None and self._latency_tracker is not None:
+            num_frame, received = self._received_frame
+            self._received_frame = None
+
+            painted = perf_counter()
+            self._latency_tracker.record(PipelineStage.PRESENTATION, start - received)
+            self._latency_tracker.record(PipelineStage.PAINT, painted - start)
+            self._latency_tracker.frame_finished(num_frame, painted)
+
+    def _draw(self):
+        self._program.bind()
+        self._texture.bind(0)
+        self._program.setUniformValue1i("u_texture", 0)
+        self._program.setUniformValue1f("u_gray", 1.0 if self._channels == 1 else 0.0)
+        self._program.setUniformValue("u_scale", QVector2D(*self._quad_scale()))
+
+        vertex_array_bound = self._vertex_array.isCreated()
+        if vertex_array_bound:
+            self._vertex_array.bind()
+
+        self._vertex_buffer.bind()
+        self._program.enableAttributeArray("a_position")
+        self._program.setAttributeBuffer("a_position", _GL_FLOAT, 0, 2)
+
+        self.context().functions().glDrawArrays(_GL_TRIANGLE_STRIP, 0, 4)
+
+        self._program.disableAttributeArray("a_position")
+        self._vertex_buffer.release()
+        if vertex_array_bound:
+            self._vertex_array.release()
+
+        self._texture.release()
+        self._program.release()
+
+    def _quad_scale(self) -> Tuple[float, float]:
+        # Scaling and letterboxing: the quad covers the fitted area and the rest is left with the clear color
+        image_width, image_height = self._image_size
+        widget_width = max(1.0, self.width() * self.devicePixelRatioF())
+        widget_height = max(1.0, self.height() * self.devicePixelRatioF())
+
+        if self._resize_image:
+            ratio = min(widget_width / image_width, widget_height / image_height)
+        else:
+            ratio = 1.0
+
+        return image_width * ratio / widget_width, image_height * ratio / widget_height
+
+    def _image_rect(self) -> QRect:
+        scale_x, scale_y = self._quad_scale()
+        width, height = round(self.width() * scale_x), round(self.height() * scale_y)
+
+        image_rect = QRect(0, 0, width, height)
+        image_rect.moveCenter(self.rect().center())
+
+        return image_rect
+
+    def _upload(self, frame: ndarray):
+        if frame.ndim == 3 and frame.shape[2] == 1:
+            frame = frame.reshape(frame.shape[:2])
+
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+        if frame.dtype != np.uint8 or channels not in self._texture_formats:
+            LIVIA_GUI_LOGGER.error(f"Unsupported frame format: {frame.dtype} {frame.shape}")
+            return
+
+        height, width = frame.shape[:2]
+        row_length = GLVideoPanel._row_length(frame)
+        if row_length is None or (row_length != width and not self._supports_row_length):
+            frame = np.ascontiguousarray(frame)
+            row_length = width
+
+        self._prepare_texture(width, height, channels)
+
+        options = QOpenGLPixelTransferOptions()
+        options.setAlignment(1)
+        if self._supports_row_length:
+            options.setRowLength(row_length)
+
+        source_format = self._texture_formats[channels][1]
+        size = frame.strides[0] * (height - 1) + width * channels
+
+        if self._pixel_buffers:
+            # Orphaning the storage lets the driver keep using the previous frame while the new one is written
+            pixel_buffer = self._pixel_buffers[self._pixel_buffer_index]
+            self._pixel_buffer_index = (self._pixel_buffer_index + 1) % len(self._pixel_buffers)
+
+            pixel_buffer.bind()
+            pixel_buffer.allocate(size)
+            pixel_buffer.write(0, frame.ctypes.data, size)
+            self._texture.setData(source_format, QOpenGLTexture.UInt8, 0, options)
+            pixel_buffer.release()
+        else:
+            self._texture.setData(source_format, QOpenGLTexture.UInt8, frame.ctypes.data, options)
+
+        if self._uses_mipmaps():
+            self._texture.generateMipMaps()
+
+        self._has_image = True
+
+    def _prepare_texture(self, width: int, height: int, channels: int):
+        if self._texture is not None and not self._rebuild_texture \
+                and self._image_size == (width, height) and self._channels == channels:
+            return
+
+        if self._texture is not None:
+            self._texture.destroy()
+
+        high_quality = self._uses_mipmaps()
+
+        self._texture = QOpenGLTexture(QOpenGLTexture.Target2D)
+        self._texture.setFormat(self._texture_formats[channels][0])
+        self._texture.setSize(width, height)
+        self._texture.setMipLevels(self._texture.maximumMipLevels() if high_quality else 1)
+        self._texture.setAutoMipMapGenerationEnabled(False)
+        self._texture.allocateStorage(self._texture_formats[channels][1], QOpenGLTexture.UInt8)
+        self._texture.setWrapMode(QOpenGLTexture.ClampToEdge)
+        self._texture.setMinificationFilter(
+            QOpenGLTexture.LinearMipMapLinear if high_quality else QOpenGLTexture.Linear
+        )
+        self._texture.setMagnificationFilter(QOpenGLTexture.Linear)
+
+        self._image_size = (width, height)
+        self._channels = channels
+        self._rebuild_texture = False
+
+    def _uses_mipmaps(self) -> bool:
+        return self._scaling_quality == ScalingQuality.HIGH and self._supports_mipmaps
+
+    def _detect_texture_support(self):
+        context = self.context()
+        version = context.format().majorVersion(), context.format().minorVersion()
+
+        if context.isOpenGLES() and version < (3, 0):
+            # Row lengths need an extension, and textures whose size is not a power of two have no mipmaps
+            self._texture_formats = _ES2_TEXTURE_FORMATS
+            self._supports_row_length = context.hasExtension(b"GL_EXT_unpack_subimage")
+            self._supports_mipmaps = False
+        else:
+            has_red_textures = version >= (3, 0) or context.hasExtension(b"GL_ARB_texture_rg")
+            self._texture_formats = _TEXTURE_FORMATS if has_red_textures else _LEGACY_TEXTURE_FORMATS
+            self._supports_row_length = True
+            self._supports_mipmaps = True
+
+    def _supports_pixel_buffers(self) -> bool:
+        context = self.context()
+        version = context.format().majorVersion(), context.format().minorVersion()
+
+        if context.isOpenGLES():
+            return version >= (3, 0)
+        else:
+            return version >= (2, 1) or context.hasExtension(b"GL_ARB_pixel_buffer_object")
+
+    @staticmethod
+    def _create_pixel_buffer() -> QOpenGLBuffer:
+        pixel_buffer = QOpenGLBuffer(QOpenGLBuffer.PixelUnpackBuffer)
+        pixel_buffer.setUsagePattern(QOpenGLBuffer.StreamDraw)
+
+        if not pixel_buffer.create():
+            raise RuntimeError("Pixel buffer could not be created")
+
+        return pixel_buffer
+
+    @staticmethod
+    def _row_length(frame: ndarray) -> Optional[int]:
+        channels = 1 if frame.ndim == 2 else frame.shape[2]
+
+        # Rows can be padded (e.g. crops), but pixels must be packed to be uploaded without a copy
+        if frame.ndim == 3 and frame.strides[2] != 1:
+            return None
+        if frame.strides[1] != channels or frame.strides[0] < frame.shape[1] * channels:
+            return None
+        if frame.strides[0] % channels != 0:
+            return None
+
+        return frame.strides[0] // channels
+
+    @Slot()
+    def _cleanup(self):
+        self.makeCurrent()
+
+        if self._texture is not None:
+            self._texture.destroy()
+            self._texture = None
+        for pixel_buffer in self._pixel_buffers:
+            pixel_buffer.destroy()
+        self._pixel_buffers = ()
+        if self._vertex_buffer is not None:
+            self._vertex_buffer.destroy()
+            self._vertex_buffer = None
+        if self._vertex_array is not None:
+            self._vertex_array.destroy()
+            self._vertex_array = None
+        self._program = None
+
+        # The last frame is uploaded again if the panel gets a new context (e.g. when it is reparented)
+        self._has_image = False
+        self._upload_frame = self._last_frame
+
+        self.doneCurrent()
+
+    @Slot()
+    def _on_frame_available_signal(self):
+        if not self._mailbox.has_pending():
+            return
+
+        item = self._mailbox.take(0)
+        if item is None:
+            self._presenter.clear()
+        else:
+            frame, timestamp, overlay, num_frame = item
+
+            received_frame = None
+            if self._latency_tracker is not None and num_frame is not None:
+                received = perf_counter()
+                self._latency_tracker.frame_reached(num_frame, PipelineStage.QUEUE, received)
+                received_frame = (num_frame, received)
+
+            self._presenter.submit((frame, overlay, received_frame), timestamp)
+
+    def _present_frame(self,
+                       presented: Optional[Tuple[ndarray, Optional[List[OverlayShape]], Optional[_ReceivedFrame]]]):
+        if presented is None:
+            frame, self._overlay, self._received_frame = None, None, None
+            self._has_image = False
+            self._overlay_renderer.clear()
+        else:
+            frame, self._overlay, self._received_frame = presented
+            self._frames_rendered += 1
+
+        self._last_frame = frame
+        self._upload_frame = frame
+
+        self.update()
+
+    def is_image_resizable(self) -> bool:
+        return self._resize_image
+
+    def set_image_resizable(self, resizable: bool):
+        self._resize_image = resizable
+        self.update()
+
+    def get_scaling_quality(self) -> ScalingQuality:
+        return self._scaling_quality
+
+    def set_scaling_quality(self, scaling_quality: ScalingQuality):
+        # The texture is used by the GUI thread, so it is only changed there
+        self._scaling_quality_signal.emit(scaling_quality)
+
+    @Slot(object)
+    def _on_scaling_quality_signal(self, scaling_quality: ScalingQuality):
+        if self._scaling_quality != scaling_quality:
+            self._scaling_quality = scaling_quality
+
+            # The texture is rebuilt with (or without) mipmaps, so the last frame must be uploaded again
+            self._rebuild_texture = True
+            self._upload_frame = self._last_frame
+            self.update()
+
+    def show_frame(self, frame: Optional[ndarray], overlay: Optional[List[OverlayShape]] = None,
+                   num_frame: Optional[int] = None):
+        if frame is None:
+            self._mailbox.put(None, counted=False)
+        else:
+            self._mailbox.put((frame, perf_counter(), overlay, num_frame))
+
+        self._frame_available_signal.emit()
+
+    def clear_frame(self):
+        self._mailbox.put(None, counted=False)
+        self._frame_available_signal.emit()
+
+    def get_statistics(self) -> VideoPanelStatistics:
+        return VideoPanelStatistics(self._mailbox.received, self._frames_rendered, self._mailbox.dropped,
+                                    self._mailbox.backlog)
+
+    def get_presentation_statistics(self) -> PresentationStatistics:
+        return self._presenter.get_statistics()
+
+    def is_presentation_smoothed(self) -> bool:
+        return self._presenter.smoothing
+
+    def set_presentation_smoothing(self, smoothing: bool):
+        self._presenter.smoothing = smoothing
+
+    def set_latency_tracker(self, tracker: Optional[PipelineLatencyTracker]):
+        self._latency_tracker = tracker
+
+    def set_performance_snapshot(self, snapshot: Optional[PerformanceSnapshot]):
+        self._performance_hud.update(snapshot)
+        self.update()
+
+    def reset_statistics(self):
+        self._mailbox.reset_statistics()
+        self._presenter.reset_statistics()
+        self._frames_rendered = 0
@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import List, Optional
 
 from PySide2.QtCore import Qt, QCoreApplication, Signal, Slot
-from PySide2.QtGui import QResizeEvent, QImage, QPixmap
+from PySide2.QtGui import QResizeEvent, QPixmap, QPainter
 from PySide2.QtWidgets import QLabel, QSizePolicy
 from numpy import ndarray
 
-from livia_ui.gui.views.utils import convert_image_opencv_to_qt
+from livia_ui.gui.views.utils.FrameConverter import FrameConverter
+from livia_ui.gui.views.utils.FrameScaler import FrameScaler
+from livia_ui.gui.views.utils.OverlayRenderer import OverlayRenderer
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
 
 
 class ImagePanel(QLabel):
@@ -16,7 +20,11 @@ class ImagePanel(QLabel):
         super(ImagePanel, self).__init__(*args, **kwargs)
 
         self._resize_image: bool = resize_image
-        self._last_image: Optional[QImage] = None
+        self._last_frame: Optional[ndarray] = None
+        self._last_overlay: Optional[List[OverlayShape]] = None
+        self._overlay_renderer: OverlayRenderer = OverlayRenderer()
+        self._scaler: FrameScaler = FrameScaler()
+        self._converter: FrameConverter = FrameConverter()
         self._processing_text = QCoreApplication.translate(self.__class__.__name__, "Processing image...")
 
         self.setMinimumSize(800, 600)
@@ -48,23 +56,35 @@ class ImagePanel(QLabel):
             self._resize_image = resizable
             self.refresh_image()
 
-    def show_frame(self, frame: Optional[ndarray]):
+    def show_frame(self, frame: Optional[ndarray], overlay: Optional[List[OverlayShape]] = None):
         if frame is not None:
-            self._last_image = convert_image_opencv_to_qt(frame)
-            self._display_image(self._last_image)
+            self._last_frame = frame
+            self._last_overlay = overlay
+            self._display_frame(frame)
         else:
             self._clear_image_signal.emit()
 
     def refresh_image(self):
-        if self._last_image is not None:
-            self._display_image(self._last_image)
+        if self._last_frame is not None:
+            self._display_frame(self._last_frame)
 
     def clear_frame(self):
         self._clear_image_signal.emit()
 
-    def _display_image(self, image: QImage):
-        size = self.size()
-        if self._resize_image and image.size() != size:
-            image = image.scaled(size.width(), size.height(), Qt.KeepAspectRatio)
+    def _display_frame(self, frame: ndarray):
+        frame_height, frame_width = frame.shape[:2]
 
-        self._update_image_signal.emit(QPixmap.fromImage(image))
+        if self._resize_image:
+            size = self.size()
+            frame = self._scaler.scale(frame, size.width(), size.height(), ScalingQuality.HIGH)
+
+        image = self._converter.convert(frame)
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+
+            if self._last_overlay:
+                painter = QPainter(pixmap)
+                self._overlay_renderer.paint(painter, self._last_overlay, (frame_width, frame_height), pixmap.rect())
+                painter.end()
+
+            self._update_image_signal.emit(pixmap)
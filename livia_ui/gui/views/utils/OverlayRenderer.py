@@ -0,0 +1,71 @@
+from typing import List, Optional, Tuple
+
+from PySide2.QtCore import Qt, QPointF, QRect
+from PySide2.QtGui import QPainter, QPainterPath, QPen, QColor, QTransform
+
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+_LABEL_OFFSET: QPointF = QPointF(0, -4)
+
+
+class OverlayRenderer:
+    def __init__(self):
+        self._shapes: Optional[List[OverlayShape]] = None
+        self._paths: List[Tuple[QPainterPath, QPen, Optional[str], QPointF]] = []
+
+    def paint(self, painter: QPainter, shapes: List[OverlayShape], frame_size: Tuple[int, int], target: QRect):
+        frame_width, frame_height = frame_size
+        if frame_width <= 0 or frame_height <= 0:
+            return
+
+        self._update_paths(shapes)
+
+        # Paths are kept in frame coordinates and mapped to the displayed image, so they are drawn at display
+        # resolution and only rebuilt when the shapes change
+        transform = QTransform()
+        transform.translate(target.x(), target.y())
+        transform.scale(target.width() / frame_width, target.height() / frame_height)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(Qt.NoBrush)
+
+        for path, pen, label, label_position in self._paths:
+            painter.setTransform(transform)
+            painter.setPen(pen)
+            painter.drawPath(path)
+
+            if label:
+                painter.setTransform(QTransform())
+                painter.drawText(transform.map(label_position) + _LABEL_OFFSET, label)
+
+        painter.restore()
+
+    def clear(self):
+        self._shapes = None
+        self._paths = []
+
+    def _update_paths(self, shapes: List[OverlayShape]):
+        if shapes is self._shapes:
+            return
+
+        paths = []
+        for shape in shapes:
+            if not shape.points:
+                continue
+
+            path = QPainterPath()
+            path.moveTo(*shape.points[0])
+            for point in shape.points[1:]:
+                path.lineTo(*point)
+            if shape.closed:
+                path.closeSubpath()
+
+            blue, green, red = shape.color
+            pen = QPen(QColor(red, green, blue), shape.thickness)
+            pen.setCosmetic(True)
+
+            paths.append((path, pen, shape.label, QPointF(*shape.points[0])))
+
+        self._shapes = shapes
+        self._paths = paths
@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+from PySide2.QtCore import Qt, QRect, QMargins
+from PySide2.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui.views.utils.PerformanceSnapshot import PerformanceSnapshot
+
+_MARGIN: int = 8
+_PADDING: int = 6
+
+_BACKGROUND_COLOR: QColor = QColor(0, 0, 0, 160)
+_TEXT_COLOR: QColor = QColor(255, 255, 255, 230)
+
+# Stages shown with their percentiles, as the rest are only interesting when benchmarking
+_LATENCY_STAGES: List[PipelineStage] = [PipelineStage.ANALYSIS, PipelineStage.END_TO_END]
+
+
+class PerformanceHud:
+    def __init__(self):
+        self._font: QFont = QFont("Monospace")
+        self._font.setStyleHint(QFont.TypeWriter)
+        self._font.setPointSize(9)
+
+        self._lines: List[str] = []
+
+    @property
+    def lines(self) -> List[str]:
+        return self._lines
+
+    def update(self, snapshot: Optional[PerformanceSnapshot]):
+        self._lines = PerformanceHud.format(snapshot) if snapshot is not None else []
+
+    @staticmethod
+    def format(snapshot: PerformanceSnapshot) -> List[str]:
+        input_fps = f"{snapshot.input_fps:.1f}" if snapshot.input_fps is not None else "-"
+        lines = [
+            f"Input fps     {input_fps:>7}",
+            f"Output fps    {snapshot.processed_fps:>7.1f}",
+            f"Analyzed fps  {snapshot.analyzed_fps:>7.1f}",
+            f"Display fps   {snapshot.display_fps:>7.1f}",
+            f"Dropped       {snapshot.frames_dropped:>7}"
+        ]
+
+        for stage in _LATENCY_STAGES:
+            statistics = snapshot.latencies.get(stage)
+            if statistics is not None:
+                lines.append(f"{stage.name.capitalize().replace('_', '-'):<13} p50 {statistics.p50_msec:.1f} "
+                             f"p95 {statistics.p95_msec:.1f} p99 {statistics.p99_msec:.1f} ms")
+
+        utilization = f"{snapshot.analyzer_utilization * 100:.0f}%" if snapshot.analyzer_utilization is not None \
+            else "-"
+        lines.append(f"Analyzers     {snapshot.analyzer_threads:>3} threads {utilization:>4} busy")
+
+        if snapshot.rss_bytes is not None:
+            lines.append(f"RSS           {snapshot.rss_bytes / (1024 * 1024):>7.1f} MB")
+
+        return lines
+
+    def paint(self, painter: QPainter, rect: QRect):
+        if not self._lines:
+            return
+
+        painter.save()
+        painter.setFont(self._font)
+
+        metrics = QFontMetrics(self._font)
+        line_height = metrics.lineSpacing()
+        text_width = max(metrics.horizontalAdvance(line) for line in self._lines)
+
+        text_rect = QRect(rect.left() + _MARGIN + _PADDING, rect.top() + _MARGIN + _PADDING,
+                          text_width, line_height * len(self._lines))
+
+        painter.fillRect(text_rect.marginsAdded(QMargins(_PADDING, _PADDING, _PADDING, _PADDING)), _BACKGROUND_COLOR)
+        painter.setPen(_TEXT_COLOR)
+        for index, line in enumerate(self._lines):
+            painter.drawText(text_rect.left(), text_rect.top() + index * line_height + metrics.ascent(), line)
+
+        painter.restore()
@@ -0,0 +1,90 @@
+from time import perf_counter
+from typing import Optional, Union
+
+from livia_ui.benchmarking import get_rss_bytes
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui.status.FrameProcessingStatus import FrameProcessingStatus
+from livia_ui.gui.views.utils.GLVideoPanel import GLVideoPanel
+from livia_ui.gui.views.utils.PerformanceSnapshot import PerformanceSnapshot
+from livia_ui.gui.views.utils.VideoPanel import VideoPanel
+
+
+class PerformanceMonitor:
+    # Rates are computed from the counters between two snapshots, so they show the current behaviour instead of the
+    # average since the video started
+    def __init__(self, video_stream_status: FrameProcessingStatus,
+                 video_panel: Optional[Union[VideoPanel, GLVideoPanel]] = None):
+        self._video_stream_status: FrameProcessingStatus = video_stream_status
+        self._video_panel: Optional[Union[VideoPanel, GLVideoPanel]] = video_panel
+
+        self._last_time: Optional[float] = None
+        self._last_analyses: int = 0
+        self._last_analysis_msec: float = 0.0
+        self._last_presented: int = 0
+
+    @property
+    def video_panel(self) -> Optional[Union[VideoPanel, GLVideoPanel]]:
+        return self._video_panel
+
+    @video_panel.setter
+    def video_panel(self, video_panel: Optional[Union[VideoPanel, GLVideoPanel]]):
+        self._video_panel = video_panel
+        self._last_presented = 0
+
+    def reset(self):
+        self._last_time = None
+
+    def snapshot(self) -> PerformanceSnapshot:
+        now = perf_counter()
+        elapsed = now - self._last_time if self._last_time is not None else 0.0
+
+        latencies = self._video_stream_status.latency_tracker.get_statistics()
+        latencies = {stage: statistics for stage, statistics in latencies.items() if statistics.count > 0}
+
+        analysis = latencies.get(PipelineStage.ANALYSIS)
+        analyses = analysis.count if analysis is not None else 0
+        analysis_msec = analysis.mean_msec * analysis.count if analysis is not None else 0.0
+
+        # Counters go back to zero when the tracker or the panel are reset (e.g. a new video)
+        if analyses < self._last_analyses:
+            self._last_analyses, self._last_analysis_msec = 0, 0.0
+
+        frames_presented, frames_dropped = 0, 0
+        if self._video_panel is not None:
+            presentation = self._video_panel.get_presentation_statistics()
+            frames_presented = presentation.frames_presented
+            frames_dropped = self._video_panel.get_statistics().frames_dropped + presentation.frames_coalesced
+
+        if frames_presented < self._last_presented:
+            self._last_presented = 0
+
+        analyzer_threads = self._video_stream_status.analyzer_threads
+
+        if elapsed > 0:
+            analyzed_fps = (analyses - self._last_analyses) / elapsed
+            display_fps = (frames_presented - self._last_presented) / elapsed
+            busy = (analysis_msec - self._last_analysis_msec) / 1000
+            utilization = min(1.0, busy / (elapsed * max(1, analyzer_threads)))
+        else:
+            analyzed_fps, display_fps, utilization = 0.0, 0.0, None
+
+        sample = self._video_stream_status.sampler.last_sample
+
+        self._last_time = now
+        self._last_analyses, self._last_analysis_msec = analyses, analysis_msec
+        self._last_presented = frames_presented
+
+        return PerformanceSnapshot(self._input_fps(), sample.output_fps if sample is not None else 0.0,
+                                   analyzed_fps, display_fps, frames_dropped, latencies, analyzer_threads,
+                                   utilization, get_rss_bytes())
+
+    def _input_fps(self) -> Optional[float]:
+        frame_input = self._video_stream_status.frame_input
+
+        try:
+            fps = frame_input.get_fps() if frame_input is not None else None
+        except Exception:
+            # Some inputs (e.g. closed devices) can not report their frame rate
+            return None
+
+        return fps if fps else None
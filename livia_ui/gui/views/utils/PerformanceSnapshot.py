@@ -0,0 +1,62 @@
+from typing import Dict, Optional
+
+from livia_ui.benchmarking.LatencyStatistics import LatencyStatistics
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+
+
+class PerformanceSnapshot:
+    def __init__(self, input_fps: Optional[float], processed_fps: float, analyzed_fps: float, display_fps: float,
+                 frames_dropped: int, latencies: Dict[PipelineStage, LatencyStatistics], analyzer_threads: int,
+                 analyzer_utilization: Optional[float], rss_bytes: Optional[int]):
+        self._input_fps: Optional[float] = input_fps
+        self._processed_fps: float = processed_fps
+        self._analyzed_fps: float = analyzed_fps
+        self._display_fps: float = display_fps
+        self._frames_dropped: int = frames_dropped
+        self._latencies: Dict[PipelineStage, LatencyStatistics] = latencies
+        self._analyzer_threads: int = analyzer_threads
+        self._analyzer_utilization: Optional[float] = analyzer_utilization
+        self._rss_bytes: Optional[int] = rss_bytes
+
+    @property
+    def input_fps(self) -> Optional[float]:
+        return self._input_fps
+
+    @property
+    def processed_fps(self) -> float:
+        return self._processed_fps
+
+    @property
+    def analyzed_fps(self) -> float:
+        return self._analyzed_fps
+
+    @property
+    def display_fps(self) -> float:
+        return self._display_fps
+
+    @property
+    def frames_dropped(self) -> int:
+        return self._frames_dropped
+
+    @property
+    def latencies(self) -> Dict[PipelineStage, LatencyStatistics]:
+        return self._latencies
+
+    @property
+    def analyzer_threads(self) -> int:
+        return self._analyzer_threads
+
+    @property
+    def analyzer_utilization(self) -> Optional[float]:
+        # Fraction of the time the analyzer threads spent analyzing frames since the previous snapshot
+        return self._analyzer_utilization
+
+    @property
+    def rss_bytes(self) -> Optional[int]:
+        return self._rss_bytes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(input_fps={self._input_fps}, processed_fps={self._processed_fps:.2f}, " \
+               f"analyzed_fps={self._analyzed_fps:.2f}, display_fps={self._display_fps:.2f}, " \
+               f"dropped={self._frames_dropped}, threads={self._analyzer_threads}, " \
+               f"utilization={self._analyzer_utilization}, rss={self._rss_bytes})"
@@ -0,0 +1,44 @@
+class PresentationStatistics:
+    def __init__(self, frames_presented: int, frames_coalesced: int, refresh_interval_msec: float,
+                 mean_interval_msec: float, jitter_msec: float, max_deviation_msec: float, mean_latency_msec: float):
+        self._frames_presented: int = frames_presented
+        self._frames_coalesced: int = frames_coalesced
+        self._refresh_interval_msec: float = refresh_interval_msec
+        self._mean_interval_msec: float = mean_interval_msec
+        self._jitter_msec: float = jitter_msec
+        self._max_deviation_msec: float = max_deviation_msec
+        self._mean_latency_msec: float = mean_latency_msec
+
+    @property
+    def frames_presented(self) -> int:
+        return self._frames_presented
+
+    @property
+    def frames_coalesced(self) -> int:
+        return self._frames_coalesced
+
+    @property
+    def refresh_interval_msec(self) -> float:
+        return self._refresh_interval_msec
+
+    @property
+    def mean_interval_msec(self) -> float:
+        return self._mean_interval_msec
+
+    @property
+    def jitter_msec(self) -> float:
+        return self._jitter_msec
+
+    @property
+    def max_deviation_msec(self) -> float:
+        return self._max_deviation_msec
+
+    @property
+    def mean_latency_msec(self) -> float:
+        return self._mean_latency_msec
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(presented={self._frames_presented}, " \
+               f"coalesced={self._frames_coalesced}, refresh_interval={self._refresh_interval_msec:.2f}ms, " \
+               f"mean_interval={self._mean_interval_msec:.2f}ms, jitter={self._jitter_msec:.2f}ms, " \
+               f"max_deviation={self._max_deviation_msec:.2f}ms, mean_latency={self._mean_latency_msec:.2f}ms)"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ScalingQuality(Enum):
+    FAST = "fast"
+    HIGH = "high"
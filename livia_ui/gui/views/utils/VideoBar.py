@@ -12,6 +12,9 @@ from livia.process.listener.IOChangeEvent import IOChangeEvent
 from livia.process.listener.IOChangeListener import IOChangeListener
 from livia.process.listener.ProcessChangeEvent import ProcessChangeEvent
 from livia.process.listener.ProcessChangeListener import ProcessChangeListener
+from livia_ui.gui.status.FrameProcessingSample import FrameProcessingSample
+from livia_ui.gui.status.FrameProcessingSampler import FrameProcessingSampler
+from livia_ui.gui.status.listener.FrameProcessingSampleListener import FrameProcessingSampleListener
 
 
 class VideoBar(QWidget):
@@ -20,10 +23,12 @@ class VideoBar(QWidget):
     _enable_stop_button_signal: Signal = Signal(bool)
     _set_play_icon_signal: Signal = Signal(QIcon)
 
-    def __init__(self, frame_processor: FrameProcessor, *args, **kwargs):
+    def __init__(self, frame_processor: FrameProcessor, sampler: FrameProcessingSampler, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._frame_processor: FrameProcessor = frame_processor
+        self._sampler: FrameProcessingSampler = sampler
+        self._last_sampled_frame: int = -1
 
         self._play_bar_slider_pressed: bool = False
 
@@ -71,9 +76,10 @@ class VideoBar(QWidget):
                            stopped=self._on_stream_stopped,
                            paused=self._on_stream_paused,
                            resumed=self._on_stream_resumed,
-                           finished=self._on_stream_finished,
-                           frame_outputted=self._on_stream_outputted_frame
+                           finished=self._on_stream_finished
                            )
+        self._sample_listener: FrameProcessingSampleListener = \
+            build_listener(FrameProcessingSampleListener, sampled=self._on_processing_sampled)
 
         self._frame_processor.add_io_change_listener(
             build_listener(IOChangeListener,
@@ -145,6 +151,7 @@ class VideoBar(QWidget):
         self._set_play_icon_signal.emit(self._pause_icon)
 
     def _on_stream_stopped(self, event: ProcessChangeEvent):
+        self._last_sampled_frame = -1
         self._enable_stop_button_signal.emit(False)
         self._set_play_icon_signal.emit(self._play_icon)
         self._current_time_changed_signal.emit(0, 0)
@@ -159,12 +166,10 @@ class VideoBar(QWidget):
         self._enable_stop_button_signal.emit(False)
         self._set_play_icon_signal.emit(self._play_icon)
 
-    def _on_stream_outputted_frame(self, event: ProcessChangeEvent):
-        time = self._frame_processor.input.get_current_msec()
-        frame = self._frame_processor.input.get_current_frame_index()
-
-        if time != self._play_bar_slider.value():
-            self._current_time_changed_signal.emit(time, frame + 1)
+    def _on_processing_sampled(self, sample: FrameProcessingSample):
+        if sample.frame_index is not None and sample.frame_index != self._last_sampled_frame:
+            self._last_sampled_frame = sample.frame_index
+            self._current_time_changed_signal.emit(sample.msec, sample.frame_index + 1)
 
     def _on_frame_input_changed(self, event: IOChangeEvent):
         self._check_frame_input_signal.emit()
@@ -195,6 +200,8 @@ class VideoBar(QWidget):
     def __enable_seekable_events(self):
         if not self._frame_processor.has_process_change_listener(self._process_change_listener):
             self._frame_processor.add_process_change_listener(self._process_change_listener)
+        if not self._sampler.has_sample_listener(self._sample_listener):
+            self._sampler.add_sample_listener(self._sample_listener)
 
         if self.receivers("_current_time_changed_signal") == 0:
             self._current_time_changed_signal.connect(self._on_current_time_changed_signal)
@@ -206,6 +213,8 @@ class VideoBar(QWidget):
     def __disable_seekable_events(self):
         if self._frame_processor.has_process_change_listener(self._process_change_listener):
             self._frame_processor.remove_process_change_listener(self._process_change_listener)
+        if self._sampler.has_sample_listener(self._sample_listener):
+            self._sampler.remove_sample_listener(self._sample_listener)
 
         if self.receivers("_current_time_changed_signal") > 0:
             self._current_time_changed_signal.disconnect(self._on_current_time_changed_signal)
@@ -1,28 +1,57 @@
-from queue import Queue
 from threading import Lock
-from typing import Optional
+from time import perf_counter
+from typing import List, Optional, Tuple
 
-from PySide2.QtCore import Qt, Signal, Slot, QThread, QSize, QCoreApplication
+from PySide2.QtCore import Qt, Signal, Slot, QThread, QSize, QCoreApplication, QTimer, QRect
 from PySide2.QtGui import QResizeEvent, QImage, QPainter, QPaintEvent, QPixmap
 from PySide2.QtWidgets import QSizePolicy, QWidget, QStyleOption
 from numpy import ndarray
 
-from livia_ui.gui.views.utils import convert_image_opencv_to_qt
+from livia_ui.benchmarking.PipelineLatencyTracker import PipelineLatencyTracker
+from livia_ui.benchmarking.PipelineStage import PipelineStage
+from livia_ui.gui.views.utils.FrameConverter import FrameConverter
+from livia_ui.gui.views.utils.FrameMailbox import FrameMailbox
+from livia_ui.gui.views.utils.FramePresenter import FramePresenter
+from livia_ui.gui.views.utils.OverlayRenderer import OverlayRenderer
+from livia_ui.gui.views.utils.PerformanceHud import PerformanceHud
+from livia_ui.gui.views.utils.PerformanceSnapshot import PerformanceSnapshot
+from livia_ui.gui.views.utils.FrameScaler import FrameScaler
+from livia_ui.gui.views.utils.PresentationStatistics import PresentationStatistics
+from livia_ui.gui.views.utils.ScalingQuality import ScalingQuality
+from livia_ui.gui.views.utils.VideoPanelStatistics import VideoPanelStatistics
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+_REFRESH = object()
+
+_RESIZE_DEBOUNCE_MSEC: int = 100
+
+# Overlay shapes with the size of the frame they refer to
+_Overlay = Tuple[List[OverlayShape], Tuple[int, int]]
+
+# Number of a rendered frame and the moment its rendering finished
+_RenderedFrame = Tuple[int, float]
 
 
 class _ImageProcessingThread(QThread):
-    update_image_signal: Signal = Signal(QPixmap)
+    update_image_signal: Signal = Signal(QPixmap, float, object, object)
     clear_image_signal: Signal = Signal()
 
-    def __init__(self, resize_image: bool, size: QSize):
+    def __init__(self, resize_image: bool, size: QSize, scaling_quality: ScalingQuality):
         super().__init__()
 
-        self._queue: Queue = Queue()
+        self._mailbox: FrameMailbox = FrameMailbox()
+        self._scaler: FrameScaler = FrameScaler()
+        # Pixmaps are painted in the GUI thread while the next frames are converted here, so they must not share memory
+        self._converter: FrameConverter = FrameConverter(detached=True)
+        self._frames_rendered: int = 0
+        self._latency_tracker: Optional[PipelineLatencyTracker] = None
 
         self._resize_image: bool = resize_image
         self._size: QSize = size
+        self._scaling_quality: ScalingQuality = scaling_quality
 
-        self._last_image: Optional[QImage] = None
+        self._last_frame: Optional[ndarray] = None
+        self._last_overlay: Optional[List[OverlayShape]] = None
 
         self._running: bool = False
         self._lock: Lock = Lock()
@@ -30,29 +59,63 @@ class _ImageProcessingThread(QThread):
     def run(self) -> None:
         self._running = True
         while self._running:
-            image = self._queue.get(True)
+            item = self._mailbox.take()
+
+            if not self._running:
+                break
 
             with self._lock:
-                if isinstance(image, ndarray):
-                    image = convert_image_opencv_to_qt(image)
-
-                if isinstance(image, QImage):
-                    self._last_image = image
-                    i_size = self._last_image.size()
-                    if self._resize_image and self._size != i_size:
-                        resized_image = self._last_image.scaled(self._size.width(), self._size.height(),
-                                                                Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    else:
-                        resized_image = self._last_image
-
-                    self.update_image_signal.emit(QPixmap.fromImage(resized_image))
+                new_frame = item is not _REFRESH
+                if new_frame:
+                    frame, timestamp, overlay, num_frame = item if item is not None else (None, None, None, None)
                 else:
-                    self._last_image = None
+                    frame, timestamp, overlay, num_frame = self._last_frame, perf_counter(), self._last_overlay, None
+
+                tracker = self._latency_tracker
+                if tracker is not None and num_frame is not None:
+                    tracker.frame_reached(num_frame, PipelineStage.QUEUE, perf_counter())
+
+                image = self._render(frame, tracker) if frame is not None else None
+
+                if image is not None:
+                    self._last_frame = frame
+                    self._last_overlay = overlay
+
+                    frame_height, frame_width = frame.shape[:2]
+                    overlay_data = (overlay, (frame_width, frame_height)) if overlay else None
+                    rendered_frame = (num_frame, perf_counter()) if tracker is not None and num_frame is not None \
+                        else None
+                    self.update_image_signal.emit(QPixmap.fromImage(image), timestamp, overlay_data, rendered_frame)
+
+                    if new_frame:
+                        self._frames_rendered += 1
+                else:
+                    self._last_frame = None
                     self.clear_image_signal.emit()
 
+    def _render(self, frame: ndarray, tracker: Optional[PipelineLatencyTracker]) -> Optional[QImage]:
+        start = perf_counter()
+
+        # Scaling the raw frame first makes the conversion work on the (usually smaller) displayed size
+        if self._resize_image:
+            frame = self._scaler.scale(frame, self._size.width(), self._size.height(), self._scaling_quality)
+        scaled = perf_counter()
+
+        image = self._converter.convert(frame)
+
+        if tracker is not None:
+            if self._resize_image:
+                tracker.record(PipelineStage.SCALING, scaled - start)
+            tracker.record(PipelineStage.CONVERSION, perf_counter() - scaled)
+
+        return image
+
+    def set_latency_tracker(self, tracker: Optional[PipelineLatencyTracker]):
+        self._latency_tracker = tracker
+
     def stop(self):
         self._running = False
-        self._queue.put(None)
+        self._mailbox.close()
 
     def is_image_resizable(self) -> bool:
         return self._resize_image
@@ -71,41 +134,77 @@ class _ImageProcessingThread(QThread):
                     self._resize_image = resizable
                     self._refresh_image()
 
-    def clear_image(self):
-        if self._last_image is not None:
-            if self._lock:
-                if self._last_image is not None:
-                    self._last_image = None
+    def get_scaling_quality(self) -> ScalingQuality:
+        return self._scaling_quality
+
+    def set_scaling_quality(self, scaling_quality: ScalingQuality):
+        if self._scaling_quality != scaling_quality:
+            with self._lock:
+                if self._scaling_quality != scaling_quality:
+                    self._scaling_quality = scaling_quality
                     self._refresh_image()
 
-    def add_image(self, image: Optional[ndarray]):
-        self._queue.put(image)
+    def clear_image(self):
+        self._mailbox.put(None, counted=False)
+
+    def add_image(self, image: Optional[ndarray], overlay: Optional[List[OverlayShape]] = None,
+                  num_frame: Optional[int] = None):
+        if image is None:
+            self._mailbox.put(None, counted=False)
+        else:
+            self._mailbox.put((image, perf_counter(), overlay, num_frame))
+
+    def get_statistics(self) -> VideoPanelStatistics:
+        return VideoPanelStatistics(self._mailbox.received, self._frames_rendered, self._mailbox.dropped,
+                                    self._mailbox.backlog)
+
+    def reset_statistics(self):
+        self._mailbox.reset_statistics()
+        self._frames_rendered = 0
 
     def _refresh_image(self):
-        self._queue.put(self._last_image)
+        # A pending frame will be rendered with the new settings anyway
+        if self._last_frame is not None:
+            self._mailbox.offer(_REFRESH)
 
 
 class VideoPanel(QWidget):
-    def __init__(self, resize_image: bool = True, *args, **kwargs):
+    def __init__(self, resize_image: bool = True, scaling_quality: ScalingQuality = ScalingQuality.FAST,
+                 *args, **kwargs):
         super(VideoPanel, self).__init__(*args, **kwargs)
 
         self._painter: QPainter = QPainter()
         self._image: Optional[QPixmap] = None
+        self._overlay: Optional[_Overlay] = None
+        self._overlay_renderer: OverlayRenderer = OverlayRenderer()
+        self._performance_hud: PerformanceHud = PerformanceHud()
         self._resize_image: bool = resize_image
+        self._presenter: FramePresenter[Tuple[QPixmap, Optional[_Overlay], Optional[_RenderedFrame]]] = \
+            FramePresenter(self._present_image, parent=self)
+
+        self._latency_tracker: Optional[PipelineLatencyTracker] = None
+        self._rendered_frame: Optional[_RenderedFrame] = None
 
         self._no_image_text: str = QCoreApplication.translate(self.__class__.__name__, "No image")
 
         self.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding)
 
-        self._thread: _ImageProcessingThread = _ImageProcessingThread(resize_image, self.size())
+        # Resizing the window produces a storm of resize events, so frames are only rescaled once it settles
+        self._resize_timer: QTimer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(_RESIZE_DEBOUNCE_MSEC)
+
+        self._thread: _ImageProcessingThread = _ImageProcessingThread(resize_image, self.size(), scaling_quality)
         self._thread.start()
         self._thread.setPriority(QThread.HighPriority)
         self.moveToThread(self._thread)
 
         self._thread.update_image_signal.connect(self._on_update_image_signal)
         self._thread.clear_image_signal.connect(self._on_clear_image_signal)
+        self._resize_timer.timeout.connect(self._on_resize_timeout)
 
     def paintEvent(self, event: QPaintEvent):
+        start = perf_counter()
         rect = event.rect()
         event.accept()
 
@@ -115,35 +214,111 @@ class VideoPanel(QWidget):
         self._painter.begin(self)
         self._painter.fillRect(rect, Qt.black)
         if self._image:
-            image_rect = self._image.rect()
-            image_rect.moveCenter(rect.center())
+            image_rect = self._image_rect()
             self._painter.drawPixmap(image_rect, self._image)
+
+            if self._overlay is not None:
+                shapes, frame_size = self._overlay
+                self._overlay_renderer.paint(self._painter, shapes, frame_size, image_rect)
         else:
             self._painter.setPen(Qt.white)
             self._painter.drawText(rect.center(), self._no_image_text)
+        self._performance_hud.paint(self._painter, self.rect())
         self._painter.end()
 
-    @Slot(QPixmap)
-    def _on_update_image_signal(self, image: QImage):
-        self._image = image
-        self.repaint()
+        # Only the first paint of each frame is recorded, as the rest are repaints (e.g. resizing the window)
+        if self._rendered_frame is not None and self._latency_tracker is not None:
+            num_frame, rendered = self._rendered_frame
+            self._rendered_frame = None
+
+            painted = perf_counter()
+            self._latency_tracker.record(PipelineStage.PRESENTATION, start - rendered)
+            self._latency_tracker.record(PipelineStage.PAINT, painted - start)
+            self._latency_tracker.frame_finished(num_frame, painted)
+
+    @Slot(QPixmap, float, object, object)
+    def _on_update_image_signal(self, image: QPixmap, timestamp: float, overlay: Optional[_Overlay],
+                                rendered_frame: Optional[_RenderedFrame]):
+        self._presenter.submit((image, overlay, rendered_frame), timestamp)
 
     @Slot()
     def _on_clear_image_signal(self):
-        self._image = None
-        self.repaint()
+        self._presenter.clear()
+
+    def _present_image(self, image: Optional[Tuple[QPixmap, Optional[_Overlay], Optional[_RenderedFrame]]]):
+        if image is None:
+            self._image, self._overlay, self._rendered_frame = None, None, None
+            self._overlay_renderer.clear()
+        else:
+            self._image, self._overlay, self._rendered_frame = image
+
+        self.update()
 
     def resizeEvent(self, event: QResizeEvent):
-        self._thread.set_image_size(event.size())
+        self._resize_timer.start()
+
+    @Slot()
+    def _on_resize_timeout(self):
+        self._thread.set_image_size(self.size())
+
+    def _image_rect(self) -> QRect:
+        rect = self.rect()
+        image_size = self._image.size()
+
+        # While the panel is being resized, the last image is stretched until a properly scaled one arrives
+        if self._resize_image and image_size != rect.size():
+            image_size = image_size.scaled(rect.size(), Qt.KeepAspectRatio)
+
+        image_rect = QRect(0, 0, image_size.width(), image_size.height())
+        image_rect.moveCenter(rect.center())
+
+        return image_rect
 
     def is_image_resizable(self) -> bool:
         return self._thread.is_image_resizable()
 
     def set_image_resizable(self, resizable: bool):
+        self._resize_image = resizable
         self._thread.set_image_resizable(resizable)
 
-    def show_frame(self, frame: Optional[ndarray]):
-        self._thread.add_image(frame)
+    def get_scaling_quality(self) -> ScalingQuality:
+        return self._thread.get_scaling_quality()
+
+    def set_scaling_quality(self, scaling_quality: ScalingQuality):
+        self._thread.set_scaling_quality(scaling_quality)
+
+    def show_frame(self, frame: Optional[ndarray], overlay: Optional[List[OverlayShape]] = None,
+                   num_frame: Optional[int] = None):
+        self._thread.add_image(frame, overlay, num_frame)
 
     def clear_frame(self):
         self._thread.clear_image()
+
+    def stop(self):
+        # Frames can not be shown anymore once the rendering thread is stopped
+        self._thread.stop()
+        self._thread.wait()
+
+    def get_statistics(self) -> VideoPanelStatistics:
+        return self._thread.get_statistics()
+
+    def reset_statistics(self):
+        self._thread.reset_statistics()
+        self._presenter.reset_statistics()
+
+    def get_presentation_statistics(self) -> PresentationStatistics:
+        return self._presenter.get_statistics()
+
+    def is_presentation_smoothed(self) -> bool:
+        return self._presenter.smoothing
+
+    def set_presentation_smoothing(self, smoothing: bool):
+        self._presenter.smoothing = smoothing
+
+    def set_latency_tracker(self, tracker: Optional[PipelineLatencyTracker]):
+        self._latency_tracker = tracker
+        self._thread.set_latency_tracker(tracker)
+
+    def set_performance_snapshot(self, snapshot: Optional[PerformanceSnapshot]):
+        self._performance_hud.update(snapshot)
+        self.update()
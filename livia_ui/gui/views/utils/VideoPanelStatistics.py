@@ -0,0 +1,26 @@
+class VideoPanelStatistics:
+    def __init__(self, frames_received: int, frames_rendered: int, frames_dropped: int, backlog: int):
+        self._frames_received: int = frames_received
+        self._frames_rendered: int = frames_rendered
+        self._frames_dropped: int = frames_dropped
+        self._backlog: int = backlog
+
+    @property
+    def frames_received(self) -> int:
+        return self._frames_received
+
+    @property
+    def frames_rendered(self) -> int:
+        return self._frames_rendered
+
+    @property
+    def frames_dropped(self) -> int:
+        return self._frames_dropped
+
+    @property
+    def backlog(self) -> int:
+        return self._backlog
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(received={self._frames_received}, rendered={self._frames_rendered}, " \
+               f"dropped={self._frames_dropped}, backlog={self._backlog})"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class VideoRenderer(Enum):
+    SOFTWARE = "software"
+    OPENGL = "opengl"
@@ -5,23 +5,12 @@ import cv2
 from cv2 import VideoCapture
 from numpy import ndarray
 
-from livia_ui.gui import LIVIA_GUI_LOGGER
+from livia_ui.gui.views.utils.FrameConverter import FrameConverter
 
 
 def convert_image_opencv_to_qt(image: ndarray) -> Optional[QImage]:
-    if image is not None:
-        try:
-            height, width, colors = image.shape
-            bytes_per_line = colors * width
-
-            qimage = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-
-            return qimage.rgbSwapped()
-        except AttributeError:
-            LIVIA_GUI_LOGGER.error("Unknown frame format")
-            return None
-    else:
-        return None
+    # Images are usually sent to other threads, so they own their memory instead of sharing the frame one
+    return FrameConverter(prefer_32_bit=False, detached=True).convert(image)
 
 
 def list_devices() -> Dict[int, str]:
@@ -0,0 +1,110 @@
+import math
+import os
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+
+from livia_ui.process.analyzer.AutoTuningDecision import AutoTuningDecision
+
+DEFAULT_MAX_MODIFICATION_PERSISTENCE: int = 30
+DEFAULT_TUNING_INTERVAL: float = 2.0
+DEFAULT_LATENCY_SMOOTHING: float = 0.2
+
+
+class AnalyzerAutoTuner:
+    def __init__(self, num_threads: int, modification_persistence: int,
+                 min_threads: int = 1,
+                 max_threads: Optional[int] = None,
+                 min_persistence: int = 1,
+                 max_persistence: int = DEFAULT_MAX_MODIFICATION_PERSISTENCE,
+                 interval: float = DEFAULT_TUNING_INTERVAL,
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING):
+        self._min_threads: int = max(1, min_threads)
+        self._max_threads: int = max(self._min_threads, max_threads if max_threads is not None else os.cpu_count() or 1)
+        self._min_persistence: int = max(1, min_persistence)
+        self._max_persistence: int = max(self._min_persistence, max_persistence)
+        self._interval: float = interval
+        self._latency_smoothing: float = latency_smoothing
+
+        self._num_threads: int = num_threads
+        self._modification_persistence: int = modification_persistence
+        self._decision: Optional[AutoTuningDecision] = None
+
+        # Analyses and frames are recorded from the processor threads
+        self._lock: Lock = Lock()
+        self._latency: Optional[float] = None
+        self._frames: int = 0
+        self._round_start: float = perf_counter()
+        self._proposal: Optional[AutoTuningDecision] = None
+
+    @property
+    def num_threads(self) -> int:
+        return self._num_threads
+
+    @property
+    def modification_persistence(self) -> int:
+        return self._modification_persistence
+
+    @property
+    def decision(self) -> Optional[AutoTuningDecision]:
+        return self._decision
+
+    def record_frame(self):
+        with self._lock:
+            self._frames += 1
+
+    def record_analysis(self, latency: float) -> Optional[AutoTuningDecision]:
+        # Returns the first decision and the ones changing the tuned values
+        with self._lock:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += self._latency_smoothing * (latency - self._latency)
+
+            now = perf_counter()
+            elapsed = now - self._round_start
+            if elapsed < self._interval:
+                return None
+
+            frame_rate = self._frames / elapsed
+            self._frames = 0
+            self._round_start = now
+
+            # Paused or stalled inputs say nothing about the required throughput
+            if frame_rate <= 0:
+                return None
+
+            proposal = self._propose(self._latency, frame_rate)
+
+            # A change is only applied when two consecutive rounds agree, so transient spikes are ignored
+            agreed = self._proposal is not None and self._proposal.num_threads == proposal.num_threads \
+                and self._proposal.modification_persistence == proposal.modification_persistence
+            self._proposal = proposal
+
+            if not agreed:
+                return None
+
+            changed = self._decision is None or proposal.num_threads != self._num_threads \
+                or proposal.modification_persistence != self._modification_persistence
+
+            self._num_threads = proposal.num_threads
+            self._modification_persistence = proposal.modification_persistence
+            self._decision = proposal
+
+            return proposal if changed else None
+
+    def _propose(self, latency: float, frame_rate: float) -> AutoTuningDecision:
+        # Analyses needed in flight to analyze every frame (Little's law)
+        concurrency = round(latency * frame_rate, 3)  # Avoids an extra thread because of rounding errors
+        num_threads = min(self._max_threads, max(self._min_threads, math.ceil(concurrency)))
+
+        # Frames between consecutive results, so the last modification is kept until the next one arrives
+        gap = max(1.0, concurrency / num_threads)
+        persistence = min(self._max_persistence, max(self._min_persistence, math.ceil(gap) + 1))
+
+        reason = f"analysis takes {latency * 1000:.0f} ms at {frame_rate:.1f} fps, so {concurrency:.1f} analyses " \
+                 f"are needed in flight"
+        if num_threads < math.ceil(concurrency):
+            reason += f" (limited to {num_threads} threads, one result every {gap:.1f} frames)"
+
+        return AutoTuningDecision(num_threads, persistence, latency, frame_rate, reason)
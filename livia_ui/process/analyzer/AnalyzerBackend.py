@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class AnalyzerBackend(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
@@ -0,0 +1,35 @@
+class AutoTuningDecision:
+    def __init__(self, num_threads: int, modification_persistence: int, analysis_latency: float, frame_rate: float,
+                 reason: str):
+        self._num_threads: int = num_threads
+        self._modification_persistence: int = modification_persistence
+        self._analysis_latency: float = analysis_latency
+        self._frame_rate: float = frame_rate
+        self._reason: str = reason
+
+    @property
+    def num_threads(self) -> int:
+        return self._num_threads
+
+    @property
+    def modification_persistence(self) -> int:
+        return self._modification_persistence
+
+    @property
+    def analysis_latency(self) -> float:
+        # Smoothed seconds spent analyzing a frame
+        return self._analysis_latency
+
+    @property
+    def frame_rate(self) -> float:
+        # Frames per second going through the processor
+        return self._frame_rate
+
+    @property
+    def reason(self) -> str:
+        return self._reason
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(threads={self._num_threads}, " \
+               f"persistence={self._modification_persistence}, latency={self._analysis_latency * 1000:.1f}ms, " \
+               f"fps={self._frame_rate:.1f})"
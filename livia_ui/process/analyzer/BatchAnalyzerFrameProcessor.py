@@ -0,0 +1,101 @@
+from time import perf_counter
+from typing import List, Tuple
+
+from numpy import ndarray
+
+from livia.input.FrameInput import FrameInput
+from livia.output.FrameOutput import FrameOutput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia_ui.process.analyzer.BatchFrameAnalyzer import BatchFrameAnalyzer
+
+
+class BatchAnalyzerFrameProcessor:
+    # Processes a whole input analyzing its frames in batches. Frames are read ahead until a batch is complete, so
+    # it is intended for offline inputs, where latency is irrelevant.
+    def __init__(self, frame_input: FrameInput, frame_output: FrameOutput, frame_analyzer: FrameAnalyzer,
+                 batch_size: int):
+        if not isinstance(frame_analyzer, BatchFrameAnalyzer):
+            raise ValueError(f"{frame_analyzer.__class__.__name__} does not support batch analysis")
+
+        self._input: FrameInput = frame_input
+        self._output: FrameOutput = frame_output
+        self._analyzer: FrameAnalyzer = frame_analyzer
+        self._batch_size: int = max(1, batch_size)
+
+        self._processed_frames: int = 0
+        self._batches: int = 0
+        self._elapsed_time: float = 0.0
+
+    @property
+    def input(self) -> FrameInput:
+        return self._input
+
+    @property
+    def output(self) -> FrameOutput:
+        return self._output
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self._analyzer
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def processed_frames(self) -> int:
+        return self._processed_frames
+
+    @property
+    def batches(self) -> int:
+        return self._batches
+
+    @property
+    def frames_per_second(self) -> float:
+        return self._processed_frames / self._elapsed_time if self._elapsed_time > 0 else 0.0
+
+    def process(self):
+        start = perf_counter()
+
+        try:
+            while True:
+                num_frames, frames = self._read_batch()
+                if not frames:
+                    break
+
+                self._process_batch(num_frames, frames)
+
+                if len(frames) < self._batch_size:
+                    break
+        finally:
+            self._elapsed_time = perf_counter() - start
+
+    def close(self):
+        self._input.close()
+        self._output.close()
+
+    def _read_batch(self) -> Tuple[List[int], List[ndarray]]:
+        num_frames = []
+        frames = []
+
+        while len(frames) < self._batch_size:
+            frame = self._input.next_frame()
+            if frame is None:
+                break
+
+            num_frames.append(self._input.get_current_frame_index())
+            frames.append(frame)
+
+        return num_frames, frames
+
+    def _process_batch(self, num_frames: List[int], frames: List[ndarray]):
+        modifications = self._analyzer.analyze_batch(num_frames, frames)
+
+        if len(modifications) != len(frames):
+            raise ValueError(f"{len(modifications)} modifications returned for a batch of {len(frames)} frames")
+
+        for num_frame, frame, modification in zip(num_frames, frames, modifications):
+            self._output.output_frame(num_frame, modification.modify(num_frame, frame))
+
+        self._processed_frames += len(frames)
+        self._batches += 1
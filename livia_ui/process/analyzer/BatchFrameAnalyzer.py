@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from numpy import ndarray
+
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class BatchFrameAnalyzer(ABC):
+    # Implemented by analyzers that analyze several frames at once more efficiently than one by one (e.g. models
+    # running batched inference). Modifications must be returned in the same order as the frames.
+    @abstractmethod
+    def analyze_batch(self, num_frames: List[int], frames: List[ndarray]) -> List[FrameModification]:
+        raise NotImplementedError()
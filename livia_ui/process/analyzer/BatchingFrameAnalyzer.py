@@ -0,0 +1,128 @@
+from threading import Condition, Lock
+from time import perf_counter
+from typing import List, Optional
+
+from numpy import ndarray
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.BatchFrameAnalyzer import BatchFrameAnalyzer
+from livia_ui.process.analyzer.WrapperFrameAnalyzer import WrapperFrameAnalyzer
+
+DEFAULT_BATCH_SIZE: int = 4
+DEFAULT_BATCH_LATENCY: float = 0.05
+
+
+class _BatchRequest:
+    def __init__(self, num_frame: int, frame: ndarray):
+        self.num_frame: int = num_frame
+        self.frame: ndarray = frame
+        self.modification: Optional[FrameModification] = None
+        self.error: Optional[BaseException] = None
+        self.done: bool = False
+
+
+class BatchingFrameAnalyzer(WrapperFrameAnalyzer):
+    # Accumulates the frames analyzed at the same time by several threads and analyzes them as a single batch. Each
+    # call blocks until its batch is analyzed, so batches can not be larger than the number of calling threads. A
+    # batch is analyzed when it is full or when its first frame has waited for max_latency seconds.
+    def __init__(self, wrapped: FrameAnalyzer, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_latency: float = DEFAULT_BATCH_LATENCY):
+        if not isinstance(wrapped, BatchFrameAnalyzer):
+            raise ValueError(f"{wrapped.__class__.__name__} does not support batch analysis")
+
+        super(BatchingFrameAnalyzer, self).__init__(wrapped)
+
+        self._batch_size: int = max(1, batch_size)
+        self._max_latency: float = max_latency
+
+        self._condition: Condition = Condition()
+        self._pending: List[_BatchRequest] = []
+        self._pending_since: float = 0.0
+
+        # Analyzers are not expected to be thread-safe, so batches are analyzed one at a time
+        self._analysis_lock: Lock = Lock()
+
+        self._batches: int = 0
+        self._frames: int = 0
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def max_latency(self) -> float:
+        return self._max_latency
+
+    @property
+    def batches(self) -> int:
+        return self._batches
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self._frames / self._batches if self._batches > 0 else 0.0
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        request = _BatchRequest(num_frame, frame)
+
+        with self._condition:
+            if not self._pending:
+                self._pending_since = perf_counter()
+            self._pending.append(request)
+
+            if len(self._pending) >= self._batch_size:
+                batch = self._take_batch()
+            else:
+                batch = None
+                self._condition.notify_all()
+
+                while not request.done and request in self._pending:
+                    remaining = self._pending_since + self._max_latency - perf_counter()
+                    if remaining <= 0:
+                        batch = self._take_batch()
+                        break
+
+                    self._condition.wait(remaining)
+
+        if batch is not None:
+            self._analyze_batch(batch)
+        else:
+            with self._condition:
+                while not request.done:
+                    self._condition.wait()
+
+        if request.error is not None:
+            raise request.error
+
+        return request.modification
+
+    def _take_batch(self) -> List[_BatchRequest]:
+        batch = self._pending
+        self._pending = []
+
+        return batch
+
+    def _analyze_batch(self, batch: List[_BatchRequest]):
+        try:
+            with self._analysis_lock:
+                modifications = self._wrapped.analyze_batch([request.num_frame for request in batch],
+                                                            [request.frame for request in batch])
+
+            if len(modifications) != len(batch):
+                raise ValueError(f"{len(modifications)} modifications returned for a batch of {len(batch)} frames")
+
+            for request, modification in zip(batch, modifications):
+                request.modification = modification
+        except Exception as error:
+            for request in batch:
+                request.error = error
+
+        with self._condition:
+            self._batches += 1
+            self._frames += len(batch)
+
+            for request in batch:
+                request.done = True
+                request.frame = None
+
+            self._condition.notify_all()
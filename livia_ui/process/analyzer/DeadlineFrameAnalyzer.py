@@ -0,0 +1,37 @@
+from typing import Optional
+
+from numpy import ndarray
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.DeadlineScheduler import DeadlineScheduler
+from livia_ui.process.analyzer.WrapperFrameAnalyzer import WrapperFrameAnalyzer
+
+
+class DeadlineFrameAnalyzer(WrapperFrameAnalyzer):
+    def __init__(self, wrapped: FrameAnalyzer, scheduler: DeadlineScheduler):
+        super(DeadlineFrameAnalyzer, self).__init__(wrapped)
+
+        self._scheduler: DeadlineScheduler = scheduler
+        self._no_change_analyzer: NoChangeFrameAnalyzer = NoChangeFrameAnalyzer()
+        self._last_modification: Optional[FrameModification] = None
+
+    @property
+    def scheduler(self) -> DeadlineScheduler:
+        return self._scheduler
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        if self._scheduler.should_analyze(num_frame):
+            try:
+                modification = self._wrapped.analyze(num_frame, frame)
+            finally:
+                self._scheduler.frame_analyzed(num_frame)
+            self._last_modification = modification
+
+            return modification
+        elif self._last_modification is not None:
+            # The result would be too late to be useful, so the last one is shown instead
+            return self._last_modification
+        else:
+            return self._no_change_analyzer.analyze(num_frame, frame)
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+
+from livia_ui.process.analyzer.SchedulingStatistics import SchedulingStatistics
+
+DEFAULT_LATENCY_BUDGET_FRAMES: float = 2.0
+
+# Capture times of frames still waiting for analysis. Older frames are forgotten, and counted as dropped.
+_MAX_TRACKED_FRAMES: int = 256
+
+
+class DeadlineScheduler:
+    def __init__(self, latency_budget: float, enabled: bool = True):
+        self._latency_budget: float = latency_budget
+        self._enabled: bool = enabled
+
+        self._lock: Lock = Lock()
+        self._capture_times: "OrderedDict[int, float]" = OrderedDict()
+
+        self._captured: int = 0
+        self._analyzed: int = 0
+        self._in_flight: int = 0
+        self._reused: int = 0
+        self._dropped: int = 0
+        self._max_wait: float = 0.0
+
+    @property
+    def latency_budget(self) -> float:
+        # Seconds a frame may wait since it was captured for its analysis to start
+        return self._latency_budget
+
+    @latency_budget.setter
+    def latency_budget(self, latency_budget: float):
+        self._latency_budget = latency_budget
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        self._enabled = enabled
+
+    def frame_captured(self, num_frame: int, timestamp: Optional[float] = None):
+        with self._lock:
+            self._captured += 1
+            self._capture_times[num_frame] = timestamp if timestamp is not None else perf_counter()
+
+            while len(self._capture_times) > _MAX_TRACKED_FRAMES:
+                self._capture_times.popitem(last=False)
+                self._dropped += 1
+
+    def should_analyze(self, num_frame: int) -> bool:
+        # Called when the analysis of a frame is about to start. Frames without a known capture time are fresh.
+        with self._lock:
+            capture_time = self._capture_times.pop(num_frame, None)
+            wait = perf_counter() - capture_time if capture_time is not None else 0.0
+
+            if self._enabled and wait > self._latency_budget:
+                self._reused += 1
+                return False
+            else:
+                self._in_flight += 1
+                self._max_wait = max(self._max_wait, wait)
+                return True
+
+    def frame_analyzed(self, num_frame: int):
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._analyzed += 1
+
+    def frame_output(self, num_frame: int):
+        # Frames output without reaching the analyzer were dropped by the processor (e.g. all its threads were busy)
+        with self._lock:
+            if self._capture_times.pop(num_frame, None) is not None:
+                self._dropped += 1
+
+    def get_statistics(self) -> SchedulingStatistics:
+        with self._lock:
+            return SchedulingStatistics(self._captured, self._analyzed, self._reused, self._dropped, self._in_flight,
+                                        self._max_wait * 1000)
+
+    def reset_statistics(self):
+        with self._lock:
+            self._capture_times.clear()
+            self._captured = 0
+            self._analyzed = 0
+            self._in_flight = 0
+            self._reused = 0
+            self._dropped = 0
+            self._max_wait = 0.0
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia_ui.benchmarking import get_rss_bytes
+from livia_ui.gui import LIVIA_GUI_LOGGER
+from livia_ui.process.analyzer import close_frame_analyzer
+from livia_ui.process.analyzer.FrameAnalyzerPoolStatistics import FrameAnalyzerPoolStatistics
+
+DEFAULT_ANALYZER_POOL_SIZE: int = 4
+
+
+class FrameAnalyzerPool:
+    def __init__(self, max_size: int = DEFAULT_ANALYZER_POOL_SIZE, max_memory_bytes: Optional[int] = None,
+                 is_in_use: Optional[Callable[[FrameAnalyzer], bool]] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._max_size: int = max_size
+        self._max_memory_bytes: Optional[int] = max_memory_bytes
+
+        # Evicted analyzers are closed, unless they are still in use. Their users close them when they replace them.
+        self._is_in_use: Optional[Callable[[FrameAnalyzer], bool]] = is_in_use
+
+        # Analyzers with their estimated memory, from the least to the most recently used
+        self._analyzers: "OrderedDict[str, Tuple[FrameAnalyzer, int]]" = OrderedDict()
+        self._lock: Lock = Lock()
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def max_memory_bytes(self) -> Optional[int]:
+        return self._max_memory_bytes
+
+    def get(self, fingerprint: str) -> Optional[FrameAnalyzer]:
+        with self._lock:
+            entry = self._analyzers.get(fingerprint)
+
+            if entry is None:
+                self._misses += 1
+                return None
+            else:
+                self._hits += 1
+                self._analyzers.move_to_end(fingerprint)
+                return entry[0]
+
+    def get_or_create(self, fingerprint: str, factory: Callable[[], FrameAnalyzer]) -> Tuple[FrameAnalyzer, bool]:
+        analyzer = self.get(fingerprint)
+
+        if analyzer is not None:
+            return analyzer, True
+
+        # The memory taken by the analyzer is approximated with the growth of the process while it is built, which
+        # also includes whatever other threads (e.g. the video) allocate or free meanwhile. Lazy allocations (e.g.
+        # models loaded in the first analysis) are not accounted.
+        rss_before = get_rss_bytes()
+        analyzer = factory()
+        rss_after = get_rss_bytes()
+
+        memory = max(0, rss_after - rss_before) if rss_before is not None and rss_after is not None else 0
+
+        self.put(fingerprint, analyzer, memory)
+
+        return analyzer, False
+
+    def put(self, fingerprint: str, analyzer: FrameAnalyzer, memory_bytes: int = 0):
+        with self._lock:
+            self._analyzers[fingerprint] = (analyzer, memory_bytes)
+            self._analyzers.move_to_end(fingerprint)
+
+            evicted = self._evict_exceeding()
+
+        self._close(evicted)
+
+    def contains(self, fingerprint: str) -> bool:
+        with self._lock:
+            return fingerprint in self._analyzers
+
+    def evict(self, fingerprint: str) -> bool:
+        with self._lock:
+            entry = self._analyzers.pop(fingerprint, None)
+
+            if entry is None:
+                return False
+
+            self._evictions += 1
+
+        self._close([entry[0]])
+        return True
+
+    def contains_analyzer(self, analyzer: FrameAnalyzer) -> bool:
+        with self._lock:
+            return any(pooled is analyzer for pooled, _ in self._analyzers.values())
+
+    def rekey(self, old_fingerprint: str, new_fingerprint: str) -> bool:
+        # Used when a pooled analyzer is reconfigured in place, so it matches another configuration
+        with self._lock:
+            if old_fingerprint not in self._analyzers or new_fingerprint in self._analyzers:
+                return False
+
+            self._analyzers[new_fingerprint] = self._analyzers.pop(old_fingerprint)
+            return True
+
+    def retain(self, fingerprints: Iterable[str]):
+        fingerprints = set(fingerprints)
+
+        with self._lock:
+            evicted = []
+            for fingerprint in [fingerprint for fingerprint in self._analyzers if fingerprint not in fingerprints]:
+                evicted.append(self._analyzers.pop(fingerprint)[0])
+                self._evictions += 1
+
+        self._close(evicted)
+
+    def clear(self):
+        with self._lock:
+            evicted = [analyzer for analyzer, _ in self._analyzers.values()]
+            self._evictions += len(self._analyzers)
+            self._analyzers.clear()
+
+        self._close(evicted)
+
+    def get_statistics(self) -> FrameAnalyzerPoolStatistics:
+        with self._lock:
+            return FrameAnalyzerPoolStatistics(self._hits, self._misses, self._evictions, len(self._analyzers),
+                                               self._memory_bytes())
+
+    def reset_statistics(self):
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _memory_bytes(self) -> int:
+        return sum(memory for _, memory in self._analyzers.values())
+
+    def _evict_exceeding(self) -> List[FrameAnalyzer]:
+        # The most recently used analyzer is always kept, even if it exceeds the memory limit by itself
+        evicted = []
+        while len(self._analyzers) > 1 and (
+                len(self._analyzers) > self._max_size
+                or (self._max_memory_bytes is not None and self._memory_bytes() > self._max_memory_bytes)
+        ):
+            evicted.append(self._analyzers.popitem(last=False)[1][0])
+            self._evictions += 1
+
+        return evicted
+
+    def _close(self, analyzers: List[FrameAnalyzer]):
+        # Closing may wait for analyses in progress, so it is done out of the lock
+        for analyzer in analyzers:
+            if self._is_in_use is not None and self._is_in_use(analyzer):
+                continue
+
+            try:
+                close_frame_analyzer(analyzer)
+            except Exception:
+                LIVIA_GUI_LOGGER.exception("Evicted analyzer could not be closed")
@@ -0,0 +1,37 @@
+class FrameAnalyzerPoolStatistics:
+    def __init__(self, hits: int, misses: int, evictions: int, size: int, memory_bytes: int):
+        self._hits: int = hits
+        self._misses: int = misses
+        self._evictions: int = evictions
+        self._size: int = size
+        self._memory_bytes: int = memory_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def memory_bytes(self) -> int:
+        # Approximation from the growth of the process while the analyzers were built, not an exact measurement
+        return self._memory_bytes
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self._hits + self._misses
+        return self._hits / requests if requests > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(hits={self._hits}, misses={self._misses}, " \
+               f"evictions={self._evictions}, size={self._size}, memory=~{self._memory_bytes / (1024 * 1024):.1f}MB)"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from hashlib import sha1
+from io import IOBase
+from typing import Any, Dict, Optional, Type
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerManager import FrameAnalyzerManager
+
+
+class _FileValue:
+    # Open files can not be sent to other processes, so they are opened again with the same name and mode
+    def __init__(self, file: IOBase):
+        self._name: str = getattr(file, "name")
+        self._mode: str = getattr(file, "mode", "r")
+        self._encoding: Optional[str] = getattr(file, "encoding", None)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def open(self) -> IOBase:
+        if "b" in self._mode:
+            return open(self._name, self._mode)
+        else:
+            return open(self._name, self._mode, encoding=self._encoding)
+
+
+class FrameAnalyzerSpec:
+    # Picklable description of an analyzer (and its children), so it can be built again in worker processes. The
+    # analyzer class is pickled by reference, so importing it in the worker registers its metadata.
+    def __init__(self, analyzer_class: Type[FrameAnalyzer], analyzer_id: str, values: Dict[str, Any],
+                 child: Optional[FrameAnalyzerSpec] = None):
+        self._analyzer_class: Type[FrameAnalyzer] = analyzer_class
+        self._analyzer_id: str = analyzer_id
+        self._values: Dict[str, Any] = {
+            prop_id: _FileValue(value) if isinstance(value, IOBase) and hasattr(value, "name") else value
+            for prop_id, value in values.items()
+        }
+        self._child: Optional[FrameAnalyzerSpec] = child
+
+    @property
+    def analyzer_id(self) -> str:
+        return self._analyzer_id
+
+    @property
+    def child(self) -> Optional[FrameAnalyzerSpec]:
+        return self._child
+
+    @child.setter
+    def child(self, child: Optional[FrameAnalyzerSpec]):
+        self._child = child
+
+    def fingerprint(self) -> str:
+        # Identifies the analysis described, regardless of the order of the values. Files are identified by name
+        values = sorted(
+            (prop_id, repr(value.name if isinstance(value, _FileValue) else value))
+            for prop_id, value in self._values.items()
+        )
+        child = self._child.fingerprint() if self._child is not None else None
+
+        return sha1(repr((self._analyzer_id, values, child)).encode("utf-8")).hexdigest()
+
+    def build(self) -> FrameAnalyzer:
+        metadata = FrameAnalyzerManager.get_metadata_by_id(self._analyzer_id)
+        analyzer = self._analyzer_class()
+
+        for prop in metadata.properties:
+            if prop.id in self._values:
+                value = self._values[prop.id]
+                prop.set_value(analyzer, value.open() if isinstance(value, _FileValue) else value)
+
+        if self._child is not None:
+            analyzer.child = self._child.build()
+
+        return analyzer
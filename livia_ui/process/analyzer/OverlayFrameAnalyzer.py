@@ -0,0 +1,58 @@
+from typing import Callable, List, Optional
+
+from numpy import ndarray
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia.process.listener.EventListeners import EventListeners
+from livia_ui.process.analyzer.WrapperFrameAnalyzer import WrapperFrameAnalyzer
+from livia_ui.process.analyzer.listener.OverlayEvent import OverlayEvent
+from livia_ui.process.analyzer.listener.OverlayListener import OverlayListener
+from livia_ui.process.analyzer.modification.HasOverlayShapes import HasOverlayShapes
+from livia_ui.process.analyzer.modification.OverlayFrameModification import OverlayFrameModification
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+from livia_ui.process.analyzer.modification.SnapshotFrameModification import SnapshotFrameModification
+
+
+class OverlayFrameAnalyzer(WrapperFrameAnalyzer):
+    def __init__(self, wrapped: FrameAnalyzer, overlay_enabled: bool = True,
+                 snapshot_callback: Optional[Callable[[int, ndarray], None]] = None):
+        super(OverlayFrameAnalyzer, self).__init__(wrapped)
+
+        self._overlay_enabled: bool = overlay_enabled
+
+        # Receives copies of the frames before modifications are drawn into them. Frames with overlays are not copied,
+        # as they are not modified.
+        self._snapshot_callback: Optional[Callable[[int, ndarray], None]] = snapshot_callback
+        self._listeners: EventListeners[OverlayListener] = EventListeners[OverlayListener]()
+
+    @property
+    def overlay_enabled(self) -> bool:
+        return self._overlay_enabled
+
+    @overlay_enabled.setter
+    def overlay_enabled(self, overlay_enabled: bool):
+        self._overlay_enabled = overlay_enabled
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        modification = self._wrapped.analyze(num_frame, frame)
+
+        # When disabled (e.g. frames are also recorded), modifications are drawn into the frames as usual
+        if self._overlay_enabled and isinstance(modification, HasOverlayShapes):
+            return OverlayFrameModification(modification.get_overlay_shapes(), self._on_overlay)
+        elif self._snapshot_callback is not None:
+            return SnapshotFrameModification(modification, self._snapshot_callback)
+        else:
+            return modification
+
+    def _on_overlay(self, num_frame: int, shapes: List[OverlayShape]):
+        self._listeners.notify(OverlayListener.overlay_changed, OverlayEvent(self, num_frame, shapes))
+
+    def add_overlay_listener(self, listener: OverlayListener):
+        self._listeners.append(listener)
+
+    def remove_overlay_listener(self, listener: OverlayListener):
+        self._listeners.remove(listener)
+
+    def has_overlay_listener(self, listener: OverlayListener) -> bool:
+        return listener in self._listeners
@@ -0,0 +1,227 @@
+from queue import Queue, Empty, Full
+from threading import Condition, Thread
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from numpy import ndarray
+
+from livia.input.FrameInput import FrameInput
+from livia.output.FrameOutput import FrameOutput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.StageUtilization import StageUtilization
+
+DEFAULT_QUEUE_SIZE: int = 8
+
+DECODE_STAGE: str = "decode"
+ANALYSIS_STAGE: str = "analysis"
+ENCODE_STAGE: str = "encode"
+
+_POLL_INTERVAL: float = 0.1
+
+_END = object()
+
+
+class PipelinedFrameProcessor:
+    # Processes a whole input with decoding, analysis and encoding running at the same time, so the throughput is
+    # limited by the slowest stage instead of by the sum of all of them. Frames are analyzed by several workers and
+    # reassembled in order before being encoded. Queues are bounded, so a slow stage holds back the previous ones
+    # instead of accumulating frames in memory. Every frame is analyzed, as it is intended for offline inputs.
+    # The modification callback receives the modifications in input order. Without output, frames are not modified.
+    def __init__(self, frame_input: FrameInput, frame_output: Optional[FrameOutput], frame_analyzer: FrameAnalyzer,
+                 analysis_workers: int = 1, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 modification_callback: Optional[Callable[[int, FrameModification], None]] = None):
+        self._input: FrameInput = frame_input
+        self._output: Optional[FrameOutput] = frame_output
+        self._modification_callback: Optional[Callable[[int, FrameModification], None]] = modification_callback
+        self._analyzer: FrameAnalyzer = frame_analyzer
+        self._analysis_workers: int = max(1, analysis_workers)
+        self._queue_size: int = max(1, queue_size)
+
+        self._frames: "Queue[Any]" = Queue(self._queue_size)
+
+        # Analyzed frames waiting for the previous ones, by their position in the input
+        self._results: Dict[int, Tuple[int, FrameModification, Optional[ndarray]]] = {}
+        self._results_condition: Condition = Condition()
+        self._reorder_capacity: int = self._queue_size + self._analysis_workers
+        self._next_encoded: int = 0
+        self._decoded_frames: Optional[int] = None
+
+        self._stopping: bool = False
+        self._error: Optional[BaseException] = None
+
+        self._decode_busy: float = 0.0
+        self._analysis_busy: List[float] = [0.0] * self._analysis_workers
+        self._encode_busy: float = 0.0
+        self._processed_frames: int = 0
+        self._elapsed_time: float = 0.0
+
+    @property
+    def input(self) -> FrameInput:
+        return self._input
+
+    @property
+    def output(self) -> Optional[FrameOutput]:
+        return self._output
+
+    @property
+    def frame_analyzer(self) -> FrameAnalyzer:
+        return self._analyzer
+
+    @property
+    def analysis_workers(self) -> int:
+        return self._analysis_workers
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue_size
+
+    @property
+    def processed_frames(self) -> int:
+        return self._processed_frames
+
+    @property
+    def frames_per_second(self) -> float:
+        return self._processed_frames / self._elapsed_time if self._elapsed_time > 0 else 0.0
+
+    def get_stage_utilizations(self) -> List[StageUtilization]:
+        return [
+            StageUtilization(DECODE_STAGE, 1, self._decode_busy, self._elapsed_time),
+            StageUtilization(ANALYSIS_STAGE, self._analysis_workers, sum(self._analysis_busy), self._elapsed_time),
+            StageUtilization(ENCODE_STAGE, 1, self._encode_busy, self._elapsed_time)
+        ]
+
+    def process(self):
+        threads = [Thread(target=self._run_stage, args=(self._decode,), name="livia-pipeline-decode", daemon=True)]
+        threads.extend(
+            Thread(target=self._run_stage, args=(self._analyze, worker), name=f"livia-pipeline-analysis-{worker}",
+                   daemon=True)
+            for worker in range(self._analysis_workers)
+        )
+
+        start = perf_counter()
+        for thread in threads:
+            thread.start()
+
+        try:
+            # Encoding runs in the calling thread, as outputs may not be used from other threads
+            self._encode()
+        finally:
+            self._stop()
+            for thread in threads:
+                thread.join()
+
+            self._elapsed_time = perf_counter() - start
+
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        self._input.close()
+        if self._output is not None:
+            self._output.close()
+
+    def _run_stage(self, stage: Callable[..., None], *args):
+        try:
+            stage(*args)
+        except BaseException as error:
+            if self._error is None:
+                self._error = error
+            self._stop()
+
+    def _stop(self):
+        with self._results_condition:
+            self._stopping = True
+            self._results_condition.notify_all()
+
+    def _decode(self):
+        index = 0
+
+        try:
+            while not self._stopping:
+                start = perf_counter()
+                frame = self._input.next_frame()
+                if frame is None:
+                    break
+
+                num_frame = self._input.get_current_frame_index()
+                self._decode_busy += perf_counter() - start
+
+                if not self._put((index, num_frame, frame)):
+                    break
+
+                index += 1
+        finally:
+            with self._results_condition:
+                self._decoded_frames = index
+                self._results_condition.notify_all()
+
+            for _ in range(self._analysis_workers):
+                self._put(_END)
+
+    def _analyze(self, worker: int):
+        while True:
+            item = self._get()
+            if item is _END:
+                break
+
+            index, num_frame, frame = item
+
+            start = perf_counter()
+            modification = self._analyzer.analyze(num_frame, frame)
+            modified = modification.modify(num_frame, frame) if self._output is not None else None
+            self._analysis_busy[worker] += perf_counter() - start
+
+            with self._results_condition:
+                # Frames far ahead of the one being waited for are held back, so a slow frame bounds the memory used
+                while index >= self._next_encoded + self._reorder_capacity and not self._stopping:
+                    self._results_condition.wait()
+
+                if self._stopping:
+                    break
+
+                self._results[index] = (num_frame, modification, modified)
+                self._results_condition.notify_all()
+
+    def _encode(self):
+        index = 0
+
+        while True:
+            with self._results_condition:
+                while index not in self._results and not self._stopping \
+                        and (self._decoded_frames is None or index < self._decoded_frames):
+                    self._results_condition.wait()
+
+                if index not in self._results or self._error is not None:
+                    break
+
+                num_frame, modification, frame = self._results.pop(index)
+                self._next_encoded = index + 1
+                self._results_condition.notify_all()
+
+            start = perf_counter()
+            if self._modification_callback is not None:
+                self._modification_callback(num_frame, modification)
+            if self._output is not None:
+                self._output.output_frame(num_frame, frame)
+            self._encode_busy += perf_counter() - start
+
+            self._processed_frames += 1
+            index += 1
+
+    def _put(self, item: Any) -> bool:
+        while True:
+            try:
+                self._frames.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                if self._stopping:
+                    return False
+
+    def _get(self) -> Any:
+        while True:
+            try:
+                return self._frames.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                if self._stopping:
+                    return _END
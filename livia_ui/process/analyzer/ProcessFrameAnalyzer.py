@@ -0,0 +1,224 @@
+import multiprocessing
+import traceback
+import weakref
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from queue import Queue
+from threading import Lock
+from typing import Any, List, Optional, Tuple
+
+from numpy import ndarray
+
+from livia import LIVIA_LOGGER
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+from livia_ui.process.analyzer.SharedFrameSlot import SharedFrameSlot, DEFAULT_SLOT_CAPACITY
+
+_POLL_INTERVAL: float = 0.1
+
+
+class WorkerCrashedError(RuntimeError):
+    pass
+
+
+def _run_worker(connection: Connection, spec: FrameAnalyzerSpec):
+    try:
+        analyzer = spec.build()
+    except Exception:
+        connection.send(("failed", traceback.format_exc()))
+        return
+
+    connection.send(("ready", None))
+
+    memory: Optional[SharedMemory] = None
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+
+            if message[0] == "close":
+                break
+
+            _, num_frame, name, shape, dtype = message
+            memory = SharedFrameSlot.attach(name, memory)
+
+            # The frame is read in place, so only the modification goes back through the pipe
+            frame = SharedFrameSlot.view(memory, shape, dtype)
+            try:
+                connection.send(("ok", analyzer.analyze(num_frame, frame)))
+            except Exception:
+                connection.send(("error", traceback.format_exc()))
+            finally:
+                del frame
+    finally:
+        if memory is not None:
+            memory.close()
+
+
+class _AnalyzerWorker:
+    def __init__(self, context: Any, spec: FrameAnalyzerSpec, slot_capacity: int):
+        self._context: Any = context
+        self._spec: FrameAnalyzerSpec = spec
+        self._slot: SharedFrameSlot = SharedFrameSlot(slot_capacity)
+        self._process: Optional[multiprocessing.Process] = None
+        self._connection: Optional[Connection] = None
+
+    def start(self):
+        self._connection, child_connection = self._context.Pipe()
+        self._process = self._context.Process(target=_run_worker, args=(child_connection, self._spec),
+                                              name="livia-analyzer-worker", daemon=True)
+        self._process.start()
+        child_connection.close()
+
+        status, value = self._receive()
+        if status == "failed":
+            self.stop()
+            raise RuntimeError("Analyzer could not be built in the worker process:\n" + value)
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        if self._process is None:
+            raise WorkerCrashedError("Analyzer worker process is not running")
+
+        shape, dtype = self._slot.write(frame)
+
+        try:
+            self._connection.send(("analyze", num_frame, self._slot.name, shape, dtype))
+        except (BrokenPipeError, ConnectionResetError, EOFError):
+            raise WorkerCrashedError(self._describe_exit())
+
+        status, value = self._receive()
+        if status == "error":
+            raise RuntimeError("Analyzer failed in the worker process:\n" + value)
+
+        return value
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def stop(self):
+        if self._process is not None:
+            if self._process.is_alive():
+                try:
+                    self._connection.send(("close",))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+                self._process.join(1)
+                if self._process.is_alive():
+                    self._process.terminate()
+                    self._process.join()
+
+            self._connection.close()
+            self._process = None
+            self._connection = None
+
+    def close(self):
+        self.stop()
+        self._slot.close()
+
+    def _receive(self) -> Tuple[str, Any]:
+        # Polling allows detecting workers killed without answering (e.g. segmentation faults or the OOM killer)
+        while not self._connection.poll(_POLL_INTERVAL):
+            if not self._process.is_alive() and not self._connection.poll():
+                raise WorkerCrashedError(self._describe_exit())
+
+        try:
+            return self._connection.recv()
+        except (EOFError, ConnectionResetError):
+            raise WorkerCrashedError(self._describe_exit())
+
+    def _describe_exit(self) -> str:
+        self._process.join(_POLL_INTERVAL)
+        return f"Analyzer worker process exited with code {self._process.exitcode}"
+
+
+def _close_workers(workers: List[_AnalyzerWorker]):
+    for worker in workers:
+        worker.close()
+
+
+class ProcessFrameAnalyzer(FrameAnalyzer):
+    # Runs copies of an analyzer in worker processes, so analyses of concurrent frames are not serialized by the GIL.
+    # Each call blocks the calling thread until a worker analyzes the frame, so the processor threads bound the
+    # number of frames analyzed at the same time.
+    def __init__(self, spec: FrameAnalyzerSpec, num_workers: int, slot_capacity: int = DEFAULT_SLOT_CAPACITY):
+        super(ProcessFrameAnalyzer, self).__init__()
+
+        self._spec: FrameAnalyzerSpec = spec
+        self._no_change_analyzer: NoChangeFrameAnalyzer = NoChangeFrameAnalyzer()
+        self._restarts: int = 0
+        self._restarts_lock: Lock = Lock()
+        self._closed: bool = False
+        self._close_lock: Lock = Lock()
+
+        # Spawned workers do not inherit the threads (and locks) of this process
+        context = multiprocessing.get_context("spawn")
+        self._workers: List[_AnalyzerWorker] = [
+            _AnalyzerWorker(context, spec, slot_capacity) for _ in range(max(1, num_workers))
+        ]
+        self._finalizer = weakref.finalize(self, _close_workers, list(self._workers))
+
+        try:
+            for worker in self._workers:
+                worker.start()
+        except Exception:
+            self._finalizer()
+            raise
+
+        self._idle_workers: "Queue[_AnalyzerWorker]" = Queue()
+        for worker in self._workers:
+            self._idle_workers.put(worker)
+
+    @property
+    def spec(self) -> FrameAnalyzerSpec:
+        return self._spec
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    @property
+    def restarts(self) -> int:
+        return self._restarts
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        worker = self._idle_workers.get()
+        try:
+            if self._closed:
+                return self._no_change_analyzer.analyze(num_frame, frame)
+
+            return worker.analyze(num_frame, frame)
+        except WorkerCrashedError as error:
+            LIVIA_LOGGER.error(f"{error}. Restarting it")
+
+            with self._restarts_lock:
+                self._restarts += 1
+
+            try:
+                worker.restart()
+            except Exception:
+                LIVIA_LOGGER.exception("Analyzer worker process could not be restarted")
+
+            # The frame is not analyzed again, as it may be the reason of the crash
+            return self._no_change_analyzer.analyze(num_frame, frame)
+        finally:
+            self._idle_workers.put(worker)
+
+    def close(self):
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        # Analyses in progress finish before their workers are stopped. Later ones are not analyzed.
+        workers = [self._idle_workers.get() for _ in self._workers]
+        try:
+            self._finalizer()
+        finally:
+            for worker in workers:
+                self._idle_workers.put(worker)
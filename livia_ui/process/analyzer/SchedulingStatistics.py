@@ -0,0 +1,43 @@
+class SchedulingStatistics:
+    def __init__(self, captured: int, analyzed: int, reused: int, dropped: int, in_flight: int, max_wait_msec: float):
+        self._captured: int = captured
+        self._analyzed: int = analyzed
+        self._reused: int = reused
+        self._dropped: int = dropped
+        self._in_flight: int = in_flight
+        self._max_wait_msec: float = max_wait_msec
+
+    @property
+    def captured(self) -> int:
+        return self._captured
+
+    @property
+    def analyzed(self) -> int:
+        # Frames whose analysis finished
+        return self._analyzed
+
+    @property
+    def reused(self) -> int:
+        # Frames skipped because their deadline passed, which were shown with the previous modification
+        return self._reused
+
+    @property
+    def dropped(self) -> int:
+        # Frames output (or forgotten) without being handed to the analyzer by the processor (e.g. all its threads
+        # were busy)
+        return self._dropped
+
+    @property
+    def in_flight(self) -> int:
+        # Frames being analyzed, not counted as analyzed until they finish
+        return self._in_flight
+
+    @property
+    def max_wait_msec(self) -> float:
+        # Longest time an analyzed frame waited since it was captured
+        return self._max_wait_msec
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(captured={self._captured}, analyzed={self._analyzed}, " \
+               f"reused={self._reused}, dropped={self._dropped}, in_flight={self._in_flight}, " \
+               f"max_wait={self._max_wait_msec:.1f}ms)"
@@ -0,0 +1,51 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+DEFAULT_SLOT_CAPACITY: int = 1920 * 1080 * 3
+
+
+class SharedFrameSlot:
+    def __init__(self, capacity: int = DEFAULT_SLOT_CAPACITY):
+        self._memory: SharedMemory = SharedMemory(create=True, size=max(1, capacity))
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._memory.size
+
+    def write(self, frame: ndarray) -> Tuple[Tuple[int, ...], str]:
+        if frame.nbytes > self._memory.size:
+            # Readers attach to the new memory when its name changes
+            self.close()
+            self._memory = SharedMemory(create=True, size=frame.nbytes)
+
+        np.copyto(np.ndarray(frame.shape, frame.dtype, buffer=self._memory.buf), frame)
+
+        return frame.shape, frame.dtype.str
+
+    def close(self):
+        self._memory.close()
+        try:
+            self._memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def attach(name: str, previous: Optional[SharedMemory] = None) -> SharedMemory:
+        if previous is not None:
+            if previous.name == name:
+                return previous
+            previous.close()
+
+        # Worker processes share the resource tracker of their parent, which unlinks the memory if it crashes
+        return SharedMemory(name=name)
+
+    @staticmethod
+    def view(memory: SharedMemory, shape: Tuple[int, ...], dtype: str) -> ndarray:
+        return np.ndarray(shape, np.dtype(dtype), buffer=memory.buf)
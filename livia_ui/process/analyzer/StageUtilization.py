@@ -0,0 +1,34 @@
+class StageUtilization:
+    def __init__(self, stage: str, workers: int, busy_seconds: float, elapsed_seconds: float):
+        self._stage: str = stage
+        self._workers: int = workers
+        self._busy_seconds: float = busy_seconds
+        self._elapsed_seconds: float = elapsed_seconds
+
+    @property
+    def stage(self) -> str:
+        return self._stage
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def busy_seconds(self) -> float:
+        return self._busy_seconds
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self._elapsed_seconds
+
+    @property
+    def utilization(self) -> float:
+        # Fraction of the time the workers of the stage were working instead of waiting for the other stages
+        if self._elapsed_seconds <= 0:
+            return 0.0
+
+        return min(1.0, self._busy_seconds / (self._elapsed_seconds * self._workers))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(stage={self._stage}, workers={self._workers}, " \
+               f"busy={self._busy_seconds:.3f}s, utilization={self.utilization * 100:.1f}%)"
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class TemporalFrameAnalyzer(ABC):
+    # Implemented by analyzers whose results depend on the previous frames (e.g. trackers or temporal smoothing).
+    # When a video is processed in independent parts, each part starts analyzing these frames earlier, so the
+    # analyzer has the same context at the first frame of the part as when the video is processed at once.
+    @abstractmethod
+    def get_context_frames(self) -> int:
+        raise NotImplementedError()
@@ -0,0 +1,31 @@
+from time import perf_counter
+from typing import Callable, Optional
+
+from numpy import ndarray
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.WrapperFrameAnalyzer import WrapperFrameAnalyzer
+from livia_ui.process.analyzer.modification.HasOverlayShapes import HasOverlayShapes
+from livia_ui.process.analyzer.modification.TimedFrameModification import TimedFrameModification
+
+
+class TimedFrameAnalyzer(WrapperFrameAnalyzer):
+    def __init__(self, wrapped: FrameAnalyzer, analyzed_callback: Callable[[int, float], None],
+                 modified_callback: Optional[Callable[[int, float], None]] = None):
+        super(TimedFrameAnalyzer, self).__init__(wrapped)
+
+        # Receive the frame number and the seconds spent analyzing or modifying it
+        self._analyzed_callback: Callable[[int, float], None] = analyzed_callback
+        self._modified_callback: Optional[Callable[[int, float], None]] = modified_callback
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        start = perf_counter()
+        modification = self._wrapped.analyze(num_frame, frame)
+        self._analyzed_callback(num_frame, perf_counter() - start)
+
+        # Modifications with overlay shapes are not wrapped, as they are drawn by the display instead
+        if self._modified_callback is not None and not isinstance(modification, HasOverlayShapes):
+            modification = TimedFrameModification(modification, self._modified_callback)
+
+        return modification
@@ -0,0 +1,18 @@
+from numpy import ndarray
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class WrapperFrameAnalyzer(FrameAnalyzer):
+    def __init__(self, wrapped: FrameAnalyzer):
+        super(WrapperFrameAnalyzer, self).__init__()
+
+        self._wrapped: FrameAnalyzer = wrapped
+
+    @property
+    def wrapped(self) -> FrameAnalyzer:
+        return self._wrapped
+
+    def analyze(self, num_frame: int, frame: ndarray) -> FrameModification:
+        return self._wrapped.analyze(num_frame, frame)
@@ -0,0 +1,61 @@
+import sys
+from typing import Optional, TextIO
+
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.FrameAnalyzerMetadata import FrameAnalyzerPropertyMetadata
+from livia_ui.process.analyzer.BatchFrameAnalyzer import BatchFrameAnalyzer
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+from livia_ui.process.analyzer.TemporalFrameAnalyzer import TemporalFrameAnalyzer
+from livia_ui.process.analyzer.WrapperFrameAnalyzer import WrapperFrameAnalyzer
+
+# Hint of the properties that can only be changed by building a new analyzer
+REBUILD_HINT: str = "rebuild"
+
+
+def unwrap_frame_analyzer(analyzer: FrameAnalyzer) -> FrameAnalyzer:
+    while isinstance(analyzer, WrapperFrameAnalyzer):
+        analyzer = analyzer.wrapped
+
+    return analyzer
+
+
+def build_process_frame_analyzer(spec: FrameAnalyzerSpec, num_workers: int) -> FrameAnalyzer:
+    # Frames are sent to the workers through shared memory, which is only available since Python 3.8. It is imported
+    # here, so the thread backend does not depend on it.
+    if sys.version_info < (3, 8):
+        raise RuntimeError("The process analyzer backend requires Python 3.8 or newer")
+
+    from livia_ui.process.analyzer.ProcessFrameAnalyzer import ProcessFrameAnalyzer
+    return ProcessFrameAnalyzer(spec, num_workers)
+
+
+def close_frame_analyzer(analyzer: FrameAnalyzer):
+    # Analyzers holding resources (e.g. worker processes or shared memory) release them when they are closed
+    close = getattr(analyzer, "close", None)
+    if callable(close):
+        close()
+
+
+def requires_analyzer_rebuild(prop: FrameAnalyzerPropertyMetadata) -> bool:
+    # Files usually are models or weights, which are only loaded when the analyzer is built
+    return REBUILD_HINT in prop.hints or prop.prop_type is TextIO or prop.prop_type is Optional[TextIO]
+
+
+def supports_batch_analysis(analyzer: FrameAnalyzer) -> bool:
+    # Children analyze the frames one by one, so chained analyzers can not be batched
+    return isinstance(analyzer, BatchFrameAnalyzer) and getattr(analyzer, "child", None) is None
+
+
+def get_context_frames(analyzer: Optional[FrameAnalyzer]) -> int:
+    # Frames of context needed by the analyzer or any of its children
+    context_frames = 0
+
+    while analyzer is not None:
+        analyzer = unwrap_frame_analyzer(analyzer)
+
+        if isinstance(analyzer, TemporalFrameAnalyzer):
+            context_frames = max(context_frames, analyzer.get_context_frames())
+
+        analyzer = getattr(analyzer, "child", None)
+
+    return context_frames
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import List, TYPE_CHECKING
+
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+if TYPE_CHECKING:
+    from livia_ui.process.analyzer.OverlayFrameAnalyzer import OverlayFrameAnalyzer
+
+
+class OverlayEvent:
+    def __init__(self, analyzer: OverlayFrameAnalyzer, num_frame: int, shapes: List[OverlayShape]):
+        self._analyzer: OverlayFrameAnalyzer = analyzer
+        self._num_frame: int = num_frame
+        self._shapes: List[OverlayShape] = shapes
+
+    @property
+    def analyzer(self) -> OverlayFrameAnalyzer:
+        return self._analyzer
+
+    @property
+    def num_frame(self) -> int:
+        return self._num_frame
+
+    @property
+    def shapes(self) -> List[OverlayShape]:
+        return self._shapes
@@ -0,0 +1,7 @@
+from livia.process.listener.EventListener import EventListener
+from livia_ui.process.analyzer.listener.OverlayEvent import OverlayEvent
+
+
+class OverlayListener(EventListener):
+    def overlay_changed(self, event: OverlayEvent) -> None:
+        pass
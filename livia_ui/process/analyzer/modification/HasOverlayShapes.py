@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+
+class HasOverlayShapes(ABC):
+    @abstractmethod
+    def get_overlay_shapes(self) -> List[OverlayShape]:
+        raise NotImplementedError()
@@ -0,0 +1,24 @@
+from typing import Callable, List
+
+from numpy import ndarray
+
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+
+
+class OverlayFrameModification(FrameModification):
+    def __init__(self, shapes: List[OverlayShape], overlay_callback: Callable[[int, List[OverlayShape]], None]):
+        super(OverlayFrameModification, self).__init__()
+
+        self._shapes: List[OverlayShape] = shapes
+        self._overlay_callback: Callable[[int, List[OverlayShape]], None] = overlay_callback
+
+    @property
+    def shapes(self) -> List[OverlayShape]:
+        return self._shapes
+
+    def modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        # The frame is not touched: shapes are drawn by the display, so no copy is needed
+        self._overlay_callback(num_frame, self._shapes)
+
+        return frame
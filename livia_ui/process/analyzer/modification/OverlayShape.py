@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+
+class OverlayShape:
+    def __init__(self, points: Sequence[Tuple[float, float]], closed: bool = True,
+                 color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2, label: Optional[str] = None,
+                 score: Optional[float] = None):
+        self._points: Tuple[Tuple[float, float], ...] = tuple(points)
+        self._closed: bool = closed
+        self._color: Tuple[int, int, int] = color
+        self._thickness: int = thickness
+        self._label: Optional[str] = label
+        self._score: Optional[float] = score
+
+    @staticmethod
+    def rectangle(x1: float, y1: float, x2: float, y2: float, color: Tuple[int, int, int] = (0, 255, 0),
+                  thickness: int = 2, label: Optional[str] = None, score: Optional[float] = None) -> OverlayShape:
+        return OverlayShape(((x1, y1), (x2, y1), (x2, y2), (x1, y2)), True, color, thickness, label, score)
+
+    @property
+    def points(self) -> Tuple[Tuple[float, float], ...]:
+        return self._points
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        # Colors are BGR, as in OpenCV
+        return self._color
+
+    @property
+    def thickness(self) -> int:
+        return self._thickness
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label
+
+    @property
+    def score(self) -> Optional[float]:
+        # Confidence of the detection the shape represents, if any
+        return self._score
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(points={self._points}, closed={self._closed}, color={self._color}, " \
+               f"thickness={self._thickness}, label={self._label!r}, score={self._score})"
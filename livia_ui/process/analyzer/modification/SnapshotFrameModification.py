@@ -0,0 +1,24 @@
+from typing import Callable
+
+from numpy import ndarray
+
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class SnapshotFrameModification(FrameModification):
+    def __init__(self, wrapped: FrameModification, snapshot_callback: Callable[[int, ndarray], None]):
+        super(SnapshotFrameModification, self).__init__()
+
+        self._wrapped: FrameModification = wrapped
+
+        # Receives the frame number and a copy of the frame before it is modified
+        self._snapshot_callback: Callable[[int, ndarray], None] = snapshot_callback
+
+    @property
+    def wrapped(self) -> FrameModification:
+        return self._wrapped
+
+    def modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        self._snapshot_callback(num_frame, frame.copy())
+
+        return self._wrapped.modify(num_frame, frame)
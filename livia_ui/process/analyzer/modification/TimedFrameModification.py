@@ -0,0 +1,27 @@
+from time import perf_counter
+from typing import Callable
+
+from numpy import ndarray
+
+from livia.process.analyzer.modification.FrameModification import FrameModification
+
+
+class TimedFrameModification(FrameModification):
+    def __init__(self, wrapped: FrameModification, modified_callback: Callable[[int, float], None]):
+        super(TimedFrameModification, self).__init__()
+
+        self._wrapped: FrameModification = wrapped
+
+        # Receives the frame number and the seconds spent modifying it
+        self._modified_callback: Callable[[int, float], None] = modified_callback
+
+    @property
+    def wrapped(self) -> FrameModification:
+        return self._wrapped
+
+    def modify(self, num_frame: int, frame: ndarray) -> ndarray:
+        start = perf_counter()
+        modified = self._wrapped.modify(num_frame, frame)
+        self._modified_callback(num_frame, perf_counter() - start)
+
+        return modified
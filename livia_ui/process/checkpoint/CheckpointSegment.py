@@ -0,0 +1,36 @@
+from typing import Any, Dict
+
+
+class CheckpointSegment:
+    # Part of the output already encoded, with the range of frames it contains
+    def __init__(self, path: str, start_frame: int, end_frame: int):
+        self._path: str = path
+        self._start_frame: int = start_frame
+        self._end_frame: int = end_frame
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "CheckpointSegment":
+        return CheckpointSegment(data["path"], int(data["start_frame"]), int(data["end_frame"]))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def start_frame(self) -> int:
+        return self._start_frame
+
+    @property
+    def end_frame(self) -> int:
+        # Exclusive
+        return self._end_frame
+
+    @property
+    def length_in_frames(self) -> int:
+        return self._end_frame - self._start_frame
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"path": self._path, "start_frame": self._start_frame, "end_frame": self._end_frame}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._start_frame}-{self._end_frame}: {self._path})"
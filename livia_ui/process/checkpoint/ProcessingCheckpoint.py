@@ -0,0 +1,99 @@
+import json
+import os
+from typing import List, Optional, Tuple
+
+from livia_ui.process.checkpoint.CheckpointSegment import CheckpointSegment
+
+_FORMAT_VERSION: int = 1
+
+
+class ProcessingCheckpoint:
+    # Progress of the processing of a video: the segments of the output fully encoded so far and what was needed to
+    # produce them, so the processing can only be resumed with the same input and analysis
+    def __init__(self, input_path: str, output_path: str, fingerprint: str, fps: float, frame_size: Tuple[int, int],
+                 segments: Optional[List[CheckpointSegment]] = None):
+        self._input_path: str = input_path
+        self._output_path: str = output_path
+        self._fingerprint: str = fingerprint
+        self._fps: float = fps
+        self._frame_size: Tuple[int, int] = frame_size
+        self._segments: List[CheckpointSegment] = segments if segments is not None else []
+
+    @staticmethod
+    def load(path: str) -> "ProcessingCheckpoint":
+        with open(path, "r") as file:
+            data = json.load(file)
+
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+
+        return ProcessingCheckpoint(data["input"], data["output"], data["fingerprint"], float(data["fps"]),
+                                    (int(data["frame_size"][0]), int(data["frame_size"][1])),
+                                    [CheckpointSegment.from_dict(segment) for segment in data["segments"]])
+
+    @property
+    def input_path(self) -> str:
+        return self._input_path
+
+    @property
+    def output_path(self) -> str:
+        return self._output_path
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        return self._frame_size
+
+    @property
+    def segments(self) -> List[CheckpointSegment]:
+        return self._segments
+
+    @property
+    def next_frame(self) -> int:
+        return self._segments[-1].end_frame if self._segments else 0
+
+    @property
+    def last_encoded_frame(self) -> Optional[int]:
+        return self.next_frame - 1 if self._segments else None
+
+    def add_segment(self, segment: CheckpointSegment):
+        if segment.start_frame != self.next_frame:
+            raise ValueError(f"Segment {segment} does not continue the checkpoint at frame {self.next_frame}")
+
+        self._segments.append(segment)
+
+    def check_compatible(self, input_path: str, fingerprint: str, fps: float, frame_size: Tuple[int, int]):
+        if os.path.abspath(input_path) != os.path.abspath(self._input_path):
+            raise ValueError(f"The checkpoint belongs to the processing of {self._input_path}")
+        if fingerprint != self._fingerprint:
+            raise ValueError("The checkpoint was written with a different analyzer configuration")
+        if abs(fps - self._fps) > 1e-3 or tuple(frame_size) != tuple(self._frame_size):
+            raise ValueError("The input changed since the checkpoint was written")
+
+    def save(self, path: str):
+        data = {
+            "version": _FORMAT_VERSION,
+            "input": self._input_path,
+            "output": self._output_path,
+            "fingerprint": self._fingerprint,
+            "fps": self._fps,
+            "frame_size": list(self._frame_size),
+            "last_encoded_frame": self.last_encoded_frame,
+            "segments": [segment.to_dict() for segment in self._segments]
+        }
+
+        # Written aside and renamed, so a process killed while saving does not leave a broken checkpoint
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(data, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, path)
@@ -0,0 +1,171 @@
+import os
+import shutil
+from time import perf_counter
+from typing import Optional
+
+from livia import LIVIA_LOGGER
+from livia.input.FileFrameInput import FileFrameInput
+from livia.output.FileFrameOutput import FileFrameOutput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia_ui.process.analyzer import get_context_frames
+from livia_ui.process.checkpoint.CheckpointSegment import CheckpointSegment
+from livia_ui.process.checkpoint.ProcessingCheckpoint import ProcessingCheckpoint
+from livia_ui.process.chunk.ChunkedVideoProcessor import ChunkedVideoProcessor
+
+DEFAULT_CHECKPOINT_INTERVAL: int = 1000
+
+
+class ResumableVideoProcessor:
+    # Processes a video writing the output in segments of a fixed number of frames. After each segment is closed, a
+    # checkpoint records it, so a killed processing can continue from the first frame not encoded instead of starting
+    # over. The segments are joined into the output when the video ends.
+    def __init__(self, input_path: str, output_path: str, analyzer: FrameAnalyzer, fingerprint: str,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL, checkpoint_path: Optional[str] = None):
+        self._input_path: str = input_path
+        self._output_path: str = output_path
+        self._analyzer: FrameAnalyzer = analyzer
+        self._fingerprint: str = fingerprint
+        self._checkpoint_interval: int = max(1, checkpoint_interval)
+        self._checkpoint_path: str = checkpoint_path if checkpoint_path is not None \
+            else output_path + ".checkpoint.json"
+        self._segments_dir: str = output_path + ".segments"
+
+        self._resumed_frame: int = 0
+        self._processed_frames: int = 0
+        self._elapsed_time: float = 0.0
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self._checkpoint_path
+
+    @property
+    def resumed_frame(self) -> int:
+        # First frame processed by the last run, 0 if it did not resume a previous one
+        return self._resumed_frame
+
+    @property
+    def processed_frames(self) -> int:
+        return self._processed_frames
+
+    @property
+    def frames_per_second(self) -> float:
+        return self._processed_frames / self._elapsed_time if self._elapsed_time > 0 else 0.0
+
+    def process(self, resume: bool = False):
+        start = perf_counter()
+
+        frame_input = FileFrameInput(self._input_path, 0)
+        try:
+            fps = frame_input.get_fps()
+            frame_size = frame_input.get_frame_size()
+
+            checkpoint = self._load_checkpoint(fps, frame_size) if resume else None
+            if checkpoint is None:
+                self._discard_checkpoint()
+                checkpoint = ProcessingCheckpoint(self._input_path, self._output_path, self._fingerprint, fps,
+                                                  frame_size)
+
+            os.makedirs(self._segments_dir, exist_ok=True)
+            self._resumed_frame = checkpoint.next_frame
+            self._process_frames(frame_input, checkpoint)
+        finally:
+            frame_input.close()
+            self._elapsed_time = perf_counter() - start
+
+        self._join_segments(checkpoint)
+        self._discard_checkpoint()
+
+    def _load_checkpoint(self, fps: float, frame_size) -> Optional[ProcessingCheckpoint]:
+        if not os.path.exists(self._checkpoint_path):
+            LIVIA_LOGGER.info(f"No checkpoint found at {self._checkpoint_path}. Processing starts from the beginning")
+            return None
+
+        checkpoint = ProcessingCheckpoint.load(self._checkpoint_path)
+        checkpoint.check_compatible(self._input_path, self._fingerprint, fps, frame_size)
+
+        missing = [segment.path for segment in checkpoint.segments if not os.path.exists(segment.path)]
+        if missing:
+            raise FileNotFoundError(f"Segments of the checkpoint not found: {', '.join(missing)}")
+
+        # Segments not in the checkpoint were being written when the processing stopped
+        recorded = {os.path.abspath(segment.path) for segment in checkpoint.segments}
+        if os.path.isdir(self._segments_dir):
+            for name in os.listdir(self._segments_dir):
+                path = os.path.join(self._segments_dir, name)
+                if os.path.abspath(path) not in recorded:
+                    os.remove(path)
+
+        LIVIA_LOGGER.info(f"Resuming from frame {checkpoint.next_frame} ({len(checkpoint.segments)} segments done)")
+
+        return checkpoint
+
+    def _process_frames(self, frame_input: FileFrameInput, checkpoint: ProcessingCheckpoint):
+        # Context frames are analyzed again but not written, so temporal analyzers resume in the same state
+        first_frame = checkpoint.next_frame
+        analysis_start = max(0, first_frame - get_context_frames(self._analyzer))
+        if analysis_start > 0:
+            frame_input.go_to_frame(analysis_start)
+
+        _, extension = os.path.splitext(self._output_path)
+        segment_output: Optional[FileFrameOutput] = None
+        segment_path = ""
+        segment_start = first_frame
+        next_frame = first_frame
+
+        try:
+            while True:
+                frame = frame_input.next_frame()
+                if frame is None:
+                    break
+
+                num_frame = frame_input.get_current_frame_index()
+                if num_frame < analysis_start:
+                    continue
+
+                modification = self._analyzer.analyze(num_frame, frame)
+                if num_frame < first_frame:
+                    continue
+
+                if segment_output is None:
+                    segment_start = num_frame
+                    segment_path = os.path.join(self._segments_dir,
+                                                f"segment-{len(checkpoint.segments):04d}{extension}")
+                    segment_output = FileFrameOutput(segment_path, checkpoint.fps, *checkpoint.frame_size)
+
+                segment_output.output_frame(num_frame, modification.modify(num_frame, frame))
+                next_frame = num_frame + 1
+                self._processed_frames += 1
+
+                if next_frame - segment_start >= self._checkpoint_interval:
+                    segment_output.close()
+                    segment_output = None
+                    self._save_segment(checkpoint, CheckpointSegment(segment_path, segment_start, next_frame))
+        finally:
+            if segment_output is not None:
+                segment_output.close()
+
+        # The last segment is only recorded if the whole video was read, as a failure may have left it incomplete
+        if segment_output is not None:
+            self._save_segment(checkpoint, CheckpointSegment(segment_path, segment_start, next_frame))
+
+    def _save_segment(self, checkpoint: ProcessingCheckpoint, segment: CheckpointSegment):
+        checkpoint.add_segment(segment)
+        checkpoint.save(self._checkpoint_path)
+
+        LIVIA_LOGGER.debug(f"Checkpoint saved: frames up to {checkpoint.last_encoded_frame} encoded")
+
+    def _join_segments(self, checkpoint: ProcessingCheckpoint):
+        paths = [segment.path for segment in checkpoint.segments]
+
+        if not paths:
+            raise RuntimeError(f"No frame could be read from {self._input_path}")
+        elif len(paths) == 1:
+            shutil.copyfile(paths[0], self._output_path)
+        else:
+            ChunkedVideoProcessor.concatenate(paths, self._output_path, checkpoint.fps, checkpoint.frame_size)
+
+    def _discard_checkpoint(self):
+        if os.path.exists(self._checkpoint_path):
+            os.remove(self._checkpoint_path)
+
+        shutil.rmtree(self._segments_dir, ignore_errors=True)
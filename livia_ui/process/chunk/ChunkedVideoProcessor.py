@@ -0,0 +1,245 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from livia import LIVIA_LOGGER
+from livia.input.FileFrameInput import FileFrameInput
+from livia.output.FileFrameOutput import FileFrameOutput
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia_ui.process.analyzer import get_context_frames
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+from livia_ui.process.chunk.VideoChunk import VideoChunk
+from livia_ui.process.chunk.VideoChunkResult import VideoChunkResult
+
+
+def _process_chunk(chunk: VideoChunk, input_path: str, spec: Optional[FrameAnalyzerSpec], fps: float,
+                   frame_size: Tuple[int, int]) -> VideoChunkResult:
+    start = perf_counter()
+    analyzer = spec.build() if spec is not None else NoChangeFrameAnalyzer()
+
+    # Context frames are analyzed but not written, so the analyzer reaches the chunk as if it had seen the whole video
+    analysis_start = max(0, chunk.start_frame - get_context_frames(analyzer))
+    if chunk.seek_points is None:
+        seek_frame = analysis_start
+    else:
+        seek_index = bisect_right(chunk.seek_points, analysis_start) - 1
+        seek_frame = chunk.seek_points[seek_index] if seek_index >= 0 else 0
+
+    frame_input = FileFrameInput(input_path, 0)
+    frame_output = FileFrameOutput(chunk.segment_path, fps, *frame_size)
+    frames_written = 0
+    frames_analyzed = 0
+
+    try:
+        if seek_frame > 0:
+            frame_input.go_to_frame(seek_frame)
+
+        while True:
+            frame = frame_input.next_frame()
+            if frame is None:
+                break
+
+            num_frame = frame_input.get_current_frame_index()
+            if chunk.end_frame is not None and num_frame >= chunk.end_frame:
+                break
+            if num_frame < analysis_start:
+                continue
+
+            modification = analyzer.analyze(num_frame, frame)
+            frames_analyzed += 1
+
+            if num_frame >= chunk.start_frame:
+                frame_output.output_frame(num_frame, modification.modify(num_frame, frame))
+                frames_written += 1
+    finally:
+        frame_input.close()
+        frame_output.close()
+
+    return VideoChunkResult(chunk.index, frames_written, frames_analyzed, perf_counter() - start)
+
+
+class ChunkedVideoProcessor:
+    # Processes a video file splitting it in ranges of frames processed by different processes, each one with its own
+    # input, output and analyzers. Ranges start at keyframes, so seeking is exact and cheap, and the segments written
+    # are joined in order into the final output.
+    def __init__(self, input_path: str, output_path: str, analyzer_spec: Optional[FrameAnalyzerSpec], jobs: int):
+        self._input_path: str = input_path
+        self._output_path: str = output_path
+        self._analyzer_spec: Optional[FrameAnalyzerSpec] = analyzer_spec
+        self._jobs: int = max(1, jobs)
+
+        self._chunks: List[VideoChunk] = []
+        self._processed_frames: int = 0
+        self._elapsed_time: float = 0.0
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs
+
+    @property
+    def chunks(self) -> List[VideoChunk]:
+        return self._chunks
+
+    @property
+    def processed_frames(self) -> int:
+        return self._processed_frames
+
+    @property
+    def frames_per_second(self) -> float:
+        return self._processed_frames / self._elapsed_time if self._elapsed_time > 0 else 0.0
+
+    def process(self):
+        start = perf_counter()
+
+        frame_input = FileFrameInput(self._input_path, 0)
+        try:
+            length = frame_input.get_length_in_frames()
+            fps = frame_input.get_fps()
+            frame_size = frame_input.get_frame_size()
+        finally:
+            frame_input.close()
+
+        keyframes = ChunkedVideoProcessor.find_keyframes(self._input_path, fps)
+        if keyframes is None:
+            LIVIA_LOGGER.warning("Keyframes of the video could not be found (ffprobe is required). Chunks will start "
+                                 "at any frame, which makes seeking slower")
+            boundaries = sorted({length * part // self._jobs for part in range(self._jobs)})
+        else:
+            boundaries = ChunkedVideoProcessor.split(keyframes, length, self._jobs)
+
+        _, extension = os.path.splitext(self._output_path)
+        temp_dir = tempfile.mkdtemp(prefix="livia-chunks-", dir=os.path.dirname(os.path.abspath(self._output_path)))
+
+        try:
+            self._chunks = [
+                VideoChunk(index, chunk_start, chunk_end,
+                           [point for point in keyframes if point <= chunk_start] if keyframes is not None else None,
+                           os.path.join(temp_dir, f"segment-{index:04d}{extension}"))
+                for index, (chunk_start, chunk_end) in enumerate(zip(boundaries, boundaries[1:] + [None]))
+            ]
+
+            results = self._process_chunks(fps, frame_size)
+            self._check_results(results, length)
+
+            ChunkedVideoProcessor.concatenate([chunk.segment_path for chunk in self._chunks], self._output_path,
+                                              fps, frame_size)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            self._elapsed_time = perf_counter() - start
+
+    def _process_chunks(self, fps: float, frame_size: Tuple[int, int]) -> List[VideoChunkResult]:
+        # Spawned workers do not inherit the threads (and locks) of this process
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=min(self._jobs, len(self._chunks)), mp_context=context) as executor:
+            futures = [
+                executor.submit(_process_chunk, chunk, self._input_path, self._analyzer_spec, fps, frame_size)
+                for chunk in self._chunks
+            ]
+
+            for future in as_completed(futures):
+                result = future.result()
+                LIVIA_LOGGER.info(f"Chunk {self._chunks[result.index]} processed: {result.frames_written} frames "
+                                  f"written ({result.frames_analyzed} analyzed) in {result.elapsed_time:.2f} s")
+
+            return sorted((future.result() for future in futures), key=lambda result: result.index)
+
+    def _check_results(self, results: List[VideoChunkResult], length: int):
+        for chunk, result in zip(self._chunks, results):
+            expected = chunk.length_in_frames
+            if expected is not None and result.frames_written != expected:
+                raise RuntimeError(f"Chunk {chunk} wrote {result.frames_written} frames instead of {expected}")
+
+        self._processed_frames = sum(result.frames_written for result in results)
+
+        # The length of a video is an estimation in some containers, so only the last chunk can differ from it
+        if self._processed_frames != length:
+            LIVIA_LOGGER.warning(f"{self._processed_frames} frames were processed, but the video reports {length}")
+
+    @staticmethod
+    def split(seek_points: List[int], length: int, parts: int) -> List[int]:
+        # First frames of the chunks: the seek points closest to splitting the video in equal parts
+        boundaries = [0]
+
+        for part in range(1, parts):
+            target = length * part / parts
+            candidates = [point for point in seek_points if boundaries[-1] < point < length]
+            if not candidates:
+                break
+
+            boundary = min(candidates, key=lambda point: abs(point - target))
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+        return boundaries
+
+    @staticmethod
+    def find_keyframes(path: str, fps: float) -> Optional[List[int]]:
+        ffprobe = shutil.which("ffprobe")
+        if ffprobe is None or fps <= 0:
+            return None
+
+        try:
+            result = subprocess.run([ffprobe, "-v", "error", "-select_streams", "v:0", "-skip_frame", "nokey",
+                                     "-show_entries", "frame=best_effort_timestamp_time", "-of", "csv=p=0", path],
+                                    capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            LIVIA_LOGGER.exception("Keyframes of the video could not be read")
+            return None
+
+        times = []
+        for line in result.stdout.splitlines():
+            value = line.strip().rstrip(",")
+            try:
+                times.append(float(value))
+            except ValueError:
+                continue
+
+        if not times:
+            return None
+
+        first = min(times)
+        return sorted({round((time - first) * fps) for time in times})
+
+    @staticmethod
+    def concatenate(segment_paths: List[str], output_path: str, fps: float, frame_size: Tuple[int, int]):
+        ffmpeg = shutil.which("ffmpeg")
+
+        if ffmpeg is not None:
+            # Segments are joined without encoding them again, as they all start with a keyframe
+            list_path = os.path.join(os.path.dirname(segment_paths[0]), "segments.txt")
+            with open(list_path, "w") as list_file:
+                for segment_path in segment_paths:
+                    escaped = segment_path.replace("'", "'\\''")
+                    list_file.write(f"file '{escaped}'\n")
+
+            try:
+                subprocess.run([ffmpeg, "-v", "error", "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+                                "-c", "copy", output_path], check=True)
+                return
+            except (OSError, subprocess.CalledProcessError):
+                LIVIA_LOGGER.exception("Segments could not be joined with ffmpeg. They will be encoded again")
+        else:
+            LIVIA_LOGGER.warning("ffmpeg is not available. Segments will be encoded again to join them")
+
+        frame_output = FileFrameOutput(output_path, fps, *frame_size)
+        num_frame = 0
+        try:
+            for segment_path in segment_paths:
+                segment = FileFrameInput(segment_path, 0)
+                try:
+                    frame = segment.next_frame()
+                    while frame is not None:
+                        frame_output.output_frame(num_frame, frame)
+                        num_frame += 1
+                        frame = segment.next_frame()
+                finally:
+                    segment.close()
+        finally:
+            frame_output.close()
@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+
+class VideoChunk:
+    # Range of frames of a video processed independently. Seek points are the frames where decoding can start (e.g.
+    # keyframes), so the context frames of the analyzers can be read before the range. Without them, decoding can
+    # start at any frame.
+    def __init__(self, index: int, start_frame: int, end_frame: Optional[int], seek_points: Optional[List[int]],
+                 segment_path: str):
+        self._index: int = index
+        self._start_frame: int = start_frame
+        self._end_frame: Optional[int] = end_frame
+        self._seek_points: Optional[List[int]] = seek_points
+        self._segment_path: str = segment_path
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def start_frame(self) -> int:
+        return self._start_frame
+
+    @property
+    def end_frame(self) -> Optional[int]:
+        # Exclusive, or None if the chunk ends with the video
+        return self._end_frame
+
+    @property
+    def seek_points(self) -> Optional[List[int]]:
+        return self._seek_points
+
+    @property
+    def segment_path(self) -> str:
+        return self._segment_path
+
+    @property
+    def length_in_frames(self) -> Optional[int]:
+        return self._end_frame - self._start_frame if self._end_frame is not None else None
+
+    def __repr__(self) -> str:
+        end = self._end_frame if self._end_frame is not None else "end"
+        return f"{self.__class__.__name__}({self._index}: {self._start_frame}-{end})"
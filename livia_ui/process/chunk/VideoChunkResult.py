@@ -0,0 +1,23 @@
+class VideoChunkResult:
+    def __init__(self, index: int, frames_written: int, frames_analyzed: int, elapsed_time: float):
+        self._index: int = index
+        self._frames_written: int = frames_written
+        self._frames_analyzed: int = frames_analyzed
+        self._elapsed_time: float = elapsed_time
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def frames_written(self) -> int:
+        return self._frames_written
+
+    @property
+    def frames_analyzed(self) -> int:
+        # Written frames plus the context frames analyzed before the chunk
+        return self._frames_analyzed
+
+    @property
+    def elapsed_time(self) -> float:
+        return self._elapsed_time
@@ -0,0 +1,88 @@
+import gzip
+import json
+from typing import Any, Dict, IO, List, Optional
+
+from livia import LIVIA_LOGGER
+from livia.process.analyzer.modification.FrameModification import FrameModification
+from livia_ui.process.analyzer.modification.HasOverlayShapes import HasOverlayShapes
+from livia_ui.process.analyzer.modification.OverlayFrameModification import OverlayFrameModification
+from livia_ui.process.analyzer.modification.OverlayShape import OverlayShape
+from livia_ui.process.analyzer.modification.TimedFrameModification import TimedFrameModification
+
+
+class DetectionsWriter:
+    # Writes the results of the analysis as JSON Lines, one line per frame with its index, its timestamp (in seconds)
+    # and the shapes found, without modifying the frames. Files ending with .gz are compressed. Modifications that do
+    # not provide shapes are written with null shapes and the name of their type.
+    def __init__(self, path: str, fps: float):
+        self._path: str = path
+        self._fps: float = fps
+        self._file: IO[str] = gzip.open(path, "wt", encoding="UTF-8") if path.lower().endswith(".gz") \
+            else open(path, "w", encoding="UTF-8")
+
+        self._frames: int = 0
+        self._shapes: int = 0
+        self._unsupported_warned: bool = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def shapes(self) -> int:
+        return self._shapes
+
+    def write(self, num_frame: int, modification: FrameModification):
+        record: Dict[str, Any] = {
+            "frame": num_frame,
+            "timestamp": round(num_frame / self._fps, 6) if self._fps > 0 else None
+        }
+
+        shapes = DetectionsWriter.get_shapes(modification)
+        if shapes is None:
+            if not self._unsupported_warned:
+                LIVIA_LOGGER.warning(f"{type(modification).__name__} modifications do not provide shapes")
+                self._unsupported_warned = True
+
+            record["shapes"] = None
+            record["modification"] = type(modification).__name__
+        else:
+            record["shapes"] = [DetectionsWriter._shape_to_dict(shape) for shape in shapes]
+            self._shapes += len(shapes)
+
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+        self._frames += 1
+
+    def close(self):
+        self._file.close()
+
+    @staticmethod
+    def get_shapes(modification: FrameModification) -> Optional[List[OverlayShape]]:
+        while isinstance(modification, TimedFrameModification):
+            modification = modification.wrapped
+
+        if isinstance(modification, HasOverlayShapes):
+            return modification.get_overlay_shapes()
+        elif isinstance(modification, OverlayFrameModification):
+            return modification.shapes
+        else:
+            return None
+
+    @staticmethod
+    def _shape_to_dict(shape: OverlayShape) -> Dict[str, Any]:
+        # Only what describes the detection is written. Display properties (color and thickness) are left out
+        data: Dict[str, Any] = {"points": [[x, y] for x, y in shape.points]}
+
+        if not shape.closed:
+            data["closed"] = False
+        if shape.label is not None:
+            data["label"] = shape.label
+        if shape.score is not None:
+            data["score"] = shape.score
+
+        return data
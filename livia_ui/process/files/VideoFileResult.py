@@ -0,0 +1,38 @@
+from typing import Optional
+
+from livia_ui.process.files.VideoFileStatus import VideoFileStatus
+from livia_ui.process.files.VideoFileTask import VideoFileTask
+
+
+class VideoFileResult:
+    def __init__(self, task: VideoFileTask, status: VideoFileStatus, frames: int = 0, elapsed_time: float = 0.0,
+                 error: Optional[str] = None):
+        self._task: VideoFileTask = task
+        self._status: VideoFileStatus = status
+        self._frames: int = frames
+        self._elapsed_time: float = elapsed_time
+        self._error: Optional[str] = error
+
+    @property
+    def task(self) -> VideoFileTask:
+        return self._task
+
+    @property
+    def status(self) -> VideoFileStatus:
+        return self._status
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def elapsed_time(self) -> float:
+        return self._elapsed_time
+
+    @property
+    def frames_per_second(self) -> float:
+        return self._frames / self._elapsed_time if self._elapsed_time > 0 else 0.0
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._error
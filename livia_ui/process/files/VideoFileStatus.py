@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class VideoFileStatus(Enum):
+    PROCESSED = "processed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
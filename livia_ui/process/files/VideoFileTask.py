@@ -0,0 +1,20 @@
+class VideoFileTask:
+    def __init__(self, index: int, input_path: str, output_path: str):
+        self._index: int = index
+        self._input_path: str = input_path
+        self._output_path: str = output_path
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def input_path(self) -> str:
+        return self._input_path
+
+    @property
+    def output_path(self) -> str:
+        return self._output_path
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._input_path} -> {self._output_path})"
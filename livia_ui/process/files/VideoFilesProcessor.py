@@ -0,0 +1,236 @@
+import csv
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Callable, List, Optional
+
+from livia import LIVIA_LOGGER
+from livia.input.FileFrameInput import FileFrameInput
+from livia.output.FileFrameOutput import FileFrameOutput
+from livia.process.analyzer.FrameAnalyzer import FrameAnalyzer
+from livia.process.analyzer.NoChangeFrameAnalyzer import NoChangeFrameAnalyzer
+from livia_ui.process.analyzer import close_frame_analyzer, build_process_frame_analyzer
+from livia_ui.process.analyzer.FrameAnalyzerSpec import FrameAnalyzerSpec
+from livia_ui.process.analyzer.PipelinedFrameProcessor import PipelinedFrameProcessor
+from livia_ui.process.files.VideoFileResult import VideoFileResult
+from livia_ui.process.files.VideoFileStatus import VideoFileStatus
+from livia_ui.process.files.VideoFileTask import VideoFileTask
+
+DEFAULT_OUTPUT_TEMPLATE: str = "{stem}{ext}"
+
+VIDEO_EXTENSIONS: List[str] = [".avi", ".m4v", ".mkv", ".mov", ".mp4", ".mpeg", ".mpg", ".webm", ".wmv"]
+
+_PARTIAL_SUFFIX: str = ".partial"
+
+# Analyzer of the worker process, built once and used for all the files it processes
+_worker_analyzer: Optional[FrameAnalyzer] = None
+
+
+def _init_worker(spec: Optional[FrameAnalyzerSpec], analyzer_workers: Optional[int]):
+    global _worker_analyzer
+    _worker_analyzer = build_spec_analyzer(spec, analyzer_workers)
+
+
+def build_spec_analyzer(spec: Optional[FrameAnalyzerSpec], analyzer_workers: Optional[int] = None) -> FrameAnalyzer:
+    # With analyzer workers, the analyzers run in processes of their own (the process backend), as they would with a
+    # single file worker
+    if spec is None:
+        return NoChangeFrameAnalyzer()
+    elif analyzer_workers is not None:
+        return build_process_frame_analyzer(spec, analyzer_workers)
+    else:
+        return spec.build()
+
+
+def _process_in_worker(task: VideoFileTask) -> VideoFileResult:
+    return process_video_file(task, _worker_analyzer)
+
+
+def process_video_file(task: VideoFileTask, analyzer: FrameAnalyzer) -> VideoFileResult:
+    # Frames are written to a partial file, which only gets the output name once the whole video is processed. So
+    # an existing output is always a complete one, even if a previous run was killed.
+    stem, extension = os.path.splitext(task.output_path)
+    partial_path = stem + _PARTIAL_SUFFIX + extension
+    start = perf_counter()
+
+    try:
+        frame_input = FileFrameInput(task.input_path, 0)
+        try:
+            frame_output = FileFrameOutput(partial_path, frame_input.get_fps(), *frame_input.get_frame_size())
+        except Exception:
+            frame_input.close()
+            raise
+
+        processor = PipelinedFrameProcessor(frame_input, frame_output, analyzer)
+        try:
+            processor.process()
+        finally:
+            processor.close()
+
+        os.replace(partial_path, task.output_path)
+
+        return VideoFileResult(task, VideoFileStatus.PROCESSED, processor.processed_frames, perf_counter() - start)
+    except Exception as error:
+        LIVIA_LOGGER.exception(f"Error processing {task.input_path}")
+
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+        return VideoFileResult(task, VideoFileStatus.FAILED, 0, perf_counter() - start, str(error))
+
+
+class VideoFilesProcessor:
+    # Processes several video files with a pool of worker processes. Each worker builds the analyzers once and keeps
+    # them for all the files it processes, so models are not loaded again for every file. With a single worker, the
+    # files are processed in this process with the given analyzer.
+    def __init__(self, tasks: List[VideoFileTask], analyzer_spec: Optional[FrameAnalyzerSpec], workers: int = 1,
+                 overwrite: bool = False, frame_analyzer_factory: Optional[Callable[[], FrameAnalyzer]] = None,
+                 analyzer_workers: Optional[int] = None):
+        self._tasks: List[VideoFileTask] = tasks
+        self._analyzer_spec: Optional[FrameAnalyzerSpec] = analyzer_spec
+        self._analyzer_workers: Optional[int] = analyzer_workers
+        self._workers: int = max(1, workers)
+        self._overwrite: bool = overwrite
+        self._frame_analyzer_factory: Optional[Callable[[], FrameAnalyzer]] = frame_analyzer_factory
+
+        self._results: List[VideoFileResult] = []
+
+    @property
+    def tasks(self) -> List[VideoFileTask]:
+        return self._tasks
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def results(self) -> List[VideoFileResult]:
+        return self._results
+
+    @staticmethod
+    def list_directory(path: str) -> List[str]:
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if os.path.isfile(os.path.join(path, name)) and os.path.splitext(name)[1].lower() in VIDEO_EXTENSIONS
+        )
+
+    @staticmethod
+    def read_manifest(path: str) -> List[str]:
+        # One input per line. Empty lines and lines starting with # are ignored, and relative paths are relative to the
+        # manifest
+        base_dir = os.path.dirname(os.path.abspath(path))
+
+        with open(path, "r", encoding="UTF-8") as manifest:
+            lines = [line.strip() for line in manifest]
+
+        return [os.path.join(base_dir, line) for line in lines if line and not line.startswith("#")]
+
+    @staticmethod
+    def build_tasks(input_paths: List[str], output_dir: str,
+                    output_template: str = DEFAULT_OUTPUT_TEMPLATE) -> List[VideoFileTask]:
+        # Template fields: {stem} and {ext} of the input name, {name} with both, {parent} directory name and {index}
+        tasks = []
+        outputs = set()
+
+        for index, input_path in enumerate(input_paths):
+            name = os.path.basename(input_path)
+            stem, extension = os.path.splitext(name)
+            parent = os.path.basename(os.path.dirname(os.path.abspath(input_path)))
+
+            output_path = os.path.join(output_dir, output_template.format(stem=stem, ext=extension, name=name,
+                                                                          parent=parent, index=index))
+            if output_path in outputs:
+                raise ValueError(f"Several inputs would be written to {output_path}. Use a different output template")
+
+            outputs.add(output_path)
+            tasks.append(VideoFileTask(index, input_path, output_path))
+
+        return tasks
+
+    def process(self) -> List[VideoFileResult]:
+        results: List[Optional[VideoFileResult]] = [None] * len(self._tasks)
+        pending = []
+
+        for task in self._tasks:
+            if not self._overwrite and os.path.exists(task.output_path):
+                results[task.index] = VideoFileResult(task, VideoFileStatus.SKIPPED)
+                LIVIA_LOGGER.info(f"Skipping {task.input_path}: {task.output_path} already exists")
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(task.output_path)), exist_ok=True)
+                pending.append(task)
+
+        if pending:
+            if self._workers == 1:
+                self._process_here(pending, results)
+            else:
+                self._process_in_workers(pending, results)
+
+        self._results = results
+
+        return results
+
+    def _process_here(self, tasks: List[VideoFileTask], results: List[Optional[VideoFileResult]]):
+        if self._frame_analyzer_factory is not None:
+            analyzer = self._frame_analyzer_factory()
+        else:
+            analyzer = build_spec_analyzer(self._analyzer_spec, self._analyzer_workers)
+
+        try:
+            for task in tasks:
+                results[task.index] = VideoFilesProcessor._log_result(process_video_file(task, analyzer))
+        finally:
+            close_frame_analyzer(analyzer)
+
+    def _process_in_workers(self, tasks: List[VideoFileTask], results: List[Optional[VideoFileResult]]):
+        # Spawned workers do not inherit the threads (and locks) of this process
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(tasks)), mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(self._analyzer_spec, self._analyzer_workers)) as executor:
+            futures = {executor.submit(_process_in_worker, task): task for task in tasks}
+
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as error:
+                    # The worker died (e.g. the analyzers could not be built or it ran out of memory)
+                    LIVIA_LOGGER.error(f"Error processing {task.input_path}: {error}")
+                    result = VideoFileResult(task, VideoFileStatus.FAILED, error=str(error))
+
+                results[task.index] = VideoFilesProcessor._log_result(result)
+
+    @staticmethod
+    def _log_result(result: VideoFileResult) -> VideoFileResult:
+        if result.status == VideoFileStatus.PROCESSED:
+            LIVIA_LOGGER.info(f"Processed {result.task.input_path}: {result.frames} frames in "
+                              f"{result.elapsed_time:.2f} s ({result.frames_per_second:.2f} fps)")
+
+        return result
+
+    @staticmethod
+    def write_summary(results: List[VideoFileResult], path: str):
+        rows = [
+            {
+                "input": result.task.input_path,
+                "output": result.task.output_path,
+                "status": result.status.value,
+                "frames": result.frames,
+                "seconds": round(result.elapsed_time, 3),
+                "fps": round(result.frames_per_second, 2),
+                "error": result.error or ""
+            }
+            for result in results
+        ]
+
+        with open(path, "w", newline="", encoding="UTF-8") as summary:
+            if path.lower().endswith(".json"):
+                json.dump(rows, summary, indent=2)
+            else:
+                writer = csv.DictWriter(summary, fieldnames=["input", "output", "status", "frames", "seconds", "fps",
+                                                             "error"])
+                writer.writeheader()
+                writer.writerows(rows)
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Optional, Tuple
+
+from numpy import ndarray
+
+from livia.input.FrameInput import FrameInput
+
+
+class StampedFrameInput(FrameInput):
+    # Notifies each frame read from the wrapped input, so its capture time is known before it waits for the
+    # processor threads. Methods of the wrapped input type (e.g. device ones) are delegated.
+    def __init__(self, wrapped: FrameInput, captured_callback: Callable[[int], None]):
+        super(StampedFrameInput, self).__init__()
+
+        self._wrapped: FrameInput = wrapped
+
+        # Receives the number of each frame read
+        self._captured_callback: Callable[[int], None] = captured_callback
+
+    @property
+    def wrapped(self) -> FrameInput:
+        return self._wrapped
+
+    def next_frame(self) -> Optional[ndarray]:
+        frame = self._wrapped.next_frame()
+
+        if frame is not None:
+            self._captured_callback(self._wrapped.get_current_frame_index())
+
+        return frame
+
+    def get_current_frame_index(self) -> int:
+        return self._wrapped.get_current_frame_index()
+
+    def get_current_msec(self) -> int:
+        return self._wrapped.get_current_msec()
+
+    def get_fps(self) -> float:
+        return self._wrapped.get_fps()
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        return self._wrapped.get_frame_size()
+
+    def close(self):
+        self._wrapped.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found in this class
+        if name == "_wrapped":
+            raise AttributeError(name)
+
+        return getattr(self._wrapped, name)
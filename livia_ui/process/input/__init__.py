@@ -0,0 +1,9 @@
+from livia.input.FrameInput import FrameInput
+from livia_ui.process.input.StampedFrameInput import StampedFrameInput
+
+
+def unwrap_frame_input(frame_input: FrameInput) -> FrameInput:
+    while isinstance(frame_input, StampedFrameInput):
+        frame_input = frame_input.wrapped
+
+    return frame_input